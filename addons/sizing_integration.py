@@ -386,7 +386,7 @@ class SizingIntegrationGenerator:
                 return int(val.rstrip("GiTiBMK") or default)
             return default
         
-        readme = f"""# Elasticsearch Cluster Sizing
+        parts = [f"""# Elasticsearch Cluster Sizing
 
 ## Profile: Custom (from Sizing Report)
 
@@ -407,34 +407,34 @@ This configuration is optimized for **{platform_name}** deployment.
 
 ## Tier Architecture
 
-"""
+"""]
         # Hot tier
         hot = ctx.get("data_nodes", {})
         if hot and hot.get("count", 0) > 0:
             mem = hot.get("memory", "32Gi")
             storage = hot.get("storage", "1000Gi")
-            readme += f"""### Hot Tier (Primary Indexing)
+            parts.append(f"""### Hot Tier (Primary Indexing)
 - **Nodes**: {hot.get('count', 3)}
 - **Memory**: {mem} per node
 - **CPU**: {hot.get('cpu', '8')} cores per node
 - **Storage**: {storage} per node ({hot.get('storage_class', 'premium')})
 - **Role**: Active indexing, recent data queries
 
-"""
+""")
         
         # Cold tier
         cold = ctx.get("cold_nodes", {})
         if cold and cold.get("count", 0) > 0:
             mem = cold.get("memory", "16Gi")
             storage = cold.get("storage", "2000Gi")
-            readme += f"""### Cold Tier (Long-term Storage)
+            parts.append(f"""### Cold Tier (Long-term Storage)
 - **Nodes**: {cold.get('count', 3)}
 - **Memory**: {mem} per node
 - **CPU**: {cold.get('cpu', '4')} cores per node
 - **Storage**: {storage} per node ({cold.get('storage_class', 'standard')})
 - **Role**: Historical data, infrequent queries
 
-"""
+""")
         
         # Frozen tier
         frozen = ctx.get("frozen_nodes", {})
@@ -442,7 +442,7 @@ This configuration is optimized for **{platform_name}** deployment.
             mem = frozen.get("memory", "32Gi")
             cache = frozen.get("cache_storage", "2400Gi")
             snapshot = frozen.get("snapshot_storage_gb", 0)
-            readme += f"""### Frozen Tier (Searchable Snapshots)
+            parts.append(f"""### Frozen Tier (Searchable Snapshots)
 - **Nodes**: {frozen.get('count', 1)}
 - **Memory**: {mem} per node
 - **CPU**: {frozen.get('cpu', '8')} cores per node
@@ -450,34 +450,34 @@ This configuration is optimized for **{platform_name}** deployment.
 - **Snapshot Repository**: {snapshot:,.0f} GB (remote object storage)
 - **Role**: Archive data, on-demand queries via snapshots
 
-"""
+""")
         
         # Stack components
-        readme += """## Stack Components
+        parts.append("""## Stack Components
 
-"""
+""")
         # Kibana
         kibana = ctx.get("kibana", {})
         if kibana and kibana.get("count", 0) > 0:
-            readme += f"""### Kibana
+            parts.append(f"""### Kibana
 - **Instances**: {kibana.get('count', 1)}
 - **Memory**: {kibana.get('memory', '4Gi')} per instance
 - **CPU**: {kibana.get('cpu', '2')} cores per instance
 
-"""
+""")
         
         # Fleet Server
         fleet = ctx.get("fleet_server", {})
         if fleet and fleet.get("count", 0) > 0:
-            readme += f"""### Fleet Server
+            parts.append(f"""### Fleet Server
 - **Instances**: {fleet.get('count', 1)}
 - **Memory**: {fleet.get('memory', '4Gi')} per instance
 - **CPU**: {fleet.get('cpu', '2')} cores per instance
 
-"""
+""")
         
         # Summary totals
-        readme += f"""## Resource Totals
+        parts.append(f"""## Resource Totals
 
 | Resource | Total |
 |----------|-------|
@@ -485,13 +485,13 @@ This configuration is optimized for **{platform_name}** deployment.
 | vCPU | {summary.get('total_vcpu', 'N/A')} cores |
 | RAM | {summary.get('total_ram_gb', 'N/A')} GB |
 | Local Disk | {summary.get('total_disk_gb', 'N/A')} GB |
-"""
+""")
         
         # Add snapshot storage if frozen tier exists
         if frozen and frozen.get("snapshot_storage_gb", 0) > 0:
-            readme += f"| Snapshot Storage | {frozen.get('snapshot_storage_gb', 0):,.0f} GB |\n"
+            parts.append(f"| Snapshot Storage | {frozen.get('snapshot_storage_gb', 0):,.0f} GB |\n")
         
-        readme += f"""
+        parts.append(f"""
 ## Re-sizing with AI Assistant
 
 For adjustments or re-sizing, use the recommended skill:
@@ -525,8 +525,8 @@ load skill {recommended_skill}
 
 *Generated by project-initializer sizing integration addon*
 *Source: Sizing Report (Health Score: {ctx.get('health_score', 'N/A')}/100)*
-"""
-        return readme
+""")
+        return "".join(parts)
     
     def _generate_profile_based_readme(self) -> str:
         """Generate README from profile-based sizing (fallback when no sizing report)."""
@@ -734,7 +734,7 @@ load skill elasticsearch-openshift-sizing-assistant-legacy
         platform_key = self.platform.lower() if self.platform else "kubernetes"
         platform_info = PLATFORM_SKILL_MAP.get(platform_key, PLATFORM_SKILL_MAP["kubernetes"])
         
-        yaml_content = f"""# Elasticsearch Cluster Resource Requirements
+        parts = [f"""# Elasticsearch Cluster Resource Requirements
 # Source: Sizing Report (Custom)
 # Platform: {platform_info['platform_name']}
 # Health Score: {self.sizing_context.get('health_score', 0)}/100
@@ -768,49 +768,49 @@ data:
 #   CPU: {hot.get('cpu', 'N/A')} cores per node
 #   Storage: {hot.get('storage', 'N/A')} per node
 #
-"""
+"""]
         if cold and cold.get("count", 0) > 0:
-            yaml_content += f"""# COLD TIER (long-term storage):
+            parts.append(f"""# COLD TIER (long-term storage):
 #   Nodes: {cold.get('count', 0)}
 #   Memory: {cold.get('memory', 'N/A')} per node
 #   CPU: {cold.get('cpu', 'N/A')} cores per node
 #   Storage: {cold.get('storage', 'N/A')} per node
 #
-"""
+""")
         if frozen and frozen.get("count", 0) > 0:
-            yaml_content += f"""# FROZEN TIER (searchable snapshots):
+            parts.append(f"""# FROZEN TIER (searchable snapshots):
 #   Nodes: {frozen.get('count', 0)}
 #   Memory: {frozen.get('memory', 'N/A')} per node
 #   CPU: {frozen.get('cpu', 'N/A')} cores per node
 #   Cache Storage: {frozen.get('cache_storage', 'N/A')} per node
 #   Snapshot Repository: {frozen.get('snapshot_storage_gb', 0)} GB (remote storage)
 #
-"""
+""")
         if kibana and kibana.get("count", 0) > 0:
-            yaml_content += f"""# KIBANA:
+            parts.append(f"""# KIBANA:
 #   Instances: {kibana.get('count', 1)}
 #   Memory: {kibana.get('memory', 'N/A')} per instance
 #   CPU: {kibana.get('cpu', 'N/A')} cores per instance
 #
-"""
+""")
         if fleet and fleet.get("count", 0) > 0:
-            yaml_content += f"""# FLEET SERVER:
+            parts.append(f"""# FLEET SERVER:
 #   Instances: {fleet.get('count', 1)}
 #   Memory: {fleet.get('memory', 'N/A')} per instance
 #   CPU: {fleet.get('cpu', 'N/A')} cores per instance
 #
-"""
-        yaml_content += """# ============================================================
+""")
+        parts.append("""# ============================================================
 # Use these values to request cluster resources from infrastructure team
 # ============================================================
-"""
-        return yaml_content
+""")
+        return "".join(parts)
     
     def _generate_profile_based_requirements(self) -> str:
         """Generate resource requirements from profile-based sizing (fallback)."""
         profile = self.profile
         
-        yaml_content = f"""# Elasticsearch Cluster Resource Requirements
+        parts = [f"""# Elasticsearch Cluster Resource Requirements
 # Profile: {self.profile_name}
 # Platform: {self.platform}
 
@@ -834,30 +834,30 @@ data:
 #   Total Memory: {int(profile['master_nodes']['memory'].rstrip('Gi')) * profile['master_nodes']['count']}Gi
 #   Total CPU: {int(profile['master_nodes']['cpu']) * profile['master_nodes']['count']} cores
 #
-"""
+"""]
         
         if profile['ingest_nodes']['count'] > 0:
-            yaml_content += f"""# Ingest Nodes:
+            parts.append(f"""# Ingest Nodes:
 #   Total Memory: {int(profile['ingest_nodes']['memory'].rstrip('Gi')) * profile['ingest_nodes']['count']}Gi
 #   Total CPU: {int(profile['ingest_nodes']['cpu']) * profile['ingest_nodes']['count']} cores
 #
-"""
+""")
         
         if profile['coordinating_nodes']['count'] > 0:
-            yaml_content += f"""# Coordinating Nodes:
+            parts.append(f"""# Coordinating Nodes:
 #   Total Memory: {int(profile['coordinating_nodes']['memory'].rstrip('Gi')) * profile['coordinating_nodes']['count']}Gi
 #   Total CPU: {int(profile['coordinating_nodes']['cpu']) * profile['coordinating_nodes']['count']} cores
 #
-"""
+""")
         
-        yaml_content += f"""# Kibana:
+        parts.append(f"""# Kibana:
 #   Total Memory: {int(profile['kibana']['memory'].rstrip('Gi')) * profile['kibana']['count']}Gi
 #   Total CPU: {float(profile['kibana']['cpu']) * profile['kibana']['count']} cores
 
 # Use these values to request cluster resources from infrastructure team
-"""
+""")
         
-        return yaml_content
+        return "".join(parts)
     
     def _generate_skill_guide(self) -> str:
         """Generate guide for using the sizing skill (platform-aware)."""
@@ -15,7 +15,9 @@ Supports sizing_context from sizing_parser.py for properly-sized infrastructure.
 Zero external dependencies -- Python 3.9+ stdlib only.
 """
 
-from typing import Any, Dict, List, Optional
+import io
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 
 ADDON_META = {
@@ -29,10 +31,108 @@ ADDON_META = {
     "priority": 15,
 }
 
+# Defaults used when no sizing report is supplied
+_DEFAULT_LOCATION = "westeurope"
+_DEFAULT_LOCATION_SHORT = "weu"
+_DEFAULT_SYSTEM_VM_SIZE = "Standard_D2s_v5"
+_DEFAULT_ES_VM_SIZE = "Standard_E8s_v5"
+_DEFAULT_COLD_VM_SIZE = "Standard_L8s_v3"
+
+# Azure region -> short code used in resource names
+_LOCATION_SHORT_MAP = {
+    "westeurope": "weu",
+    "northeurope": "neu",
+    "eastus": "eus",
+    "eastus2": "eus2",
+    "westus": "wus",
+    "westus2": "wus2",
+    "swedencentral": "swc",
+}
+
+# Section divider used in the generated root .tf files
+_SECTION_BAR = "# " + "-" * 73
+
+# Node pool table: (sizing pool name, attribute prefix, default node count,
+# default VM size, default OS disk GB or None, optional tier with *_enabled).
+# Optional tiers are enabled only when the sizing report gives them nodes.
+_POOL_SPECS = (
+    ("system", "system", 3, _DEFAULT_SYSTEM_VM_SIZE, None, False),
+    ("eshot", "es_hot", 3, _DEFAULT_ES_VM_SIZE, 256, False),
+    ("escold", "es_cold", 3, _DEFAULT_COLD_VM_SIZE, 256, True),
+    ("esfrozen", "es_frozen", 0, _DEFAULT_ES_VM_SIZE, 2400, True),
+)
+_POOL_NAMES = frozenset(spec[0] for spec in _POOL_SPECS)
+
+# Generated files in output order: (filepath, generator method)
+_FILE_BUILDERS = (
+    # Root module
+    ("terraform/main.tf", "_generate_root_main"),
+    ("terraform/variables.tf", "_generate_root_variables"),
+    ("terraform/outputs.tf", "_generate_root_outputs"),
+    ("terraform/providers.tf", "_generate_providers"),
+    ("terraform/versions.tf", "_generate_versions"),
+    ("terraform/terraform.tfvars.example", "_generate_tfvars_example"),
+    ("terraform/README.md", "_generate_readme"),
+    # AKS module
+    ("terraform/modules/aks/main.tf", "_generate_aks_main"),
+    ("terraform/modules/aks/variables.tf", "_generate_aks_variables"),
+    ("terraform/modules/aks/outputs.tf", "_generate_aks_outputs"),
+    # Networking module
+    ("terraform/modules/networking/main.tf", "_generate_networking_main"),
+    ("terraform/modules/networking/variables.tf", "_generate_networking_variables"),
+    ("terraform/modules/networking/outputs.tf", "_generate_networking_outputs"),
+    # Storage module
+    ("terraform/modules/storage/main.tf", "_generate_storage_main"),
+    ("terraform/modules/storage/variables.tf", "_generate_storage_variables"),
+    ("terraform/modules/storage/outputs.tf", "_generate_storage_outputs"),
+    # ACR module
+    ("terraform/modules/acr/main.tf", "_generate_acr_main"),
+    ("terraform/modules/acr/variables.tf", "_generate_acr_variables"),
+    ("terraform/modules/acr/outputs.tf", "_generate_acr_outputs"),
+    # Monitoring module
+    ("terraform/modules/monitoring/main.tf", "_generate_monitoring_main"),
+    ("terraform/modules/monitoring/variables.tf", "_generate_monitoring_variables"),
+    ("terraform/modules/monitoring/outputs.tf", "_generate_monitoring_outputs"),
+)
+
 
 class TerraformAKSGenerator:
     """Generates Terraform module structure for AKS deployments."""
     
+    # Fixed attribute set; node pool attributes follow _POOL_SPECS
+    __slots__ = (
+        "project_name",
+        "description",
+        "context",
+        "location",
+        "location_short",
+        "environment",
+        "k8s_version",
+        "_sizing_context",
+        "aks_sizing",
+        "sizing_source",
+        "system_node_count",
+        "system_vm_size",
+        "es_hot_node_count",
+        "es_hot_vm_size",
+        "es_hot_disk_size_gb",
+        "es_cold_enabled",
+        "es_cold_enabled_tf",
+        "es_cold_node_count",
+        "es_cold_vm_size",
+        "es_cold_disk_size_gb",
+        "es_frozen_enabled",
+        "es_frozen_enabled_tf",
+        "es_frozen_node_count",
+        "es_frozen_vm_size",
+        "es_frozen_disk_size_gb",
+        "vnet_cidr",
+        "aks_subnet_cidr",
+        "snapshot_storage_gb",
+        "snapshot_storage_gb_int",
+        "_fmt_ctx",
+    )
+    
     def __init__(
         self,
         project_name: str,
@@ -44,7 +144,7 @@ class TerraformAKSGenerator:
         self.context = context or {}
         
         # Azure region (default to West Europe for Skane proximity)
-        self.location = self.context.get("azure_location", "westeurope")
+        self.location = self.context.get("azure_location", _DEFAULT_LOCATION)
         self.location_short = self._get_location_short(self.location)
         
         # Environment
@@ -55,136 +155,164 @@ class TerraformAKSGenerator:
         
         # Extract AKS sizing from context (from sizing_parser)
         # sizing_context is nested inside context
-        sizing_context = self.context.get("sizing_context", {}) or {}
-        self.aks_sizing = sizing_context.get("aks", {})
-        self.sizing_source = sizing_context.get("source", "default")
+        self._sizing_context = self.context.get("sizing_context") or {}
+        self.aks_sizing = self._sizing_context.get("aks", {})
+        self.sizing_source = self._sizing_context.get("source", "default")
         
         # Node pool configurations (from sizing or defaults)
         self._configure_node_pools()
+        
+        # Placeholder values for the root module templates
+        self._fmt_ctx = self._build_format_context()
     
     def _configure_node_pools(self):
         """Configure node pools from sizing context or use defaults."""
         aks = self.aks_sizing
+        sized = bool(aks and aks.get("node_pools"))
+        pools = {}
+        if sized:
+            # Only the pools in _POOL_SPECS are read; skip anything else
+            for pool in aks["node_pools"]:
+                name = pool["name"]
+                if name in _POOL_NAMES:
+                    pools[name] = pool
         
-        if aks and aks.get("node_pools"):
-            # Use sizing from report
-            pools = {p["name"]: p for p in aks["node_pools"]}
-            
-            # System pool
-            sys_pool = pools.get("system", {})
-            self.system_node_count = sys_pool.get("node_count", 3)
-            self.system_vm_size = sys_pool.get("vm_size", "Standard_D2s_v5")
-            
-            # ES Hot pool
-            hot_pool = pools.get("eshot", {})
-            self.es_hot_node_count = hot_pool.get("node_count", 3)
-            self.es_hot_vm_size = hot_pool.get("vm_size", "Standard_E8s_v5")
-            self.es_hot_disk_size_gb = hot_pool.get("disk_size_gb", 256)
-            
-            # ES Cold pool
-            cold_pool = pools.get("escold", {})
-            self.es_cold_enabled = cold_pool.get("node_count", 0) > 0
-            self.es_cold_node_count = cold_pool.get("node_count", 3)
-            self.es_cold_vm_size = cold_pool.get("vm_size", "Standard_L8s_v3")
-            self.es_cold_disk_size_gb = cold_pool.get("disk_size_gb", 256)
-            
-            # ES Frozen pool
-            frozen_pool = pools.get("esfrozen", {})
-            self.es_frozen_enabled = frozen_pool.get("node_count", 0) > 0
-            self.es_frozen_node_count = frozen_pool.get("node_count", 0)
-            self.es_frozen_vm_size = frozen_pool.get("vm_size", "Standard_E8s_v5")
-            self.es_frozen_disk_size_gb = frozen_pool.get("disk_size_gb", 2400)
-            
-            # Networking from sizing
-            networking = aks.get("networking", {})
-            self.vnet_cidr = networking.get("vnet_cidr", "10.0.0.0/16")
-            self.aks_subnet_cidr = networking.get("aks_subnet_cidr", "10.0.0.0/20")
-            
+        # Node pools: sized values where the report has them, defaults otherwise
+        for name, prefix, count, vm_size, disk_size_gb, optional in _POOL_SPECS:
+            pool = pools.get(name, {})
+            setattr(self, f"{prefix}_node_count", pool.get("node_count", count))
+            setattr(self, f"{prefix}_vm_size", pool.get("vm_size", vm_size))
+            if disk_size_gb is not None:
+                setattr(self, f"{prefix}_disk_size_gb", pool.get("disk_size_gb", disk_size_gb))
+            if optional:
+                enabled = pool.get("node_count", 0) > 0
+                setattr(self, f"{prefix}_enabled", enabled)
+                # Terraform bool literal, rendered once for the templates
+                setattr(self, f"{prefix}_enabled_tf", "true" if enabled else "false")
+        
+        # Networking from sizing
+        networking = aks.get("networking", {}) if sized else {}
+        self.vnet_cidr = networking.get("vnet_cidr", "10.0.0.0/16")
+        self.aks_subnet_cidr = networking.get("aks_subnet_cidr", "10.0.0.0/20")
+        
+        self.snapshot_storage_gb = 0
+        if sized:
             # Storage from sizing - check both aks.storage and frozen_nodes
             storage = aks.get("storage", {})
             self.snapshot_storage_gb = storage.get("snapshot_storage_gb", 0)
             
             # Also check sizing_context.frozen_nodes for snapshot storage
-            sizing_context = self.context.get("sizing_context", {}) or {}
-            frozen_nodes = sizing_context.get("frozen_nodes", {})
+            frozen_nodes = self._sizing_context.get("frozen_nodes", {})
             if not self.snapshot_storage_gb and frozen_nodes:
                 self.snapshot_storage_gb = frozen_nodes.get("snapshot_storage_gb", 0)
+        
+        # Whole GB, as written into the Terraform defaults
+        self.snapshot_storage_gb_int = int(self.snapshot_storage_gb)
+    
+    def _build_format_context(self) -> Dict[str, Any]:
+        """Collect the values substituted into the root module templates."""
+        sized = self.sizing_source == "sizing_report"
+        ctx: Dict[str, Any] = {
+            "section_bar": _SECTION_BAR,
+            "project_name": self.project_name,
+            "environment": self.environment,
+            "location": self.location,
+            "k8s_version": self.k8s_version,
+            "vnet_cidr": self.vnet_cidr,
+            "aks_subnet_cidr": self.aks_subnet_cidr,
+            "snapshot_storage_gb": self.snapshot_storage_gb_int,
+            "main_sizing_comment": "# Sized from sizing report" if sized else "# Default sizing",
+            "variables_source": "Generated from sizing report" if sized else "Default values",
+            "tfvars_sizing_comment": (
+                "# Values from sizing report"
+                if sized
+                else "# Default values - adjust based on your sizing requirements"
+            ),
+        }
+        for _, prefix, _, _, disk_size_gb, optional in _POOL_SPECS:
+            for suffix in ("node_count", "vm_size"):
+                ctx[f"{prefix}_{suffix}"] = getattr(self, f"{prefix}_{suffix}")
+            if disk_size_gb is not None:
+                ctx[f"{prefix}_disk_size_gb"] = getattr(self, f"{prefix}_disk_size_gb")
+            if optional:
+                ctx[f"{prefix}_enabled_tf"] = getattr(self, f"{prefix}_enabled_tf")
+        
+        # A disabled frozen tier gets no root variables or module inputs at all
+        if self.es_frozen_enabled:
+            ctx["frozen_module_args"] = _FROZEN_MODULE_ARGS
+            ctx["frozen_variables"] = _FROZEN_VARIABLES_TPL.format_map(ctx)
+            ctx["frozen_tfvars"] = _FROZEN_TFVARS_TPL.format_map(ctx)
         else:
-            # Use defaults
-            self.system_node_count = 3
-            self.system_vm_size = "Standard_D2s_v5"
-            
-            self.es_hot_node_count = 3
-            self.es_hot_vm_size = "Standard_E8s_v5"
-            self.es_hot_disk_size_gb = 256
-            
-            self.es_cold_enabled = False
-            self.es_cold_node_count = 3
-            self.es_cold_vm_size = "Standard_L8s_v3"
-            self.es_cold_disk_size_gb = 256
-            
-            self.es_frozen_enabled = False
-            self.es_frozen_node_count = 0
-            self.es_frozen_vm_size = "Standard_E8s_v5"
-            self.es_frozen_disk_size_gb = 2400
-            
-            self.vnet_cidr = "10.0.0.0/16"
-            self.aks_subnet_cidr = "10.0.0.0/20"
-            
-            self.snapshot_storage_gb = 0
+            ctx["frozen_module_args"] = ""
+            ctx["frozen_variables"] = ""
+            ctx["frozen_tfvars"] = ""
+        return ctx
     
-    def _get_location_short(self, location: str) -> str:
+    @staticmethod
+    def _get_location_short(location: str) -> str:
         """Get short code for Azure location."""
-        location_map = {
-            "westeurope": "weu",
-            "northeurope": "neu",
-            "eastus": "eus",
-            "eastus2": "eus2",
-            "westus": "wus",
-            "westus2": "wus2",
-            "swedencentral": "swc",
-        }
-        return location_map.get(location.lower().replace(" ", ""), "weu")
+        return _LOCATION_SHORT_MAP.get(
+            location.lower().replace(" ", ""), _DEFAULT_LOCATION_SHORT
+        )
+    
+    def iter_files(self) -> Iterator[Tuple[str, str]]:
+        """
+        Yield (filepath, content) pairs one file at a time.
+        
+        Each file is rendered only when the consumer asks for it, so a caller
+        that writes as it goes holds a single file's content in memory.
+        """
+        for filepath, builder in _FILE_BUILDERS:
+            yield filepath, getattr(self, builder)()
     
     def generate(self) -> Dict[str, str]:
         """Generate all Terraform files."""
-        files = {}
-        
-        # Root module
-        files["terraform/main.tf"] = self._generate_root_main()
-        files["terraform/variables.tf"] = self._generate_root_variables()
-        files["terraform/outputs.tf"] = self._generate_root_outputs()
-        files["terraform/providers.tf"] = self._generate_providers()
-        files["terraform/versions.tf"] = self._generate_versions()
-        files["terraform/terraform.tfvars.example"] = self._generate_tfvars_example()
-        files["terraform/README.md"] = self._generate_readme()
-        
-        # AKS module
-        files["terraform/modules/aks/main.tf"] = self._generate_aks_main()
-        files["terraform/modules/aks/variables.tf"] = self._generate_aks_variables()
-        files["terraform/modules/aks/outputs.tf"] = self._generate_aks_outputs()
-        
-        # Networking module
-        files["terraform/modules/networking/main.tf"] = self._generate_networking_main()
-        files["terraform/modules/networking/variables.tf"] = self._generate_networking_variables()
-        files["terraform/modules/networking/outputs.tf"] = self._generate_networking_outputs()
-        
-        # Storage module
-        files["terraform/modules/storage/main.tf"] = self._generate_storage_main()
-        files["terraform/modules/storage/variables.tf"] = self._generate_storage_variables()
-        files["terraform/modules/storage/outputs.tf"] = self._generate_storage_outputs()
-        
-        # ACR module
-        files["terraform/modules/acr/main.tf"] = self._generate_acr_main()
-        files["terraform/modules/acr/variables.tf"] = self._generate_acr_variables()
-        files["terraform/modules/acr/outputs.tf"] = self._generate_acr_outputs()
+        return dict(self.iter_files())
+    
+    def _iter_encoded(self) -> Iterator[Tuple[str, bytes]]:
+        """Yield (filepath, UTF-8 bytes) pairs, encoding each file once."""
+        for filepath, content in self.iter_files():
+            yield filepath, content.encode("utf-8")
+    
+    def generate_bytes(self) -> Dict[str, bytes]:
+        """Generate all Terraform files as UTF-8 bytes, ready for binary writes."""
+        return dict(self._iter_encoded())
+    
+    def generate_as_stream(self) -> Tuple[bytes, List[Tuple[str, int, int]]]:
+        """
+        Generate all Terraform files into one contiguous UTF-8 buffer.
         
-        # Monitoring module
-        files["terraform/modules/monitoring/main.tf"] = self._generate_monitoring_main()
-        files["terraform/modules/monitoring/variables.tf"] = self._generate_monitoring_variables()
-        files["terraform/modules/monitoring/outputs.tf"] = self._generate_monitoring_outputs()
+        Returns (buffer, index) where index holds (filepath, offset, length)
+        for each file, so archivers can slice the buffer without copying
+        the files into separate strings again.
+        """
+        buf = io.BytesIO()
+        index = []
+        for filepath, payload in self._iter_encoded():
+            index.append((filepath, buf.tell(), len(payload)))
+            buf.write(payload)
+        return buf.getvalue(), index
+    
+    def generate_to_dir(self, root: Union[str, Path]) -> List[Path]:
+        """
+        Render all Terraform files straight to disk under root.
         
-        return files
+        Files are written one at a time as they are rendered; each file's
+        encoded content goes out in a single write call. Returns the written
+        paths.
+        """
+        root = Path(root)
+        written = []
+        made_dirs = set()
+        for filepath, payload in self._iter_encoded():
+            path = root / filepath
+            if path.parent not in made_dirs:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                made_dirs.add(path.parent)
+            with open(path, "wb") as fh:
+                fh.write(payload)
+            written.append(path)
+        return written
     
     # -------------------------------------------------------------------------
     # Root module
@@ -192,11 +320,120 @@ class TerraformAKSGenerator:
     
     def _generate_root_main(self) -> str:
         """Generate root main.tf."""
-        sizing_comment = "# Sized from sizing report" if self.sizing_source == "sizing_report" else "# Default sizing"
-        
-        return f'''# {self.project_name} - AKS Infrastructure
+        return _ROOT_MAIN_TPL.format_map(self._fmt_ctx)
+    
+    def _generate_root_variables(self) -> str:
+        """Generate root variables.tf."""
+        return _ROOT_VARIABLES_TPL.format_map(self._fmt_ctx)
+    
+    def _generate_root_outputs(self) -> str:
+        """Generate root outputs.tf."""
+        return _ROOT_OUTPUTS_TPL.format_map(self._fmt_ctx)
+    
+    def _generate_providers(self) -> str:
+        """Generate providers.tf."""
+        return _PROVIDERS_TF
+    
+    def _generate_versions(self) -> str:
+        """Generate versions.tf."""
+        return _VERSIONS_TF
+    
+    def _generate_tfvars_example(self) -> str:
+        """Generate terraform.tfvars.example."""
+        return _TFVARS_EXAMPLE_TPL.format_map(self._fmt_ctx)
+    
+    def _generate_readme(self) -> str:
+        """Generate README.md for terraform directory."""
+        return _README_TPL.format_map(self._fmt_ctx)
+    
+    # -------------------------------------------------------------------------
+    # AKS Module
+    # -------------------------------------------------------------------------
+    
+    def _generate_aks_main(self) -> str:
+        """Generate AKS module main.tf."""
+        return _AKS_MAIN_TF
+    
+    def _generate_aks_variables(self) -> str:
+        """Generate AKS module variables.tf."""
+        return _AKS_VARIABLES_TF
+    
+    def _generate_aks_outputs(self) -> str:
+        """Generate AKS module outputs.tf."""
+        return _AKS_OUTPUTS_TF
+    
+    # -------------------------------------------------------------------------
+    # Networking Module
+    # -------------------------------------------------------------------------
+    
+    def _generate_networking_main(self) -> str:
+        """Generate networking module main.tf."""
+        return _NETWORKING_MAIN_TF
+    
+    def _generate_networking_variables(self) -> str:
+        """Generate networking module variables.tf."""
+        return _NETWORKING_VARIABLES_TF
+    
+    def _generate_networking_outputs(self) -> str:
+        """Generate networking module outputs.tf."""
+        return _NETWORKING_OUTPUTS_TF
+    
+    # -------------------------------------------------------------------------
+    # Storage Module
+    # -------------------------------------------------------------------------
+    
+    def _generate_storage_main(self) -> str:
+        """Generate storage module main.tf."""
+        return _STORAGE_MAIN_TF
+    
+    def _generate_storage_variables(self) -> str:
+        """Generate storage module variables.tf."""
+        return _STORAGE_VARIABLES_TF
+    
+    def _generate_storage_outputs(self) -> str:
+        """Generate storage module outputs.tf."""
+        return _STORAGE_OUTPUTS_TF
+    
+    # -------------------------------------------------------------------------
+    # ACR Module
+    # -------------------------------------------------------------------------
+    
+    def _generate_acr_main(self) -> str:
+        """Generate ACR module main.tf."""
+        return _ACR_MAIN_TF
+    
+    def _generate_acr_variables(self) -> str:
+        """Generate ACR module variables.tf."""
+        return _ACR_VARIABLES_TF
+    
+    def _generate_acr_outputs(self) -> str:
+        """Generate ACR module outputs.tf."""
+        return _ACR_OUTPUTS_TF
+    
+    # -------------------------------------------------------------------------
+    # Monitoring Module
+    # -------------------------------------------------------------------------
+    
+    def _generate_monitoring_main(self) -> str:
+        """Generate monitoring module main.tf."""
+        return _MONITORING_MAIN_TF
+    
+    def _generate_monitoring_variables(self) -> str:
+        """Generate monitoring module variables.tf."""
+        return _MONITORING_VARIABLES_TF
+    
+    def _generate_monitoring_outputs(self) -> str:
+        """Generate monitoring module outputs.tf."""
+        return _MONITORING_OUTPUTS_TF
+
+
+# ------------------------------------------------------------------
+# Root module templates (rendered with str.format_map)
+# ------------------------------------------------------------------
+
+_ROOT_MAIN_TPL = '''# {project_name} - AKS Infrastructure
 # Generated by project-initializer
-{sizing_comment}
+{main_sizing_comment}
 
 locals {{
   project_name     = var.project_name
@@ -302,13 +539,7 @@ module "aks" {{
   es_cold_vm_size      = var.es_cold_vm_size
   es_cold_disk_size_gb = var.es_cold_disk_size_gb
   
-  # ES Frozen tier
-  es_frozen_enabled      = var.es_frozen_enabled
-  es_frozen_node_count   = var.es_frozen_node_count
-  es_frozen_vm_size      = var.es_frozen_vm_size
-  es_frozen_disk_size_gb = var.es_frozen_disk_size_gb
-  
-  # Monitoring
+{frozen_module_args}  # Monitoring
   log_analytics_workspace_id = module.monitoring.log_analytics_workspace_id
   
   # ACR integration
@@ -317,30 +548,24 @@ module "aks" {{
   tags = local.common_tags
 }}
 '''
-    
-    def _generate_root_variables(self) -> str:
-        """Generate root variables.tf."""
-        # Determine if frozen tier should be enabled by default
-        frozen_default = "true" if self.es_frozen_enabled else "false"
-        cold_default = "true" if self.es_cold_enabled else "false"
-        
-        return f'''# {self.project_name} - Variables
-# {"Generated from sizing report" if self.sizing_source == "sizing_report" else "Default values"}
 
-# -------------------------------------------------------------------------
+_ROOT_VARIABLES_TPL = '''# {project_name} - Variables
+# {variables_source}
+
+{section_bar}
 # Project
-# -------------------------------------------------------------------------
+{section_bar}
 
 variable "project_name" {{
   description = "Name of the project (used in resource naming)"
   type        = string
-  default     = "{self.project_name}"
+  default     = "{project_name}"
 }}
 
 variable "environment" {{
   description = "Environment name (dev, staging, prod)"
   type        = string
-  default     = "{self.environment}"
+  default     = "{environment}"
   
   validation {{
     condition     = contains(["dev", "staging", "prod"], var.environment)
@@ -351,23 +576,23 @@ variable "environment" {{
 variable "location" {{
   description = "Azure region for resources"
   type        = string
-  default     = "{self.location}"
+  default     = "{location}"
 }}
 
-# -------------------------------------------------------------------------
+{section_bar}
 # Networking
-# -------------------------------------------------------------------------
+{section_bar}
 
 variable "vnet_address_space" {{
   description = "Address space for the VNet"
   type        = list(string)
-  default     = ["{self.vnet_cidr}"]
+  default     = ["{vnet_cidr}"]
 }}
 
 variable "aks_subnet_prefix" {{
   description = "CIDR prefix for AKS subnet"
   type        = string
-  default     = "{self.aks_subnet_cidr}"
+  default     = "{aks_subnet_cidr}"
 }}
 
 variable "private_subnet_prefix" {{
@@ -376,104 +601,79 @@ variable "private_subnet_prefix" {{
   default     = "10.0.240.0/24"
 }}
 
-# -------------------------------------------------------------------------
+{section_bar}
 # Kubernetes
-# -------------------------------------------------------------------------
+{section_bar}
 
 variable "kubernetes_version" {{
   description = "Kubernetes version for AKS"
   type        = string
-  default     = "{self.k8s_version}"
+  default     = "{k8s_version}"
 }}
 
 variable "system_node_count" {{
   description = "Number of nodes in the system node pool"
   type        = number
-  default     = {self.system_node_count}
+  default     = {system_node_count}
 }}
 
 variable "system_vm_size" {{
   description = "VM size for system node pool"
   type        = string
-  default     = "{self.system_vm_size}"
+  default     = "{system_vm_size}"
 }}
 
-# -------------------------------------------------------------------------
+{section_bar}
 # Elasticsearch Node Pools
-# -------------------------------------------------------------------------
+{section_bar}
 
 # Hot tier
 variable "es_hot_node_count" {{
   description = "Number of nodes in the ES hot tier pool"
   type        = number
-  default     = {self.es_hot_node_count}
+  default     = {es_hot_node_count}
 }}
 
 variable "es_hot_vm_size" {{
   description = "VM size for ES hot tier (memory-optimized recommended)"
   type        = string
-  default     = "{self.es_hot_vm_size}"
+  default     = "{es_hot_vm_size}"
 }}
 
 variable "es_hot_disk_size_gb" {{
   description = "OS disk size for ES hot tier nodes"
   type        = number
-  default     = {self.es_hot_disk_size_gb}
+  default     = {es_hot_disk_size_gb}
 }}
 
 # Cold tier
 variable "es_cold_enabled" {{
   description = "Enable ES cold tier node pool"
   type        = bool
-  default     = {cold_default}
+  default     = {es_cold_enabled_tf}
 }}
 
 variable "es_cold_node_count" {{
   description = "Number of nodes in the ES cold tier pool"
   type        = number
-  default     = {self.es_cold_node_count}
+  default     = {es_cold_node_count}
 }}
 
 variable "es_cold_vm_size" {{
   description = "VM size for ES cold tier (storage-optimized)"
   type        = string
-  default     = "{self.es_cold_vm_size}"
+  default     = "{es_cold_vm_size}"
 }}
 
 variable "es_cold_disk_size_gb" {{
   description = "OS disk size for ES cold tier nodes"
   type        = number
-  default     = {self.es_cold_disk_size_gb}
-}}
-
-# Frozen tier
-variable "es_frozen_enabled" {{
-  description = "Enable ES frozen tier node pool"
-  type        = bool
-  default     = {frozen_default}
-}}
-
-variable "es_frozen_node_count" {{
-  description = "Number of nodes in the ES frozen tier pool"
-  type        = number
-  default     = {self.es_frozen_node_count}
-}}
-
-variable "es_frozen_vm_size" {{
-  description = "VM size for ES frozen tier (memory-optimized for cache)"
-  type        = string
-  default     = "{self.es_frozen_vm_size}"
-}}
-
-variable "es_frozen_disk_size_gb" {{
-  description = "Cache disk size for ES frozen tier nodes"
-  type        = number
-  default     = {self.es_frozen_disk_size_gb}
+  default     = {es_cold_disk_size_gb}
 }}
 
-# -------------------------------------------------------------------------
+{frozen_variables}{section_bar}
 # Container Registry
-# -------------------------------------------------------------------------
+{section_bar}
 
 variable "acr_sku" {{
   description = "SKU for Azure Container Registry"
@@ -486,9 +686,9 @@ variable "acr_sku" {{
   }}
 }}
 
-# -------------------------------------------------------------------------
+{section_bar}
 # Monitoring
-# -------------------------------------------------------------------------
+{section_bar}
 
 variable "log_retention_days" {{
   description = "Log Analytics workspace retention in days"
@@ -496,9 +696,9 @@ variable "log_retention_days" {{
   default     = 30
 }}
 
-# -------------------------------------------------------------------------
+{section_bar}
 # Storage
-# -------------------------------------------------------------------------
+{section_bar}
 
 variable "snapshot_container_name" {{
   description = "Name of the blob container for ES snapshots"
@@ -509,17 +709,15 @@ variable "snapshot_container_name" {{
 variable "snapshot_storage_gb" {{
   description = "Expected snapshot storage size in GB (for capacity planning)"
   type        = number
-  default     = {int(self.snapshot_storage_gb)}
+  default     = {snapshot_storage_gb}
 }}
 '''
-    
-    def _generate_root_outputs(self) -> str:
-        """Generate root outputs.tf."""
-        return f'''# {self.project_name} - Outputs
 
-# -------------------------------------------------------------------------
+_ROOT_OUTPUTS_TPL = '''# {project_name} - Outputs
+
+{section_bar}
 # Resource Group
-# -------------------------------------------------------------------------
+{section_bar}
 
 output "resource_group_name" {{
   description = "Name of the resource group"
@@ -531,9 +729,9 @@ output "resource_group_id" {{
   value       = azurerm_resource_group.main.id
 }}
 
-# -------------------------------------------------------------------------
+{section_bar}
 # AKS
-# -------------------------------------------------------------------------
+{section_bar}
 
 output "aks_cluster_name" {{
   description = "Name of the AKS cluster"
@@ -556,9 +754,9 @@ output "aks_kube_config_command" {{
   value       = "az aks get-credentials --resource-group ${{azurerm_resource_group.main.name}} --name ${{module.aks.cluster_name}}"
 }}
 
-# -------------------------------------------------------------------------
+{section_bar}
 # Networking
-# -------------------------------------------------------------------------
+{section_bar}
 
 output "vnet_id" {{
   description = "ID of the VNet"
@@ -570,9 +768,9 @@ output "aks_subnet_id" {{
   value       = module.networking.aks_subnet_id
 }}
 
-# -------------------------------------------------------------------------
+{section_bar}
 # ACR
-# -------------------------------------------------------------------------
+{section_bar}
 
 output "acr_login_server" {{
   description = "Login server for ACR"
@@ -585,9 +783,9 @@ output "acr_admin_username" {{
   sensitive   = true
 }}
 
-# -------------------------------------------------------------------------
+{section_bar}
 # Storage
-# -------------------------------------------------------------------------
+{section_bar}
 
 output "storage_account_name" {{
   description = "Name of the storage account for ES snapshots"
@@ -605,121 +803,55 @@ output "storage_primary_access_key" {{
   sensitive   = true
 }}
 
-# -------------------------------------------------------------------------
+{section_bar}
 # Monitoring
-# -------------------------------------------------------------------------
+{section_bar}
 
 output "log_analytics_workspace_id" {{
   description = "ID of the Log Analytics workspace"
   value       = module.monitoring.log_analytics_workspace_id
 }}
 '''
-    
-    def _generate_providers(self) -> str:
-        """Generate providers.tf."""
-        return '''# Azure Provider Configuration
-
-provider "azurerm" {
-  features {
-    resource_group {
-      prevent_deletion_if_contains_resources = false
-    }
-    
-    key_vault {
-      purge_soft_delete_on_destroy    = true
-      recover_soft_deleted_key_vaults = true
-    }
-  }
-}
-
-# Configure Azure backend (uncomment and configure for remote state)
-# terraform {
-#   backend "azurerm" {
-#     resource_group_name  = "rg-terraform-state"
-#     storage_account_name = "stterraformstate"
-#     container_name       = "tfstate"
-#     key                  = "aks.terraform.tfstate"
-#   }
-# }
-'''
-    
-    def _generate_versions(self) -> str:
-        """Generate versions.tf."""
-        return '''# Required Terraform and Provider Versions
 
-terraform {
-  required_version = ">= 1.5.0"
-  
-  required_providers {
-    azurerm = {
-      source  = "hashicorp/azurerm"
-      version = "~> 3.90"
-    }
-    
-    azuread = {
-      source  = "hashicorp/azuread"
-      version = "~> 2.47"
-    }
-    
-    random = {
-      source  = "hashicorp/random"
-      version = "~> 3.6"
-    }
-  }
-}
-'''
-    
-    def _generate_tfvars_example(self) -> str:
-        """Generate terraform.tfvars.example."""
-        sizing_comment = "# Values from sizing report" if self.sizing_source == "sizing_report" else "# Default values - adjust based on your sizing requirements"
-        
-        return f'''# {self.project_name} - Example Variables
+_TFVARS_EXAMPLE_TPL = '''# {project_name} - Example Variables
 # Copy this file to terraform.tfvars and customize values
-{sizing_comment}
+{tfvars_sizing_comment}
 
-project_name = "{self.project_name}"
-environment  = "{self.environment}"
-location     = "{self.location}"
+project_name = "{project_name}"
+environment  = "{environment}"
+location     = "{location}"
 
 # Networking
-vnet_address_space = ["{self.vnet_cidr}"]
-aks_subnet_prefix  = "{self.aks_subnet_cidr}"
+vnet_address_space = ["{vnet_cidr}"]
+aks_subnet_prefix  = "{aks_subnet_cidr}"
 
 # Kubernetes
-kubernetes_version = "{self.k8s_version}"
-system_node_count  = {self.system_node_count}
-system_vm_size     = "{self.system_vm_size}"
+kubernetes_version = "{k8s_version}"
+system_node_count  = {system_node_count}
+system_vm_size     = "{system_vm_size}"
 
 # ES Hot tier (memory-optimized for active data)
-es_hot_node_count   = {self.es_hot_node_count}
-es_hot_vm_size      = "{self.es_hot_vm_size}"
-es_hot_disk_size_gb = {self.es_hot_disk_size_gb}
+es_hot_node_count   = {es_hot_node_count}
+es_hot_vm_size      = "{es_hot_vm_size}"
+es_hot_disk_size_gb = {es_hot_disk_size_gb}
 
 # ES Cold tier (storage-optimized for older data)
-es_cold_enabled      = {"true" if self.es_cold_enabled else "false"}
-es_cold_node_count   = {self.es_cold_node_count}
-es_cold_vm_size      = "{self.es_cold_vm_size}"
-es_cold_disk_size_gb = {self.es_cold_disk_size_gb}
-
-# ES Frozen tier (for searchable snapshots)
-es_frozen_enabled      = {"true" if self.es_frozen_enabled else "false"}
-es_frozen_node_count   = {self.es_frozen_node_count}
-es_frozen_vm_size      = "{self.es_frozen_vm_size}"
-es_frozen_disk_size_gb = {self.es_frozen_disk_size_gb}
+es_cold_enabled      = {es_cold_enabled_tf}
+es_cold_node_count   = {es_cold_node_count}
+es_cold_vm_size      = "{es_cold_vm_size}"
+es_cold_disk_size_gb = {es_cold_disk_size_gb}
 
-# ACR
+{frozen_tfvars}# ACR
 acr_sku = "Standard"
 
 # Monitoring
 log_retention_days = 30
 
 # Storage (for ES snapshots)
-snapshot_storage_gb = {int(self.snapshot_storage_gb)}
+snapshot_storage_gb = {snapshot_storage_gb}
 '''
-    
-    def _generate_readme(self) -> str:
-        """Generate README.md for terraform directory."""
-        return f'''# {self.project_name} - Terraform Infrastructure
+
+_README_TPL = '''# {project_name} - Terraform Infrastructure
 
 Terraform modules for deploying AKS infrastructure for Elasticsearch.
 
@@ -762,7 +894,7 @@ After deployment:
 
 ```bash
 # Get kubeconfig
-az aks get-credentials --resource-group rg-{self.project_name}-{self.environment} --name aks-{self.project_name}-{self.environment}
+az aks get-credentials --resource-group rg-{project_name}-{environment} --name aks-{project_name}-{environment}
 
 # Verify connection
 kubectl get nodes
@@ -803,14 +935,109 @@ Total: ~$1000/month (dev environment)
 terraform destroy
 ```
 '''
+
+
+# Frozen tier fragments, only rendered when the sizing enables that tier.
+# The aks module's own variable defaults keep the pool off otherwise.
+_FROZEN_MODULE_ARGS = '''  # ES Frozen tier
+  es_frozen_enabled      = var.es_frozen_enabled
+  es_frozen_node_count   = var.es_frozen_node_count
+  es_frozen_vm_size      = var.es_frozen_vm_size
+  es_frozen_disk_size_gb = var.es_frozen_disk_size_gb
+  
+'''
+
+_FROZEN_VARIABLES_TPL = '''# Frozen tier
+variable "es_frozen_enabled" {{
+  description = "Enable ES frozen tier node pool"
+  type        = bool
+  default     = {es_frozen_enabled_tf}
+}}
+
+variable "es_frozen_node_count" {{
+  description = "Number of nodes in the ES frozen tier pool"
+  type        = number
+  default     = {es_frozen_node_count}
+}}
+
+variable "es_frozen_vm_size" {{
+  description = "VM size for ES frozen tier (memory-optimized for cache)"
+  type        = string
+  default     = "{es_frozen_vm_size}"
+}}
+
+variable "es_frozen_disk_size_gb" {{
+  description = "Cache disk size for ES frozen tier nodes"
+  type        = number
+  default     = {es_frozen_disk_size_gb}
+}}
+
+'''
+
+_FROZEN_TFVARS_TPL = '''# ES Frozen tier (for searchable snapshots)
+es_frozen_enabled      = {es_frozen_enabled_tf}
+es_frozen_node_count   = {es_frozen_node_count}
+es_frozen_vm_size      = "{es_frozen_vm_size}"
+es_frozen_disk_size_gb = {es_frozen_disk_size_gb}
+
+'''
+
+
+# ------------------------------------------------------------------
+# Static Terraform templates
+# ------------------------------------------------------------------
+
+_PROVIDERS_TF = '''# Azure Provider Configuration
+
+provider "azurerm" {
+  features {
+    resource_group {
+      prevent_deletion_if_contains_resources = false
+    }
     
-    # -------------------------------------------------------------------------
-    # AKS Module
-    # -------------------------------------------------------------------------
+    key_vault {
+      purge_soft_delete_on_destroy    = true
+      recover_soft_deleted_key_vaults = true
+    }
+  }
+}
+
+# Configure Azure backend (uncomment and configure for remote state)
+# terraform {
+#   backend "azurerm" {
+#     resource_group_name  = "rg-terraform-state"
+#     storage_account_name = "stterraformstate"
+#     container_name       = "tfstate"
+#     key                  = "aks.terraform.tfstate"
+#   }
+# }
+'''
+
+_VERSIONS_TF = '''# Required Terraform and Provider Versions
+
+terraform {
+  required_version = ">= 1.5.0"
+  
+  required_providers {
+    azurerm = {
+      source  = "hashicorp/azurerm"
+      version = "~> 3.90"
+    }
     
-    def _generate_aks_main(self) -> str:
-        """Generate AKS module main.tf."""
-        return '''# AKS Cluster Module
+    azuread = {
+      source  = "hashicorp/azuread"
+      version = "~> 2.47"
+    }
+    
+    random = {
+      source  = "hashicorp/random"
+      version = "~> 3.6"
+    }
+  }
+}
+'''
+
+_AKS_MAIN_TF = '''# AKS Cluster Module
 
 resource "azurerm_kubernetes_cluster" "main" {
   name                = "aks-${var.resource_prefix}"
@@ -941,10 +1168,8 @@ resource "azurerm_role_assignment" "aks_acr_pull" {
   principal_id         = azurerm_kubernetes_cluster.main.kubelet_identity[0].object_id
 }
 '''
-    
-    def _generate_aks_variables(self) -> str:
-        """Generate AKS module variables.tf."""
-        return '''# AKS Module Variables
+
+_AKS_VARIABLES_TF = '''# AKS Module Variables
 
 variable "resource_group_name" {
   description = "Name of the resource group"
@@ -1070,10 +1295,8 @@ variable "tags" {
   default     = {}
 }
 '''
-    
-    def _generate_aks_outputs(self) -> str:
-        """Generate AKS module outputs.tf."""
-        return '''# AKS Module Outputs
+
+_AKS_OUTPUTS_TF = '''# AKS Module Outputs
 
 output "cluster_name" {
   description = "Name of the AKS cluster"
@@ -1101,14 +1324,8 @@ output "node_resource_group" {
   value       = azurerm_kubernetes_cluster.main.node_resource_group
 }
 '''
-    
-    # -------------------------------------------------------------------------
-    # Networking Module
-    # -------------------------------------------------------------------------
-    
-    def _generate_networking_main(self) -> str:
-        """Generate networking module main.tf."""
-        return '''# Networking Module
+
+_NETWORKING_MAIN_TF = '''# Networking Module
 
 # Virtual Network
 resource "azurerm_virtual_network" "main" {
@@ -1177,10 +1394,8 @@ resource "azurerm_subnet_network_security_group_association" "aks" {
   network_security_group_id = azurerm_network_security_group.aks.id
 }
 '''
-    
-    def _generate_networking_variables(self) -> str:
-        """Generate networking module variables.tf."""
-        return '''# Networking Module Variables
+
+_NETWORKING_VARIABLES_TF = '''# Networking Module Variables
 
 variable "resource_group_name" {
   description = "Name of the resource group"
@@ -1221,10 +1436,8 @@ variable "tags" {
   default     = {}
 }
 '''
-    
-    def _generate_networking_outputs(self) -> str:
-        """Generate networking module outputs.tf."""
-        return '''# Networking Module Outputs
+
+_NETWORKING_OUTPUTS_TF = '''# Networking Module Outputs
 
 output "vnet_id" {
   description = "VNet ID"
@@ -1246,14 +1459,8 @@ output "private_subnet_id" {
   value       = azurerm_subnet.private.id
 }
 '''
-    
-    # -------------------------------------------------------------------------
-    # Storage Module
-    # -------------------------------------------------------------------------
-    
-    def _generate_storage_main(self) -> str:
-        """Generate storage module main.tf."""
-        return '''# Storage Module (for ES Snapshots)
+
+_STORAGE_MAIN_TF = '''# Storage Module (for ES Snapshots)
 
 resource "random_string" "storage_suffix" {
   length  = 8
@@ -1306,10 +1513,8 @@ resource "azurerm_storage_container" "snapshots" {
   container_access_type = "private"
 }
 '''
-    
-    def _generate_storage_variables(self) -> str:
-        """Generate storage module variables.tf."""
-        return '''# Storage Module Variables
+
+_STORAGE_VARIABLES_TF = '''# Storage Module Variables
 
 variable "resource_group_name" {
   description = "Name of the resource group"
@@ -1344,10 +1549,8 @@ variable "tags" {
   default     = {}
 }
 '''
-    
-    def _generate_storage_outputs(self) -> str:
-        """Generate storage module outputs.tf."""
-        return '''# Storage Module Outputs
+
+_STORAGE_OUTPUTS_TF = '''# Storage Module Outputs
 
 output "storage_account_name" {
   description = "Name of the storage account"
@@ -1375,14 +1578,8 @@ output "primary_blob_endpoint" {
   value       = azurerm_storage_account.snapshots.primary_blob_endpoint
 }
 '''
-    
-    # -------------------------------------------------------------------------
-    # ACR Module
-    # -------------------------------------------------------------------------
-    
-    def _generate_acr_main(self) -> str:
-        """Generate ACR module main.tf."""
-        return '''# Azure Container Registry Module
+
+_ACR_MAIN_TF = '''# Azure Container Registry Module
 
 resource "random_string" "acr_suffix" {
   length  = 8
@@ -1400,10 +1597,8 @@ resource "azurerm_container_registry" "main" {
   tags = var.tags
 }
 '''
-    
-    def _generate_acr_variables(self) -> str:
-        """Generate ACR module variables.tf."""
-        return '''# ACR Module Variables
+
+_ACR_VARIABLES_TF = '''# ACR Module Variables
 
 variable "resource_group_name" {
   description = "Name of the resource group"
@@ -1432,10 +1627,8 @@ variable "tags" {
   default     = {}
 }
 '''
-    
-    def _generate_acr_outputs(self) -> str:
-        """Generate ACR module outputs.tf."""
-        return '''# ACR Module Outputs
+
+_ACR_OUTPUTS_TF = '''# ACR Module Outputs
 
 output "acr_id" {
   description = "ID of the ACR"
@@ -1464,14 +1657,8 @@ output "admin_password" {
   sensitive   = true
 }
 '''
-    
-    # -------------------------------------------------------------------------
-    # Monitoring Module
-    # -------------------------------------------------------------------------
-    
-    def _generate_monitoring_main(self) -> str:
-        """Generate monitoring module main.tf."""
-        return '''# Monitoring Module (Log Analytics + Azure Monitor)
+
+_MONITORING_MAIN_TF = '''# Monitoring Module (Log Analytics + Azure Monitor)
 
 resource "azurerm_log_analytics_workspace" "main" {
   name                = "log-${var.resource_prefix}"
@@ -1499,10 +1686,8 @@ resource "azurerm_log_analytics_solution" "containers" {
   tags = var.tags
 }
 '''
-    
-    def _generate_monitoring_variables(self) -> str:
-        """Generate monitoring module variables.tf."""
-        return '''# Monitoring Module Variables
+
+_MONITORING_VARIABLES_TF = '''# Monitoring Module Variables
 
 variable "resource_group_name" {
   description = "Name of the resource group"
@@ -1531,10 +1716,8 @@ variable "tags" {
   default     = {}
 }
 '''
-    
-    def _generate_monitoring_outputs(self) -> str:
-        """Generate monitoring module outputs.tf."""
-        return '''# Monitoring Module Outputs
+
+_MONITORING_OUTPUTS_TF = '''# Monitoring Module Outputs
 
 output "log_analytics_workspace_id" {
   description = "Log Analytics workspace ID"
@@ -1558,6 +1741,15 @@ output "log_analytics_primary_key" {
 # Main interface for addon loader
 # ------------------------------------------------------------------
 
+def iter_files(
+    project_name: str,
+    description: str,
+    context: Optional[Dict[str, Any]] = None,
+) -> Iterator[Tuple[str, str]]:
+    """Streaming counterpart of main(): yield (filepath, content) pairs."""
+    return TerraformAKSGenerator(project_name, description, context).iter_files()
+
+
 def main(
     project_name: str,
     description: str,
@@ -1574,8 +1766,7 @@ def main(
     Returns:
         Dict of {filepath: content} for generated files
     """
-    generator = TerraformAKSGenerator(project_name, description, context)
-    return generator.generate()
+    return dict(iter_files(project_name, description, context))
 
 
 if __name__ == "__main__":
@@ -5,8 +5,12 @@ Scans the addons/ directory, matches triggers against analysis results,
 and loads addons in priority order.
 
 Zero external dependencies -- Python 3.9+ stdlib only.
+orjson is used to parse priority_chains.json when it is installed, and
+pyahocorasick (module ahocorasick) for keyword matching.
 """
 
+import compileall
+import heapq
 import importlib.util
 import json
 import logging
@@ -14,16 +18,41 @@ import os
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:  # optional speedup; per-keyword substring scan is the fallback
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# Loaded addon modules keyed by file path: (mtime, module). Module level so
+# the short-lived loaders created per project share it within a process.
+_MODULE_CACHE: Dict[Path, Tuple[float, Any]] = {}
+
 
 class AddonSpec:
     """Specification for an addon."""
 
+    __slots__ = (
+        "name",
+        "path",
+        "triggers",
+        "priority",
+        "description",
+        "interactive_only",
+        "keywords_lower",
+        "has_keywords",
+        "categories",
+        "platforms",
+        "gitops_tool",
+        "iac_tools",
+    )
+
     def __init__(
         self,
         name: str,
@@ -39,6 +68,14 @@ class AddonSpec:
         self.priority = priority
         self.description = description
         self.interactive_only = interactive_only
+        # Typed views of the triggers used by match_addons(); keywords are
+        # matched case-insensitively, so lowercase them once here
+        self.keywords_lower = tuple(k.lower() for k in triggers.get("keywords", []))
+        self.has_keywords = bool(self.keywords_lower)
+        self.categories = frozenset(triggers.get("categories", ()))
+        self.platforms = frozenset(triggers.get("platforms", ()))
+        self.gitops_tool = triggers.get("gitops_tool", "")
+        self.iac_tools = frozenset(triggers.get("iac_tools", ()))
 
     def __repr__(self) -> str:
         return f"AddonSpec(name={self.name}, priority={self.priority})"
@@ -63,7 +100,12 @@ class AddonLoader:
         self.addons_dir = self.base_path / "addons"
         self.config_file = self.base_path / "priority_chains.json"
         self.addon_specs: Dict[str, AddonSpec] = {}
+        # discover_addons() result, reused until addons/ changes on disk
+        self._discovered: Optional[List[AddonSpec]] = None
+        self._addons_dir_mtime: Optional[float] = None
+        self._rank: Dict[str, int] = {}
         self._load_addon_config()
+        self._build_trigger_index()
 
     def _load_addon_config(self):
         """Load addon configuration from priority_chains.json."""
@@ -72,9 +114,9 @@ class AddonLoader:
             return
 
         try:
-            with open(self.config_file, "r") as fh:
-                config = json.load(fh)
-        except json.JSONDecodeError as e:
+            raw = self.config_file.read_bytes()
+            config = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses it
             logger.error(f"Failed to parse config: {e}")
             return
 
@@ -96,28 +138,124 @@ class AddonLoader:
                 interactive_only=interactive_only,
             )
 
+    def _build_trigger_index(self):
+        """
+        Build inverted indexes from trigger values to addon specs.
+
+        match_addons() uses these to pick the few addons that can possibly
+        match a project before running the full trigger rules on them.
+        """
+        self._default_specs: List[AddonSpec] = []
+        self._by_gitops: Dict[str, List[AddonSpec]] = {}
+        self._by_iac: Dict[str, List[AddonSpec]] = {}
+        self._platform_to_specs: Dict[str, List[AddonSpec]] = {}
+        self._by_category: Dict[str, List[AddonSpec]] = {}
+        self._by_keyword: Dict[str, List[AddonSpec]] = {}
+
+        for spec in self.addon_specs.values():
+            triggers = spec.triggers
+            if triggers.get("default", False):
+                self._default_specs.append(spec)
+            if spec.gitops_tool:
+                self._by_gitops.setdefault(spec.gitops_tool, []).append(spec)
+            for iac_tool in spec.iac_tools:
+                self._by_iac.setdefault(iac_tool, []).append(spec)
+            for platform in spec.platforms:
+                self._platform_to_specs.setdefault(platform, []).append(spec)
+            for category in spec.categories:
+                self._by_category.setdefault(category, []).append(spec)
+            for keyword in spec.keywords_lower:
+                self._by_keyword.setdefault(keyword, []).append(spec)
+
+        # Every bucket is kept in priority order so match_addons() can merge
+        # them instead of sorting its result
+        self._default_specs.sort(key=lambda x: x.priority)
+        for index in (
+            self._by_gitops,
+            self._by_iac,
+            self._platform_to_specs,
+            self._by_category,
+            self._by_keyword,
+        ):
+            for bucket in index.values():
+                bucket.sort(key=lambda x: x.priority)
+
+        # One automaton reports every keyword occurrence in a single pass
+        self._keyword_automaton = None
+        if ahocorasick is not None and self._by_keyword:
+            automaton = ahocorasick.Automaton()
+            for keyword in self._by_keyword:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._keyword_automaton = automaton
+        self._default_names = frozenset(spec.name for spec in self._default_specs)
+
+    def _candidate_buckets(
+        self,
+        primary_category: str,
+        gitops_tool: str,
+        iac_tool: str,
+        platform: str,
+        full_text: str,
+    ) -> List[List[AddonSpec]]:
+        """
+        Trigger buckets holding every addon with at least one trigger that
+        fires for this project, each sorted in discovery order.
+        """
+        buckets = [
+            self._by_gitops.get(gitops_tool, []),
+            self._by_iac.get(iac_tool, []),
+            self._platform_to_specs.get(platform, []),
+            self._by_category.get(primary_category, []),
+        ]
+        if self._keyword_automaton is not None:
+            hits = {keyword for _, keyword in self._keyword_automaton.iter(full_text)}
+        else:
+            # Each distinct keyword is scanned once, however many addons share it
+            hits = [keyword for keyword in self._by_keyword if keyword in full_text]
+        buckets.extend(self._by_keyword[keyword] for keyword in hits)
+        return buckets
+
     def discover_addons(self) -> List[AddonSpec]:
         """
         Discover all available addons in the addons/ directory.
         Returns list of AddonSpec objects sorted by priority.
-        """
-        discovered = []
 
-        if not self.addons_dir.exists():
+        The scan is cached per loader and repeated only when the addons/
+        directory's mtime changes (an addon file added, removed or renamed).
+        """
+        try:
+            mtime = os.stat(self.addons_dir).st_mtime
+        except OSError:
             logger.warning(f"Addons directory not found: {self.addons_dir}")
-            return discovered
+            self._discovered = None
+            return []
 
-        for addon_file in self.addons_dir.glob("*.py"):
-            if addon_file.name.startswith("_"):
-                continue
+        if self._discovered is not None and mtime == self._addons_dir_mtime:
+            return list(self._discovered)
+
+        discovered = []
+
+        # One directory read instead of a glob plus a stat per addon
+        with os.scandir(self.addons_dir) as entries:
+            addon_files = [
+                entry.name
+                for entry in entries
+                if entry.name.endswith(".py")
+                and not entry.name.startswith(("_", "."))
+                and entry.is_file()
+            ]
 
-            addon_name = addon_file.stem
+        for file_name in addon_files:
+            addon_file = self.addons_dir / file_name
+            addon_name = file_name[:-3]
 
             # Use config if available, otherwise create basic spec
             if addon_name in self.addon_specs:
                 spec = self.addon_specs[addon_name]
-                # Verify file exists
-                if spec.path.exists():
+                # The listing already proves the default path exists; only
+                # configs pointing somewhere else need a stat
+                if spec.path == addon_file or spec.path.exists():
                     discovered.append(spec)
             else:
                 # Auto-discover addon not in config
@@ -132,7 +270,25 @@ class AddonLoader:
                 )
 
         # Sort by priority (lower = higher priority)
-        return sorted(discovered, key=lambda x: x.priority)
+        self._discovered = sorted(discovered, key=lambda x: x.priority)
+        self._addons_dir_mtime = mtime
+
+        # Ties on priority go to the earlier discovered addon; order the
+        # trigger buckets the same way so merging them needs no final sort
+        self._rank = {spec.name: i for i, spec in enumerate(self._discovered)}
+        unlisted = len(self._rank)
+        rank_of = lambda x: self._rank.get(x.name, unlisted)  # noqa: E731
+        self._default_specs.sort(key=rank_of)
+        for index in (
+            self._by_gitops,
+            self._by_iac,
+            self._platform_to_specs,
+            self._by_category,
+            self._by_keyword,
+        ):
+            for bucket in index.values():
+                bucket.sort(key=rank_of)
+        return list(self._discovered)
 
     def match_addons(
         self,
@@ -152,55 +308,96 @@ class AddonLoader:
             List of matched AddonSpec objects, sorted by priority
         """
         context = context or {}
-        matched = []
+        # Insertion-ordered and keyed by name, so duplicates collapse as added
+        matched: Dict[str, AddonSpec] = {}
+        discovered = self.discover_addons()
+        # Position in the priority-sorted discovery list
+        rank = self._rank if discovered else {}
 
         primary_category = analysis.get("primary_category", "")
         gitops_tool = context.get("gitops_tool", "")
         iac_tool = context.get("iac_tool", "")
         platform = context.get("platform", "")
         sizing_context = context.get("sizing_context") or {}
+        full_text = (
+            f"{analysis.get('project_name', '')} {analysis.get('description', '')}"
+        ).lower()
+
+        sizing_report = sizing_context.get("source") == "sizing_report"
+
+        # Default addons: only the gitops/IaC filters can exclude them
+        for spec in self._default_specs:
+            if spec.name not in rank:
+                continue
+            if spec.name == "eck_deployment" and sizing_report:
+                matched.setdefault(spec.name, spec)
+                continue
+            if spec.interactive_only and not interactive_mode:
+                continue
+            trigger_gitops = spec.gitops_tool
+            trigger_iac_tools = spec.iac_tools
+            # If gitops_tool is "none", skip addons with a gitops_tool trigger
+            if gitops_tool == "none" and trigger_gitops:
+                continue
+            # If gitops_tool is set and doesn't match, skip
+            if gitops_tool and trigger_gitops and trigger_gitops != gitops_tool:
+                continue
+            if trigger_iac_tools and iac_tool not in trigger_iac_tools:
+                continue
+            matched.setdefault(spec.name, spec)
+
+        # With no category, context or text to trigger on, only the defaults
+        # can match; skip the trigger buckets entirely
+        if not (
+            primary_category
+            or gitops_tool
+            or iac_tool
+            or platform
+            or sizing_report
+            or full_text.strip()
+        ):
+            return list(matched.values())
+
+        # Addons outside every trigger bucket can never match. The buckets are
+        # already in discovery order, so merging them yields the candidates in
+        # final order.
+        buckets = self._candidate_buckets(
+            primary_category, gitops_tool, iac_tool, platform, full_text
+        )
+        if sizing_report and "eck_deployment" in rank:
+            buckets.append([discovered[rank["eck_deployment"]]])
+        defaults = list(matched.values())
+        matched = {}
+        seen = set(self._default_names)
+
+        unlisted = len(rank)
+        for spec in heapq.merge(*buckets, key=lambda x: rank.get(x.name, unlisted)):
+            if spec.name in seen or spec.name not in rank:
+                continue
+            seen.add(spec.name)
 
-        for spec in self.discover_addons():
             # If sizing report context exists, always include ECK addon.
             # This ensures ES/ECK scaffolding is generated even when the
             # free-text description does not classify as "elasticsearch".
-            if (
-                spec.name == "eck_deployment"
-                and sizing_context.get("source") == "sizing_report"
-            ):
-                matched.append(spec)
+            if spec.name == "eck_deployment" and sizing_report:
+                matched.setdefault(spec.name, spec)
                 continue
 
             # Skip interactive-only addons if not in interactive mode
             if spec.interactive_only and not interactive_mode:
                 continue
 
-            triggers = spec.triggers
-            trigger_gitops = triggers.get("gitops_tool", "")
-            trigger_iac_tools = triggers.get("iac_tools", [])
-            trigger_platforms = triggers.get("platforms", [])
-            trigger_categories = triggers.get("categories", [])
-            trigger_keywords = triggers.get("keywords", [])
-
-            # Check for default trigger
-            if triggers.get("default", False):
-                # If gitops_tool is "none", skip addons with a gitops_tool trigger
-                if gitops_tool == "none" and trigger_gitops:
-                    continue
-                # If gitops_tool is set and doesn't match, skip
-                if gitops_tool and trigger_gitops and trigger_gitops != gitops_tool:
-                    continue
-                if trigger_iac_tools and iac_tool not in trigger_iac_tools:
-                    continue
-                matched.append(spec)
-                continue
+            trigger_gitops = spec.gitops_tool
+            trigger_iac_tools = spec.iac_tools
+            trigger_platforms = spec.platforms
+            trigger_categories = spec.categories
 
             # Check IaC-only trigger
             if trigger_iac_tools and iac_tool in trigger_iac_tools:
                 has_other_triggers = bool(
                     trigger_platforms
                     or trigger_categories
-                    or trigger_keywords
+                    or spec.has_keywords
                     or trigger_gitops
                 )
                 if has_other_triggers:
@@ -210,7 +407,7 @@ class AddonLoader:
                 # Respect gitops filter if present
                     if trigger_gitops and trigger_gitops != gitops_tool:
                         continue
-                    matched.append(spec)
+                    matched.setdefault(spec.name, spec)
                     continue
 
             # If gitops_tool is explicitly set in context, filter GitOps addons
@@ -221,14 +418,14 @@ class AddonLoader:
                     continue
                 if trigger_gitops == gitops_tool:
                     # Exact gitops_tool match
-                    matched.append(spec)
+                    matched.setdefault(spec.name, spec)
                     continue
 
             # Check platform trigger
             if trigger_platforms and platform in trigger_platforms:
                 if trigger_iac_tools and iac_tool not in trigger_iac_tools:
                     continue
-                matched.append(spec)
+                matched.setdefault(spec.name, spec)
                 continue
 
             # Check category triggers (skip if addon has gitops_tool trigger and we have gitops set)
@@ -240,32 +437,38 @@ class AddonLoader:
                 if primary_category in trigger_categories:
                     if trigger_iac_tools and iac_tool not in trigger_iac_tools:
                         continue
-                    matched.append(spec)
+                    matched.setdefault(spec.name, spec)
                     continue
 
             # Check keyword triggers
-            if trigger_keywords:
-                description = analysis.get("description", "").lower()
-                project_name = analysis.get("project_name", "").lower()
-                full_text = f"{project_name} {description}"
-
-                for keyword in trigger_keywords:
-                    if keyword.lower() in full_text:
-                        if trigger_iac_tools and iac_tool not in trigger_iac_tools:
-                            break
-                        matched.append(spec)
-                        break
-
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_matched = []
-        for spec in matched:
-            if spec.name not in seen:
-                seen.add(spec.name)
-                unique_matched.append(spec)
-
-        # Sort by priority
-        return sorted(unique_matched, key=lambda x: x.priority)
+            if not spec.has_keywords:
+                continue
+            if any(k in full_text for k in spec.keywords_lower):
+                if trigger_iac_tools and iac_tool not in trigger_iac_tools:
+                    continue
+                matched.setdefault(spec.name, spec)
+
+        # Both lists are in discovery order; interleave them
+        return list(
+            heapq.merge(defaults, matched.values(), key=lambda x: rank[x.name])
+        )
+
+    def prewarm(self) -> bool:
+        """
+        Byte-compile every addon into addons/__pycache__.
+
+        load_addon() then execs the cached .pyc instead of parsing source.
+        Meant to run once after install; addons/__pycache__ must be writable.
+        Returns True if every addon compiled.
+        """
+        if not self.addons_dir.is_dir():
+            logger.warning(f"Addons directory not found: {self.addons_dir}")
+            return False
+        return bool(
+            compileall.compile_dir(
+                str(self.addons_dir), maxlevels=0, quiet=1, workers=0
+            )
+        )
 
     def load_addon(self, spec: AddonSpec) -> Optional[Any]:
         """
@@ -276,11 +479,20 @@ class AddonLoader:
 
         Returns:
             Loaded module or None if loading failed
+
+        Modules are cached per file and reused until the file's mtime
+        changes, so repeated runs in one process skip re-executing them.
         """
-        if not spec.path.exists():
+        try:
+            mtime = spec.path.stat().st_mtime
+        except OSError:
             logger.warning(f"Addon file not found: {spec.path}")
             return None
 
+        cached = _MODULE_CACHE.get(spec.path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
         try:
             module_spec = importlib.util.spec_from_file_location(
                 spec.name, str(spec.path)
@@ -291,12 +503,14 @@ class AddonLoader:
 
             module = importlib.util.module_from_spec(module_spec)
             module_spec.loader.exec_module(module)
-            return module
 
         except Exception as e:
             logger.error(f"Failed to load addon {spec.name}: {e}")
             return None
 
+        _MODULE_CACHE[spec.path] = (mtime, module)
+        return module
+
     def run_addon(
         self,
         spec: AddonSpec,
@@ -316,32 +530,48 @@ class AddonLoader:
         Returns:
             Dict of {filepath: content} for generated files
         """
+        return dict(self._addon_files(spec, project_name, description, context))
+
+    def _addon_files(
+        self,
+        spec: AddonSpec,
+        project_name: str,
+        description: str,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> List[Tuple[str, str]]:
+        """
+        Run a single addon and return its files as (filepath, content) pairs.
+
+        Addons exposing a module-level iter_files() stream their pairs without
+        building an intermediate dict. An addon that fails part-way
+        contributes no files.
+        """
         module = self.load_addon(spec)
         if module is None:
-            return {}
+            return []
 
         context = context or {}
 
         try:
+            # Streaming interface
+            if hasattr(module, "iter_files"):
+                return list(module.iter_files(project_name, description, context))
+
             # Try the standard main() interface first
             if hasattr(module, "main"):
-                return module.main(project_name, description, context)
+                return list(module.main(project_name, description, context).items())
 
             # Try generator class interface
             if hasattr(module, "ADDON_META") and hasattr(module, "AddonGenerator"):
                 generator = module.AddonGenerator(project_name, description, context)
-                return generator.generate()
-
-            # Fallback: try main with just name and description
-            if hasattr(module, "main"):
-                return module.main(project_name, description)
+                return list(generator.generate().items())
 
             logger.warning(f"Addon {spec.name} has no recognized interface")
-            return {}
+            return []
 
         except Exception as e:
             logger.error(f"Error running addon {spec.name}: {e}")
-            return {}
+            return []
 
     def run_addons(
         self,
@@ -366,12 +596,22 @@ class AddonLoader:
 
         for spec in specs:
             logger.info(f"Running addon: {spec.name}")
-            files = self.run_addon(spec, project_name, description, context)
 
-            # Merge files, later addons can override earlier ones
-            for filepath, content in files.items():
+        results = [
+            self._addon_files(spec, project_name, description, context)
+            for spec in specs
+        ]
+
+        # Overrides are only reported at DEBUG; below that, merge in bulk
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for spec, files in zip(specs, results):
+            # Merge files in spec order, later addons can override earlier ones
+            if not debug:
+                all_files.update(files)
+                continue
+            for filepath, content in files:
                 if filepath in all_files:
-                    logger.debug(f"Addon {spec.name} overriding {filepath}")
+                    logger.debug("Addon %s overriding %s", spec.name, filepath)
                 all_files[filepath] = content
 
         return all_files
@@ -406,6 +646,9 @@ def run_matched_addons(
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
     # Test addon discovery
     loader = AddonLoader()
     print("Discovered addons:")
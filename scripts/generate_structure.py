@@ -7,70 +7,91 @@ Zero external dependencies -- uses only Python stdlib.
 """
 
 import datetime
+import functools
 import logging
 import os
+import re
+import string
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Optional, Set, Tuple
 
 # Ensure sibling module is importable
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-from project_analyzer import ProjectAnalyzer, analyze_project  # noqa: E402
+from project_analyzer import analyze_project, get_analyzer  # noqa: E402
 from addon_loader import AddonLoader, run_matched_addons  # noqa: E402
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
-
 
 # ------------------------------------------------------------------
 # Template helpers
 # ------------------------------------------------------------------
 
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+
+def _freeze_context(context: Dict) -> Tuple[Tuple[str, str], ...]:
+    """Hashable (key, rendered value) pairs; list values are comma-joined."""
+    return tuple(
+        (key, ", ".join(str(v) for v in value) if isinstance(value, list) else str(value))
+        for key, value in context.items()
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_template(template_content: str) -> Tuple[str, ...]:
+    """Split a template into literal text at even and placeholder names at odd indexes."""
+    return tuple(_PLACEHOLDER_RE.split(template_content))
+
+
+@functools.lru_cache(maxsize=512)
+def _render_cached(template_content: str, frozen_context: Tuple[Tuple[str, str], ...]) -> str:
+    # Templates are parsed once; rendering is dict lookups and one join.
+    # Unknown placeholders are left as they are.
+    values = dict(frozen_context)
+    parts = list(_compile_template(template_content))
+    for i in range(1, len(parts), 2):
+        parts[i] = values.get(parts[i], "{{" + parts[i] + "}}")
+    return "".join(parts)
+
+
+class _SafeDict(dict):
+    """format_map() mapping that leaves unknown {fields} in place."""
+
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
 
 def render_template(template_content: str, context: Dict) -> str:
     """Simple {{var}} replacement -- no Jinja2 needed."""
-    rendered = template_content
-    for key, value in context.items():
-        placeholder = "{{" + key + "}}"
-        if isinstance(value, list):
-            rendered = rendered.replace(placeholder, ", ".join(str(v) for v in value))
-        else:
-            rendered = rendered.replace(placeholder, str(value))
-    return rendered
+    if "{{" not in template_content:
+        return template_content
+    return _render_cached(template_content, _freeze_context(context))
 
 
 def prepare_template_context(analysis_result: Dict) -> Dict:
     """Pre-render list variables into strings so templates need only {{var}} placeholders."""
     skills = analysis_result.get("assigned_skills", [])
     primary = analysis_result.get("primary_skill") or "Unknown"
-    secondary = [s for s in skills if s != primary]
     project_name = analysis_result.get("project_name", "project")
 
-    # Pre-render secondary skills as markdown list
-    if secondary:
-        secondary_list = "\n".join(
-            f"- **{s}**: Supplementary expertise" for s in secondary
-        )
-    else:
-        secondary_list = "- (none)"
-
-    # Pre-render skill load commands (secondary only)
-    if secondary:
-        load_cmds = "\n".join(f"load skill {s}" for s in secondary)
-    else:
-        load_cmds = "# (no secondary skills)"
-
-    # Pre-render full skill load commands (all skills)
-    if skills:
-        load_cmds_full = "\n".join(f"load skill {s}" for s in skills)
-    else:
-        load_cmds_full = "# (no skills assigned)"
+    # One pass over the skills builds every pre-rendered skill list:
+    # secondary skills as a markdown list, and skill load commands for the
+    # secondary skills and for all of them
+    secondary_lines, load_lines, load_lines_full = [], [], []
+    for s in skills:
+        load_cmd = f"load skill {s}"
+        load_lines_full.append(load_cmd)
+        if s != primary:
+            secondary_lines.append(f"- **{s}**: Supplementary expertise")
+            load_lines.append(load_cmd)
+    secondary_list = "\n".join(secondary_lines) or "- (none)"
+    load_cmds = "\n".join(load_lines) or "# (no secondary skills)"
+    load_cmds_full = "\n".join(load_lines_full) or "# (no skills assigned)"
 
     # Primary skill capabilities
-    analyzer = ProjectAnalyzer()
+    analyzer = get_analyzer()
     caps = analyzer.skill_mapping.get(primary, {}).get("capabilities", [])
     if caps:
         caps_text = ", ".join(caps)
@@ -113,44 +134,89 @@ def prepare_template_context(analysis_result: Dict) -> Dict:
 # ------------------------------------------------------------------
 
 
-def create_project_structure(base_path: str, structure: List[str]) -> List[str]:
+def _make_dirs(dirs: Set[str], created_dirs: Optional[Set[str]] = None) -> None:
+    """
+    Create each directory once, parents before children.
+
+    created_dirs records directories already made during this run; it is
+    consulted and updated so a caller sharing it never re-creates one.
+    """
+    dirs = {os.path.normpath(d) for d in dirs if d}
+    if created_dirs is not None:
+        dirs -= created_dirs
+        created_dirs.update(dirs)
+    for directory in sorted(dirs, key=len):
+        os.makedirs(directory, exist_ok=True)
+
+
+def create_project_structure(
+    base_path: str, structure: List[str], created_dirs: Optional[Set[str]] = None
+) -> List[str]:
     """Create directory structure. Items ending with / are dirs, else files."""
-    created = []
-    for item in structure:
-        item_path = os.path.join(base_path, item)
+    created = [os.path.join(base_path, item) for item in structure]
+
+    _make_dirs(
+        {
+            item_path if item.endswith("/") else os.path.dirname(item_path)
+            for item, item_path in zip(structure, created)
+        },
+        created_dirs,
+    )
+
+    for item, item_path in zip(structure, created):
         if item.endswith("/"):
-            os.makedirs(item_path, exist_ok=True)
-        else:
-            parent = os.path.dirname(item_path)
-            if parent:
-                os.makedirs(parent, exist_ok=True)
-            if not os.path.exists(item_path):
-                with open(item_path, "w") as fh:
-                    fh.write("")
-        created.append(item_path)
+            continue
+        # Single create-if-absent syscall; no file object needed for a stub
+        try:
+            fd = os.open(item_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        except FileExistsError:
+            continue
+        os.close(fd)
     return created
 
 
-def generate_readme(base_path: str, context: Dict, template_path: str) -> str:
-    """Render and write README.md."""
+def _write_file(path: str, content: str) -> None:
+    Path(path).write_text(content, encoding="utf-8")
+
+
+def write_files(files: Dict[str, str], created_dirs: Optional[Set[str]] = None) -> None:
+    """Write {path: content} pairs, creating each parent directory once."""
+    _make_dirs({os.path.dirname(path) for path in files}, created_dirs)
+    for path, content in files.items():
+        _write_file(path, content)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_template(template_path: str, mtime_ns: int) -> str:
+    return Path(template_path).read_text(encoding="utf-8")
+
+
+def _read_template(template_path: str) -> str:
+    """Read a template file, reusing the last read until its mtime changes."""
+    return _load_template(template_path, os.stat(template_path).st_mtime_ns)
+
+
+def render_readme(context: Dict, template_path: str) -> str:
+    """Render README.md."""
     try:
-        with open(template_path, "r") as fh:
-            template = fh.read()
+        template = _read_template(template_path)
     except FileNotFoundError:
         template = "# {{project_name}}\n\n{{project_description}}\n"
 
-    content = render_template(template, context)
+    return render_template(template, context)
+
+
+def generate_readme(base_path: str, context: Dict, template_path: str) -> str:
+    """Render and write README.md."""
     out = os.path.join(base_path, "README.md")
-    with open(out, "w") as fh:
-        fh.write(content)
+    write_files({out: render_readme(context, template_path)})
     return out
 
 
-def generate_agents_doc(base_path: str, context: Dict, template_path: str) -> str:
-    """Render and write AGENTS.md."""
+def render_agents_doc(context: Dict, template_path: str) -> str:
+    """Render AGENTS.md."""
     try:
-        with open(template_path, "r") as fh:
-            template = fh.read()
+        template = _read_template(template_path)
     except FileNotFoundError:
         template = (
             "# Agent Coordination Guide\n\n"
@@ -164,133 +230,102 @@ def generate_agents_doc(base_path: str, context: Dict, template_path: str) -> st
             "```\n{{skill_load_commands_full}}\n```\n"
         )
 
-    content = render_template(template, context)
+    return render_template(template, context)
+
+
+def generate_agents_doc(base_path: str, context: Dict, template_path: str) -> str:
+    """Render and write AGENTS.md."""
     out = os.path.join(base_path, "AGENTS.md")
-    with open(out, "w") as fh:
-        fh.write(content)
+    write_files({out: render_agents_doc(context, template_path)})
     return out
 
 
-def generate_basic_files(base_path: str, context: Dict) -> List[str]:
-    """Generate .gitignore, starter Terraform, and K8s files."""
-    generated = []
+def render_basic_files(base_path: str, context: Dict) -> Dict[str, str]:
+    """Render .gitignore, starter Terraform, and K8s files, keyed by output path."""
+    files = {}
 
     # .gitignore
-    gitignore = os.path.join(base_path, ".gitignore")
-    with open(gitignore, "w") as fh:
-        fh.write(
-            ".opencode/\n.venv/\n__pycache__/\n*.pyc\nenv/\nvenv/\n"
-            ".vscode/\n.idea/\n*.swp\n.DS_Store\nThumbs.db\n"
-        )
-    generated.append(gitignore)
+    files[os.path.join(base_path, ".gitignore")] = (
+        ".opencode/\n.venv/\n__pycache__/\n*.pyc\nenv/\nvenv/\n"
+        ".vscode/\n.idea/\n*.swp\n.DS_Store\nThumbs.db\n"
+    )
+
+    # The built-in templates below use str.format syntax ({name}, literal
+    # braces doubled); {{var}} rendering is kept for user-editable templates
+    values = _SafeDict(context)
 
     # Terraform starters
     tf_dir = os.path.join(base_path, "terraform")
     if os.path.isdir(tf_dir):
-        main_tf = os.path.join(tf_dir, "main.tf")
-        with open(main_tf, "w") as fh:
-            fh.write(
-                render_template(
-                    "# Terraform configuration for {{project_name}}\n\n"
-                    'terraform {\n  required_version = ">= 1.0"\n}\n',
-                    context,
-                )
-            )
-        generated.append(main_tf)
-
-        vars_tf = os.path.join(tf_dir, "variables.tf")
-        with open(vars_tf, "w") as fh:
-            fh.write(
-                render_template(
-                    '# Input variables\n\nvariable "project_name" {\n'
-                    '  description = "Project name"\n  type        = string\n'
-                    '  default     = "{{project_name}}"\n}\n\n'
-                    'variable "environment" {\n  description = "Environment"\n'
-                    '  type        = string\n  default     = "dev"\n}\n',
-                    context,
-                )
-            )
-        generated.append(vars_tf)
+        files[os.path.join(tf_dir, "main.tf")] = (
+            "# Terraform configuration for {project_name}\n\n"
+            'terraform {{\n  required_version = ">= 1.0"\n}}\n'
+        ).format_map(values)
+        files[os.path.join(tf_dir, "variables.tf")] = (
+            '# Input variables\n\nvariable "project_name" {{\n'
+            '  description = "Project name"\n  type        = string\n'
+            '  default     = "{project_name}"\n}}\n\n'
+            'variable "environment" {{\n  description = "Environment"\n'
+            '  type        = string\n  default     = "dev"\n}}\n'
+        ).format_map(values)
 
     # K8s namespace
     k8s_dir = os.path.join(base_path, "k8s")
     if os.path.isdir(k8s_dir):
-        ns = os.path.join(k8s_dir, "namespace.yaml")
-        with open(ns, "w") as fh:
-            fh.write(
-                render_template(
-                    "apiVersion: v1\nkind: Namespace\nmetadata:\n"
-                    "  name: {{project_name}}\n  labels:\n"
-                    "    project: {{project_name}}\n",
-                    context,
-                )
-            )
-        generated.append(ns)
+        files[os.path.join(k8s_dir, "namespace.yaml")] = (
+            "apiVersion: v1\nkind: Namespace\nmetadata:\n"
+            "  name: {project_name}\n  labels:\n"
+            "    project: {project_name}\n"
+        ).format_map(values)
 
-    return generated
+    return files
 
 
-def generate_opencode_context(base_path: str, context: Dict) -> str:
-    """Generate .opencode/context.md for session bootstrap."""
-    opencode_dir = os.path.join(base_path, ".opencode")
-    os.makedirs(opencode_dir, exist_ok=True)
-
-    # Build context file content
-    skills = context.get("assigned_skills", [])
-    primary_skill = context.get("primary_skill", "")
-    platform = context.get("platform", "")
-    gitops_tool = context.get("gitops_tool", "")
+def generate_basic_files(base_path: str, context: Dict) -> List[str]:
+    """Generate .gitignore, starter Terraform, and K8s files."""
+    files = render_basic_files(base_path, context)
+    write_files(files)
+    return list(files)
 
-    # Build ambiguity note if categories are close
-    ambiguous = context.get("ambiguous_categories", [])
-    if ambiguous:
-        ambiguity_note = (
-            f"\n> **Note:** Category classification is ambiguous. "
-            f"The following categories scored within 1 point of the primary "
-            f"category (`{context.get('primary_category', 'generic')}`): "
-            f"{', '.join(f'`{c}`' for c in ambiguous)}. "
-            f"Consider reviewing the priority chain if results seem off.\n"
-        )
-    else:
-        ambiguity_note = ""
 
-    content = f"""# OpenCode Session Context
+_OPENCODE_CONTEXT_TPL = string.Template(
+    """# OpenCode Session Context
 
-## Project: {context.get("project_name", "Unknown")}
+## Project: ${project_name}
 
-{context.get("project_description", "")}
-{ambiguity_note}
+${project_description}
+${ambiguity_note}
 ## Active Skills
 
 Primary skill for this project:
 
 ```
-load skill {primary_skill}
+load skill ${primary_skill}
 ```
 
 ### All Assigned Skills
 
-{context.get("skill_load_commands_full", "# (no skills assigned)")}
+${skill_load_commands_full}
 
 ## Project Configuration
 
 | Setting | Value |
 |---------|-------|
-| Category | {context.get("primary_category", "generic")} |
-| Priority Chain | {context.get("priority_chain", "default")} |
-| Platform | {context.get("platform_display", "Not specified")} |
-| GitOps Tool | {context.get("gitops_display", "Not specified")} |
+| Category | ${primary_category} |
+| Priority Chain | ${priority_chain} |
+| Platform | ${platform_display} |
+| GitOps Tool | ${gitops_display} |
 
 ## Quick Reference
 
 ### Primary Skill Capabilities
 
-{context.get("primary_skill_capabilities", "General-purpose DevOps capabilities")}
+${primary_skill_capabilities}
 
 ### Project Structure
 
 ```
-{context.get("project_structure_tree", "(no structure)")}
+${project_structure_tree}
 ```
 
 ## Session Notes
@@ -299,12 +334,49 @@ load skill {primary_skill}
 
 ---
 
-*Generated by project-initializer on {context.get("timestamp", "unknown")}*
+*Generated by project-initializer on ${timestamp}*
 """
+)
 
-    out = os.path.join(opencode_dir, "context.md")
-    with open(out, "w") as fh:
-        fh.write(content)
+# Fallbacks for context keys the .opencode/context.md template reads
+_OPENCODE_CONTEXT_DEFAULTS = {
+    "project_name": "Unknown",
+    "project_description": "",
+    "primary_skill": "",
+    "skill_load_commands_full": "# (no skills assigned)",
+    "primary_category": "generic",
+    "priority_chain": "default",
+    "platform_display": "Not specified",
+    "gitops_display": "Not specified",
+    "primary_skill_capabilities": "General-purpose DevOps capabilities",
+    "project_structure_tree": "(no structure)",
+    "timestamp": "unknown",
+}
+
+
+def render_opencode_context(context: Dict) -> str:
+    """Render .opencode/context.md for session bootstrap."""
+    # Build ambiguity note if categories are close
+    ambiguous = context.get("ambiguous_categories", [])
+    if ambiguous:
+        ambiguity_note = (
+            f"\n> **Note:** Category classification is ambiguous. "
+            f"The following categories scored within 1 point of the primary "
+            f"category (`{context.get('primary_category', 'generic')}`): "
+            f"{', '.join(f'`{c}`' for c in ambiguous)}. "
+            f"Consider reviewing the priority chain if results seem off.\n"
+        )
+    else:
+        ambiguity_note = ""
+
+    values = {**_OPENCODE_CONTEXT_DEFAULTS, **context, "ambiguity_note": ambiguity_note}
+    return _OPENCODE_CONTEXT_TPL.safe_substitute(values)
+
+
+def generate_opencode_context(base_path: str, context: Dict) -> str:
+    """Generate .opencode/context.md for session bootstrap."""
+    out = os.path.join(base_path, ".opencode", "context.md")
+    write_files({out: render_opencode_context(context)})
     return out
 
 
@@ -312,6 +384,29 @@ load skill {primary_skill}
 # Main entry point
 # ------------------------------------------------------------------
 
+# Display names for the platform / GitOps / IaC selections
+_PLATFORM_DISPLAY = MappingProxyType(
+    {
+        "rke2": "RKE2 + ECK",
+        "openshift": "OpenShift 4.x + ECK",
+        "aks": "AKS + ECK",
+        "proxmox": "Proxmox VE + RKE2/ECK",
+    }
+)
+_GITOPS_DISPLAY = MappingProxyType(
+    {
+        "flux": "FluxCD",
+        "argo": "ArgoCD",
+        "none": "None (raw manifests)",
+    }
+)
+_IAC_DISPLAY = MappingProxyType(
+    {
+        "terraform": "Terraform",
+        "none": "None",
+    }
+)
+
 
 def initialize_project(
     project_name: str,
@@ -344,16 +439,21 @@ def initialize_project(
         target_revision: Git branch/revision used by GitOps manifests
         forced_chain: Override the priority chain selection
     """
+    # Renders are only reused within one project
+    _render_cached.cache_clear()
+
     if not target_directory:
         target_directory = "./" + project_name
 
     os.makedirs(target_directory, exist_ok=True)
+    # Directories made so far, shared by every write below
+    created_dirs = {os.path.normpath(target_directory)}
 
     analysis = analyze_project(project_name, description, focus_areas)
 
     # Apply forced_chain override if provided (recalculates skills)
     if forced_chain:
-        analyzer = ProjectAnalyzer()
+        analyzer = get_analyzer()
         analysis = analyzer.override_chain(analysis, forced_chain)
 
     context = prepare_template_context(analysis)
@@ -361,33 +461,21 @@ def initialize_project(
     # Add platform and gitops context for templates
     if platform:
         context["platform"] = platform
-        context["platform_display"] = {
-            "rke2": "RKE2 + ECK",
-            "openshift": "OpenShift 4.x + ECK",
-            "aks": "AKS + ECK",
-            "proxmox": "Proxmox VE + RKE2/ECK",
-        }.get(platform, platform)
+        context["platform_display"] = _PLATFORM_DISPLAY.get(platform, platform)
     else:
         context["platform"] = ""
         context["platform_display"] = ""
 
     if gitops_tool:
         context["gitops_tool"] = gitops_tool
-        context["gitops_display"] = {
-            "flux": "FluxCD",
-            "argo": "ArgoCD",
-            "none": "None (raw manifests)",
-        }.get(gitops_tool, gitops_tool)
+        context["gitops_display"] = _GITOPS_DISPLAY.get(gitops_tool, gitops_tool)
     else:
         context["gitops_tool"] = ""
         context["gitops_display"] = ""
 
     if iac_tool:
         context["iac_tool"] = iac_tool
-        context["iac_tool_display"] = {
-            "terraform": "Terraform",
-            "none": "None",
-        }.get(iac_tool, iac_tool)
+        context["iac_tool_display"] = _IAC_DISPLAY.get(iac_tool, iac_tool)
     else:
         context["iac_tool"] = ""
         context["iac_tool_display"] = ""
@@ -404,29 +492,32 @@ def initialize_project(
 
     # Create directories/files
     structure = analysis.get("project_structure", [])
-    created = create_project_structure(target_directory, structure)
+    created = create_project_structure(target_directory, structure, created_dirs)
 
     # Template paths
     tmpl_base = Path(__file__).resolve().parent.parent / "templates"
     custom = custom_templates or {}
 
-    readme = generate_readme(
-        target_directory,
-        context,
-        custom.get("README.md", str(tmpl_base / "README_template.md")),
-    )
-    agents = generate_agents_doc(
-        target_directory,
-        context,
-        custom.get("AGENTS.md", str(tmpl_base / "AGENTS_template.md")),
-    )
-    config_files = generate_basic_files(target_directory, context)
-
-    # Generate .opencode/context.md for session bootstrap
-    opencode_context = generate_opencode_context(target_directory, context)
+    # Render everything first, then write it in one batch
+    readme = os.path.join(target_directory, "README.md")
+    agents = os.path.join(target_directory, "AGENTS.md")
+    opencode_context = os.path.join(target_directory, ".opencode", "context.md")
+    config_files = render_basic_files(target_directory, context)
+    pending = {
+        readme: render_readme(
+            context, custom.get("README.md", str(tmpl_base / "README_template.md"))
+        ),
+        agents: render_agents_doc(
+            context, custom.get("AGENTS.md", str(tmpl_base / "AGENTS_template.md"))
+        ),
+        **config_files,
+        # .opencode/context.md for session bootstrap
+        opencode_context: render_opencode_context(context),
+    }
+    write_files(pending, created_dirs)
 
     # Addon autodiscovery and loading
-    generated_files = [readme, agents, opencode_context] + config_files
+    generated_files = [readme, agents, opencode_context] + list(config_files)
 
     # Build context for addon matching
     addon_context = {
@@ -452,12 +543,15 @@ def initialize_project(
         )
 
         # Write addon-generated files to disk
-        for filepath, content in addon_files.items():
-            full_path = os.path.join(target_directory, filepath)
-            os.makedirs(os.path.dirname(full_path), exist_ok=True)
-            with open(full_path, "w") as f:
-                f.write(content)
-            generated_files.append(full_path)
+        write_files(
+            {
+                os.path.join(target_directory, filepath): content
+                for filepath, content in addon_files.items()
+            },
+            created_dirs,
+        )
+        for filepath in addon_files:
+            generated_files.append(os.path.join(target_directory, filepath))
             logging.info(f"Generated addon file: {filepath}")
 
     except Exception as e:
@@ -485,6 +579,9 @@ def initialize_project(
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
     result = initialize_project(
         "test-project",
         "Test project for project initialization",
@@ -5,7 +5,7 @@ CLI entry point for the project-initializer skill.
 Usage:
     python3 init_project.py --name NAME --desc DESC [--type TYPE] [--target DIR] \
                             [--analyze-only] [--chain CHAIN] [--json] [--git-init] \
-                            [--sizing-file FILE]
+                            [--sizing-file FILE] [--prewarm]
 
 Zero external dependencies -- Python 3.9+ stdlib only.
 """
@@ -21,20 +21,11 @@ from pathlib import Path
 # Ensure sibling module is importable
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-from project_analyzer import ProjectAnalyzer, analyze_project  # noqa: E402
-from generate_structure import initialize_project  # noqa: E402
-from sizing_parser import parse_sizing_file  # noqa: E402
+from project_analyzer import analyze_project, get_analyzer  # noqa: E402
 
 # Skill directory for addons
 SKILL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-
-
 VALID_TYPES = ["elasticsearch", "kubernetes", "terraform", "azure", "gitops"]
 
 TYPE_DESCRIPTIONS = {
@@ -99,6 +90,11 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Path to ES sizing export file (.json contract preferred, .md supported for legacy)",
     )
+    parser.add_argument(
+        "--prewarm",
+        action="store_true",
+        help="Byte-compile the addons once after install, then exit",
+    )
     return parser
 
 
@@ -113,14 +109,10 @@ def run_analyze_only(name: str, desc: str, forced_type: str | None, forced_chain
 
     # Override chain if forced
     if forced_chain:
-        analyzer = ProjectAnalyzer()
+        analyzer = get_analyzer()
         if forced_chain in analyzer.priority_chains:
             result["priority_chain"] = forced_chain
-            skills = [
-                s for s in analyzer.priority_chains[forced_chain]
-                if analyzer.skill_mapping.get(s, {}).get("available", False)
-            ]
-            avail, unavail = analyzer.validate_skills(skills)
+            avail, unavail = analyzer.resolve_chain_skills(forced_chain)
             result["assigned_skills"] = avail
             result["unavailable_skills"] = unavail
             result["primary_skill"] = avail[0] if avail else None
@@ -140,8 +132,36 @@ def run_analyze_only(name: str, desc: str, forced_type: str | None, forced_chain
         print(f"Structure      : {', '.join(result['project_structure'])}")
 
 
+def print_sizing_summary(sizing_file: str, sizing_context: dict):
+    """Print what was parsed from a sizing file."""
+    detected_platform = sizing_context.get("platform_detected")
+    print(f"Parsed sizing from : {sizing_file}")
+    print(f"  Health score     : {sizing_context.get('health_score', 'N/A')}/100")
+    if detected_platform:
+        print(f"  Platform detected: {detected_platform.upper()}")
+    if sizing_context.get('data_nodes'):
+        dn = sizing_context['data_nodes']
+        print(f"  Hot tier         : {dn.get('count', 0)} nodes, {dn.get('memory', 'N/A')} RAM, {dn.get('storage', 'N/A')} disk")
+    if sizing_context.get('cold_nodes'):
+        cn = sizing_context['cold_nodes']
+        print(f"  Cold tier        : {cn.get('count', 0)} nodes, {cn.get('memory', 'N/A')} RAM, {cn.get('storage', 'N/A')} disk")
+    if sizing_context.get('frozen_nodes'):
+        fn = sizing_context['frozen_nodes']
+        print(f"  Frozen tier      : {fn.get('count', 0)} nodes, {fn.get('memory', 'N/A')} RAM")
+    if sizing_context.get('aks'):
+        aks = sizing_context['aks']
+        print(f"  AKS node pools   : {len(aks.get('node_pools', []))} pools")
+    if sizing_context.get('openshift'):
+        openshift = sizing_context['openshift']
+        print(f"  OpenShift pools  : {len(openshift.get('worker_pools', []))} pools")
+
+
 def run_init(name: str, desc: str, target: str | None, forced_type: str | None, forced_chain: str | None, as_json: bool, git_init: bool = False, sizing_file: str | None = None):
     """Full project initialisation."""
+    # Imported here so --help and --analyze-only skip the generator and
+    # addon loader imports
+    from generate_structure import initialize_project
+
     effective_desc = desc
     if forced_type:
         effective_desc = f"{forced_type} {desc}"
@@ -152,6 +172,8 @@ def run_init(name: str, desc: str, target: str | None, forced_type: str | None,
     sizing_context = None
     detected_platform = None
     if sizing_file:
+        from sizing_parser import parse_sizing_file
+
         try:
             sizing_context = parse_sizing_file(sizing_file)
             
@@ -159,25 +181,7 @@ def run_init(name: str, desc: str, target: str | None, forced_type: str | None,
             detected_platform = sizing_context.get("platform_detected")
             
             if not as_json:
-                print(f"Parsed sizing from : {sizing_file}")
-                print(f"  Health score     : {sizing_context.get('health_score', 'N/A')}/100")
-                if detected_platform:
-                    print(f"  Platform detected: {detected_platform.upper()}")
-                if sizing_context.get('data_nodes'):
-                    dn = sizing_context['data_nodes']
-                    print(f"  Hot tier         : {dn.get('count', 0)} nodes, {dn.get('memory', 'N/A')} RAM, {dn.get('storage', 'N/A')} disk")
-                if sizing_context.get('cold_nodes'):
-                    cn = sizing_context['cold_nodes']
-                    print(f"  Cold tier        : {cn.get('count', 0)} nodes, {cn.get('memory', 'N/A')} RAM, {cn.get('storage', 'N/A')} disk")
-                if sizing_context.get('frozen_nodes'):
-                    fn = sizing_context['frozen_nodes']
-                    print(f"  Frozen tier      : {fn.get('count', 0)} nodes, {fn.get('memory', 'N/A')} RAM")
-                if sizing_context.get('aks'):
-                    aks = sizing_context['aks']
-                    print(f"  AKS node pools   : {len(aks.get('node_pools', []))} pools")
-                if sizing_context.get('openshift'):
-                    openshift = sizing_context['openshift']
-                    print(f"  OpenShift pools  : {len(openshift.get('worker_pools', []))} pools")
+                print_sizing_summary(sizing_file, sizing_context)
         except Exception as e:
             if not as_json:
                 print(f"Warning: Failed to parse sizing file: {e}")
@@ -221,13 +225,8 @@ def run_init(name: str, desc: str, target: str | None, forced_type: str | None,
 def init_git_repo(target_dir: str, project_name: str) -> dict:
     """Initialize a git repository in the target directory."""
     try:
-        # Check if git is available
-        subprocess.run(["git", "--version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return {"success": False, "error": "git not found"}
-    
-    try:
-        # Initialize repository
+        # Initialize repository; a missing git binary surfaces here as
+        # FileNotFoundError, so no separate `git --version` probe is needed
         subprocess.run(
             ["git", "init"],
             cwd=target_dir,
@@ -252,14 +251,27 @@ def init_git_repo(target_dir: str, project_name: str) -> dict:
         
         return {"success": True}
         
+    except FileNotFoundError:
+        return {"success": False, "error": "git not found"}
     except subprocess.CalledProcessError as e:
         return {"success": False, "error": str(e)}
 
 
 def main():
+    # Configure logging for CLI runs only; importing this module leaves the
+    # root logger alone
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
     parser = build_parser()
     args = parser.parse_args()
 
+    if args.prewarm:
+        from addon_loader import AddonLoader
+        sys.exit(0 if AddonLoader(SKILL_DIR).prewarm() else 1)
+
     # Interactive mode takes precedence
     if args.interactive:
         from interactive import run_interactive
@@ -6,7 +6,10 @@ Provides guided prompts for project creation with platform and GitOps selection.
 Zero external dependencies -- Python 3.9+ stdlib only.
 """
 
+import functools
+import logging
 import os
+import re
 import subprocess
 import sys
 from pathlib import Path
@@ -15,8 +18,7 @@ from typing import Dict, List, Optional, Tuple
 # Ensure sibling module is importable
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-from project_analyzer import ProjectAnalyzer, analyze_project  # noqa: E402
-from generate_structure import initialize_project  # noqa: E402
+from project_analyzer import analyze_project  # noqa: E402
 
 
 # ------------------------------------------------------------------
@@ -35,15 +37,29 @@ GITOPS_TOOLS: List[Tuple[str, str, str]] = [
     ("none", "None", "Raw Kubernetes manifests only"),
 ]
 
+# Project name sanitization: spaces and underscores become hyphens
+_SANITIZE_TABLE = str.maketrans({" ": "-", "_": "-"})
+
+# Descriptions mentioning Elastic offer the sizing wizard
+_ELASTIC_RE = re.compile(r"elastic", re.IGNORECASE)
+
 # Sizing skill to invoke
 SIZING_SKILL = "elasticsearch-openshift-sizing-assistant-legacy"
-SIZING_SKILL_PATH = Path("~/.config/opencode/skills").expanduser() / SIZING_SKILL
+# Resolved on first use by _sizing_path() so importing never touches HOME
+SIZING_SKILL_PATH: Optional[Path] = None
 
 
 # ------------------------------------------------------------------
 # Prompt Helpers
 # ------------------------------------------------------------------
 
+def _ask(prompt: str) -> str:
+    """Show a prompt, flushed so it is visible even on piped stdout, and read a line."""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    return input()
+
+
 def prompt_text(question: str, default: str = "") -> str:
     """Prompt for text input with optional default."""
     if default:
@@ -52,7 +68,7 @@ def prompt_text(question: str, default: str = "") -> str:
         prompt = f"{question}: "
     
     try:
-        response = input(prompt).strip()
+        response = _ask(prompt).strip()
     except (EOFError, KeyboardInterrupt):
         print("\nAborted.")
         sys.exit(1)
@@ -68,7 +84,7 @@ def prompt_choice(question: str, options: List[Tuple[str, str, str]]) -> str:
     
     while True:
         try:
-            response = input(f"Select [1-{len(options)}]: ").strip()
+            response = _ask(f"Select [1-{len(options)}]: ").strip()
         except (EOFError, KeyboardInterrupt):
             print("\nAborted.")
             sys.exit(1)
@@ -94,7 +110,7 @@ def prompt_confirm(question: str, default: bool = True) -> bool:
     suffix = "[Y/n]" if default else "[y/N]"
     
     try:
-        response = input(f"{question} {suffix}: ").strip().lower()
+        response = _ask(f"{question} {suffix}: ").strip().lower()
     except (EOFError, KeyboardInterrupt):
         print("\nAborted.")
         sys.exit(1)
@@ -109,9 +125,18 @@ def prompt_confirm(question: str, default: bool = True) -> bool:
 # Sizing Skill Integration
 # ------------------------------------------------------------------
 
+def _sizing_path() -> Path:
+    """Return the sizing skill location, expanding ``~`` on first call."""
+    global SIZING_SKILL_PATH
+    if SIZING_SKILL_PATH is None:
+        SIZING_SKILL_PATH = Path(os.path.expanduser("~/.config/opencode/skills")) / SIZING_SKILL
+    return SIZING_SKILL_PATH
+
+
+@functools.lru_cache(maxsize=1)
 def check_sizing_skill_available() -> bool:
-    """Check if the sizing skill exists on disk."""
-    return SIZING_SKILL_PATH.exists()
+    """Check if the sizing skill exists on disk (once per process)."""
+    return os.path.exists(_sizing_path())
 
 
 def invoke_sizing_skill(project_name: str, platform: str) -> Optional[Dict]:
@@ -121,7 +146,7 @@ def invoke_sizing_skill(project_name: str, platform: str) -> Optional[Dict]:
     """
     if not check_sizing_skill_available():
         print(f"\n  Sizing skill not found: {SIZING_SKILL}")
-        print(f"  Expected at: {SIZING_SKILL_PATH}")
+        print(f"  Expected at: {_sizing_path()}")
         return None
     
     print(f"\n  Loading skill: {SIZING_SKILL}")
@@ -149,52 +174,74 @@ def invoke_sizing_skill(project_name: str, platform: str) -> Optional[Dict]:
 # Main Interactive Flow
 # ------------------------------------------------------------------
 
+def _emit(lines: List[str]) -> None:
+    """Write a block of lines to stdout in one call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
 def print_banner():
     """Print welcome banner."""
-    print("\n" + "=" * 60)
-    print("  Project Initializer - Interactive Mode")
-    print("  Elasticsearch Cluster Scaffolding for Multiple Platforms")
-    print("=" * 60)
+    _emit([
+        "\n" + "=" * 60,
+        "  Project Initializer - Interactive Mode",
+        "  Elasticsearch Cluster Scaffolding for Multiple Platforms",
+        "=" * 60,
+    ])
 
 
 def print_analysis_summary(analysis: Dict):
     """Print detected analysis summary."""
-    print(f"\n  Detected type     : {analysis['primary_category']}")
-    print(f"  Confidence score  : {analysis['analysis_confidence']}")
-    print(f"  Priority chain    : {analysis['priority_chain']}")
-    print(f"  Primary skill     : {analysis['primary_skill'] or '(none)'}")
+    lines = [
+        f"\n  Detected type     : {analysis['primary_category']}",
+        f"  Confidence score  : {analysis['analysis_confidence']}",
+        f"  Priority chain    : {analysis['priority_chain']}",
+        f"  Primary skill     : {analysis['primary_skill'] or '(none)'}",
+    ]
     if analysis.get('assigned_skills'):
-        print(f"  Assigned skills   : {', '.join(analysis['assigned_skills'])}")
+        lines.append(f"  Assigned skills   : {', '.join(analysis['assigned_skills'])}")
+    _emit(lines)
 
 
 def print_result_summary(result: Dict):
     """Print final creation summary."""
-    print("\n" + "=" * 60)
-    print("  Project Created Successfully!")
-    print("=" * 60)
-    print(f"\n  Location        : {result['project_path']}")
-    print(f"  Category        : {result['primary_category']}")
-    print(f"  Primary Skill   : {result['primary_skill'] or '(none)'}")
-    print(f"  Assigned Skills : {', '.join(result['assigned_skills']) or '(none)'}")
+    lines = [
+        "\n" + "=" * 60,
+        "  Project Created Successfully!",
+        "=" * 60,
+        f"\n  Location        : {result['project_path']}",
+        f"  Category        : {result['primary_category']}",
+        f"  Primary Skill   : {result['primary_skill'] or '(none)'}",
+        f"  Assigned Skills : {', '.join(result['assigned_skills']) or '(none)'}",
+    ]
     
     if result.get('platform'):
-        print(f"  Platform        : {result['platform']}")
+        lines.append(f"  Platform        : {result['platform']}")
     if result.get('gitops_tool'):
-        print(f"  GitOps Tool     : {result['gitops_tool']}")
+        lines.append(f"  GitOps Tool     : {result['gitops_tool']}")
     
-    print("\n  Generated files:")
+    lines.append("\n  Generated files:")
+    # Generated paths are joined onto project_path, so stripping that prefix
+    # gives the relative path without relpath()'s abspath/getcwd work
+    prefix = os.path.join(result['project_path'], "")
     for f in result.get("generated_files", [])[:10]:
-        rel = os.path.relpath(f, result['project_path'])
-        print(f"    - {rel}")
+        if f.startswith(prefix):
+            rel = os.path.normpath(f[len(prefix):])
+        else:
+            rel = os.path.relpath(f, result['project_path'])
+        lines.append(f"    - {rel}")
     
     if len(result.get("generated_files", [])) > 10:
         remaining = len(result["generated_files"]) - 10
-        print(f"    ... and {remaining} more files")
+        lines.append(f"    ... and {remaining} more files")
     
-    print("\n  Next steps:")
-    print(f"    cd {result['project_path']}")
-    print("    # Review AGENTS.md for skill coordination")
-    print("    # Review README.md for project overview")
+    lines += [
+        "\n  Next steps:",
+        f"    cd {result['project_path']}",
+        "    # Review AGENTS.md for skill coordination",
+        "    # Review README.md for project overview",
+    ]
+    _emit(lines)
 
 
 def run_interactive() -> int:
@@ -211,7 +258,7 @@ def run_interactive() -> int:
         return 1
     
     # Sanitize project name (kebab-case)
-    project_name = project_name.lower().replace(" ", "-").replace("_", "-")
+    project_name = project_name.lower().translate(_SANITIZE_TABLE)
     
     # Step 2: Description
     description = prompt_text(
@@ -242,7 +289,7 @@ def run_interactive() -> int:
     
     # Step 6: Sizing wizard (optional)
     sizing_context = None
-    if analysis['primary_category'] == 'elasticsearch' or 'elastic' in description.lower():
+    if analysis['primary_category'] == 'elasticsearch' or _ELASTIC_RE.search(description):
         if check_sizing_skill_available():
             if prompt_confirm("\nRun ES sizing wizard?", default=True):
                 sizing_context = invoke_sizing_skill(project_name, platform)
@@ -270,7 +317,10 @@ def run_interactive() -> int:
     
     # Step 9: Create project
     print("\nCreating project...")
-    
+
+    # Imported only now so aborted sessions never load the generator/addons
+    from generate_structure import initialize_project
+
     try:
         result = initialize_project(
             project_name=project_name,
@@ -298,4 +348,7 @@ def run_interactive() -> int:
 # ------------------------------------------------------------------
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
     sys.exit(run_interactive())
@@ -4,11 +4,187 @@ Canonical ProjectAnalyzer module for the project-initializer skill.
 Zero external dependencies -- uses only Python stdlib (json, re, os, pathlib).
 """
 
+import functools
 import json
 import os
 import re
+import time
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, NamedTuple, Tuple, Optional
+
+
+# Fallback when no JSON config is found
+_DEFAULT_CONFIG = {
+    "priority_chains": {
+        "default": [
+            "devops-02-2026",
+            "kubernetes-k8s-specialist",
+            "platform-engineering",
+            "devops-general",
+        ],
+    },
+    "keyword_mapping": {
+        "elasticsearch": ["elasticsearch", "es", "eck", "elastic", "kibana"],
+        "kubernetes": ["kubernetes", "k8s", "openshift", "container", "rke2", "rancher"],
+        "terraform": ["terraform", "iac", "infrastructure"],
+        "azure": ["azure", "aks", "azurekubernetesservice", "microsoft"],
+        "gitops": ["fluxcd", "flux", "gitops", "helmrelease", "gitrepository", "kustomization"],
+    },
+    "skill_mapping": {},
+    "project_templates": {},
+}
+
+
+# Project layout: paths common to every project, then per-category extras
+_BASE_STRUCTURE = (
+    "README.md",
+    "AGENTS.md",
+    "terraform/",
+    "k8s/",
+    "scripts/",
+    "docs/",
+    ".opencode/context/",
+)
+
+_EXTRA_STRUCTURE = {
+    "elasticsearch": (
+        "observability/",
+        "elasticsearch/",
+        "kibana/",
+        "agents/",
+    ),
+    "kubernetes": ("cluster/", "platform-services/", "applications/"),
+    "terraform": ("modules/", "environments/", "networking/"),
+    "azure": (
+        "terraform/modules/aks/",
+        "terraform/modules/networking/",
+        "terraform/modules/storage/",
+        "terraform/modules/acr/",
+        "terraform/modules/monitoring/",
+    ),
+    "gitops": (
+        "clusters/",
+        "infrastructure/",
+        "apps/",
+        "flux-system/",
+        "base/",
+        "overlays/",
+    ),
+}
+
+# Installed skills live here, one directory per skill
+SKILLS_DIR = "~/.config/opencode/skills"
+
+# Installed skill names per skills directory, reused for a few seconds:
+# {skills_root: (listed_at, names)}
+_SKILLS_INDEX_TTL = 5.0
+_skills_index_cache: Dict[str, Tuple[float, frozenset]] = {}
+
+
+def _list_installed_skills(skills_root: str) -> frozenset:
+    """Names in the skills directory, from one directory read."""
+    now = time.monotonic()
+    cached = _skills_index_cache.get(skills_root)
+    if cached is not None and now - cached[0] < _SKILLS_INDEX_TTL:
+        return cached[1]
+    try:
+        with os.scandir(skills_root) as entries:
+            # A dangling symlink is not an installed skill
+            names = frozenset(
+                entry.name
+                for entry in entries
+                if not entry.is_symlink() or os.path.exists(entry.path)
+            )
+    except OSError:
+        names = frozenset()
+    _skills_index_cache[skills_root] = (now, names)
+    return names
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_file: str, mtime_ns: int, size: int) -> dict:
+    """Parse priority_chains.json; the stat fields only key the cache."""
+    with open(config_file, "r") as fh:
+        return json.load(fh)
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_keyword_patterns(
+    keyword_items: Tuple[Tuple[str, Tuple[str, ...]], ...]
+) -> Dict[str, List["re.Pattern[str]"]]:
+    """Whole-word pattern per keyword, grouped by category."""
+    return {
+        category: [re.compile(r"\b" + re.escape(kw) + r"\b") for kw in keywords]
+        for category, keywords in keyword_items
+    }
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_keyword_index(
+    keyword_items: Tuple[Tuple[str, Tuple[str, ...]], ...]
+) -> Optional[Tuple["re.Pattern[str]", Dict[str, str]]]:
+    """
+    One alternation over every keyword plus a keyword -> category map.
+
+    Scoring with it matches the per-keyword patterns only when every keyword
+    is a distinct run of word characters: each match is then a whole word,
+    equal to exactly one keyword. Otherwise None is returned and callers
+    fall back to the per-keyword patterns.
+    """
+    kw_to_cat: Dict[str, str] = {}
+    for category, keywords in keyword_items:
+        for kw in keywords:
+            if kw in kw_to_cat or not re.fullmatch(r"\w+", kw):
+                return None
+            kw_to_cat[kw] = category
+    if not kw_to_cat:
+        return None
+    combined = re.compile(
+        r"\b(?:" + "|".join(re.escape(kw) for kw in kw_to_cat) + r")\b"
+    )
+    return combined, kw_to_cat
+
+
+class _ConfigState(NamedTuple):
+    """Everything derived from one loaded config, swapped in as a unit."""
+
+    config: dict
+    priority_chains: Dict[str, List[str]]
+    skill_mapping: Dict[str, dict]
+    keyword_mapping: Dict[str, Tuple[str, ...]]
+    project_templates: Dict[str, dict]
+    keyword_patterns: Dict[str, List["re.Pattern[str]"]]
+    keyword_index: Optional[Tuple["re.Pattern[str]", Dict[str, str]]]
+    # Chains narrowed to the skills the config enables
+    enabled_chains: Dict[str, Tuple[str, ...]]
+
+
+def _build_config_state(config: dict) -> _ConfigState:
+    skill_mapping = config.get("skill_mapping", {})
+    priority_chains = config.get("priority_chains", {})
+    # Categories without keywords can never score, so they are dropped
+    keyword_mapping = {
+        cat: tuple(kws)
+        for cat, kws in config.get("keyword_mapping", {}).items()
+        if kws
+    }
+    keyword_items = tuple(keyword_mapping.items())
+    return _ConfigState(
+        config=config,
+        priority_chains=priority_chains,
+        skill_mapping=skill_mapping,
+        keyword_mapping=keyword_mapping,
+        project_templates=config.get("project_templates", {}),
+        keyword_patterns=_compile_keyword_patterns(keyword_items),
+        keyword_index=_compile_keyword_index(keyword_items),
+        enabled_chains={
+            chain: tuple(
+                skill for skill in skills
+                if skill_mapping.get(skill, {}).get("available", False)
+            )
+            for chain, skills in priority_chains.items()
+        },
+    )
 
 
 class ProjectAnalyzer:
@@ -20,12 +196,26 @@ class ProjectAnalyzer:
                 Path(__file__).resolve().parent.parent
             )
         self.config_path = config_path
-        self.priority_chains: Dict[str, List[str]] = {}
-        self.skill_mapping: Dict[str, dict] = {}
-        self.keyword_mapping: Dict[str, List[str]] = {}
-        self.project_templates: Dict[str, dict] = {}
+        self._skills_root = os.path.expanduser(SKILLS_DIR)
+        self._state: Optional[_ConfigState] = None
         self.load_config()
 
+    @property
+    def priority_chains(self) -> Dict[str, List[str]]:
+        return self._state.priority_chains
+
+    @property
+    def skill_mapping(self) -> Dict[str, dict]:
+        return self._state.skill_mapping
+
+    @property
+    def keyword_mapping(self) -> Dict[str, Tuple[str, ...]]:
+        return self._state.keyword_mapping
+
+    @property
+    def project_templates(self) -> Dict[str, dict]:
+        return self._state.project_templates
+
     # ------------------------------------------------------------------
     # Configuration
     # ------------------------------------------------------------------
@@ -33,39 +223,25 @@ class ProjectAnalyzer:
     def load_config(self):
         """Load configuration from priority_chains.json (stdlib only)."""
         config_file = os.path.join(self.config_path, "priority_chains.json")
-        if os.path.exists(config_file):
-            with open(config_file, "r") as fh:
-                config = json.load(fh)
-        else:
+        # Parsed once per file version and shared by every analyzer; the
+        # config is only read, never mutated
+        try:
+            st = os.stat(config_file)
+            config = _load_config_cached(config_file, st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
             config = self._default_config()
 
-        self.priority_chains = config.get("priority_chains", {})
-        self.skill_mapping = config.get("skill_mapping", {})
-        self.keyword_mapping = config.get("keyword_mapping", {})
-        self.project_templates = config.get("project_templates", {})
+        # Loaded configs are shared and never mutated, so derived state is
+        # rebuilt only for a new one. Readers on other threads take
+        # self._state once and see either the old state or the new one.
+        state = self._state
+        if state is None or config is not state.config:
+            self._state = _build_config_state(config)
 
     @staticmethod
     def _default_config() -> dict:
         """Fallback when no JSON config is found."""
-        return {
-            "priority_chains": {
-                "default": [
-                    "devops-02-2026",
-                    "kubernetes-k8s-specialist",
-                    "platform-engineering",
-                    "devops-general",
-                ],
-            },
-            "keyword_mapping": {
-                "elasticsearch": ["elasticsearch", "es", "eck", "elastic", "kibana"],
-                "kubernetes": ["kubernetes", "k8s", "openshift", "container", "rke2", "rancher"],
-                "terraform": ["terraform", "iac", "infrastructure"],
-                "azure": ["azure", "aks", "azurekubernetesservice", "microsoft"],
-                "gitops": ["fluxcd", "flux", "gitops", "helmrelease", "gitrepository", "kustomization"],
-            },
-            "skill_mapping": {},
-            "project_templates": {},
-        }
+        return _DEFAULT_CONFIG
 
     # ------------------------------------------------------------------
     # Analysis
@@ -76,36 +252,44 @@ class ProjectAnalyzer:
     ) -> Dict:
         """Return category scores, selected chain, and assigned skills."""
         full_text = f"{project_name} {description}".lower()
-
-        category_scores: Dict[str, int] = {}
-        for category, keywords in self.keyword_mapping.items():
-            score = 0
-            for kw in keywords:
-                pattern = r"\b" + re.escape(kw) + r"\b"
-                score += len(re.findall(pattern, full_text))
-            category_scores[category] = score
-
-        # Primary category = highest score (first alphabetically on tie)
-        if category_scores and max(category_scores.values()) > 0:
-            primary_category = max(
-                category_scores.items(), key=lambda x: x[1]
-            )[0]
+        state = self._state
+
+        if state.keyword_index is not None:
+            # Single scan of the text for all categories
+            combined, kw_to_cat = state.keyword_index
+            category_scores: Dict[str, int] = dict.fromkeys(state.keyword_mapping, 0)
+            for kw in combined.findall(full_text):
+                category_scores[kw_to_cat[kw]] += 1
         else:
-            primary_category = "generic"
+            category_scores = {
+                category: sum(len(pattern.findall(full_text)) for pattern in patterns)
+                for category, patterns in state.keyword_patterns.items()
+            }
+
+        # Primary category = highest score (first in config order on tie)
+        primary_category, max_score = "generic", 0
+        for category, score in category_scores.items():
+            if score > max_score:
+                primary_category, max_score = category, score
 
         # Detect ambiguous categories (within 1 point of the top score)
-        max_score = max(category_scores.values()) if category_scores else 0
-        ambiguous_categories = [
-            cat for cat, score in category_scores.items()
-            if score >= max_score - 1 and score > 0 and cat != primary_category
-        ]
+        if max_score == 0:
+            ambiguous_categories = []
+        else:
+            threshold = max_score - 1
+            ambiguous_categories = [
+                cat for cat, score in category_scores.items()
+                if score >= threshold and score > 0 and cat != primary_category
+            ]
 
-        priority_chain = self._select_chain(primary_category, category_scores)
+        priority_chain = self._select_chain(
+            primary_category, category_scores, state.priority_chains
+        )
 
         available_skills = [
             s
-            for s in self.priority_chains.get(priority_chain, [])
-            if self.skill_mapping.get(s, {}).get("available", False)
+            for s in state.priority_chains.get(priority_chain, [])
+            if state.skill_mapping.get(s, {}).get("available", False)
         ]
 
         return {
@@ -118,7 +302,10 @@ class ProjectAnalyzer:
         }
 
     def _select_chain(
-        self, primary_category: str, scores: Dict[str, int]
+        self,
+        primary_category: str,
+        scores: Dict[str, int],
+        priority_chains: Dict[str, List[str]],
     ) -> str:
         chain_map = {
             "elasticsearch": "default",
@@ -131,7 +318,7 @@ class ProjectAnalyzer:
         if scores.get(primary_category, 0) == 0:
             chain = "default"
         # Fall back to default if the chain isn't defined in config
-        if chain not in self.priority_chains:
+        if chain not in priority_chains:
             chain = "default"
         return chain
 
@@ -142,45 +329,7 @@ class ProjectAnalyzer:
     def get_project_structure(self, analysis_result: Dict) -> List[str]:
         """Return list of paths (dirs end with /) for the project type."""
         cat = analysis_result["primary_category"]
-
-        base = [
-            "README.md",
-            "AGENTS.md",
-            "terraform/",
-            "k8s/",
-            "scripts/",
-            "docs/",
-            ".opencode/context/",
-        ]
-
-        extras = {
-            "elasticsearch": [
-                "observability/", 
-                "elasticsearch/", 
-                "kibana/",
-                "agents/",
-            ],
-            "kubernetes": ["cluster/", "platform-services/", "applications/"],
-            "terraform": ["modules/", "environments/", "networking/"],
-            "azure": [
-                "terraform/modules/aks/",
-                "terraform/modules/networking/",
-                "terraform/modules/storage/",
-                "terraform/modules/acr/",
-                "terraform/modules/monitoring/",
-            ],
-            "gitops": [
-                "clusters/",
-                "infrastructure/",
-                "apps/",
-                "flux-system/",
-                "base/",
-                "overlays/",
-            ],
-        }
-
-        base.extend(extras.get(cat, []))
-        return base
+        return list(_BASE_STRUCTURE + _EXTRA_STRUCTURE.get(cat, ()))
 
     # ------------------------------------------------------------------
     # Skill validation
@@ -190,25 +339,43 @@ class ProjectAnalyzer:
         """Override the priority chain and recalculate skills."""
         if not forced_chain or forced_chain not in self.priority_chains:
             return result
-        skills = [
-            s for s in self.priority_chains[forced_chain]
-            if self.skill_mapping.get(s, {}).get("available", False)
-        ]
-        available, unavailable = self.validate_skills(skills)
+        available, unavailable = self.resolve_chain_skills(forced_chain)
         result["priority_chain"] = forced_chain
         result["assigned_skills"] = available
         result["primary_skill"] = available[0] if available else None
         result["unavailable_skills"] = unavailable
         return result
 
+    def _skills_index(self) -> frozenset:
+        """Installed skill names (listing shared and refreshed every few seconds)."""
+        return _list_installed_skills(self._skills_root)
+
     def validate_skills(self, skills: List[str]) -> Tuple[List[str], List[str]]:
         """Check which skills actually exist on disk."""
         available: List[str] = []
         unavailable: List[str] = []
 
+        installed = self._skills_index()
         for skill in skills:
-            skill_path = Path(f"~/.config/opencode/skills/{skill}").expanduser()
-            if skill_path.exists():
+            if skill in installed:
+                available.append(skill)
+            else:
+                unavailable.append(skill)
+
+        return available, unavailable
+
+    def resolve_chain_skills(self, chain: str) -> Tuple[List[str], List[str]]:
+        """Split a chain's enabled skills into installed and missing, in one pass.
+
+        Same result as validate_skills() on the config-filtered chain, which
+        is computed once per loaded config.
+        """
+        available: List[str] = []
+        unavailable: List[str] = []
+
+        installed = self._skills_index()
+        for skill in self._state.enabled_chains.get(chain, ()):
+            if skill in installed:
                 available.append(skill)
             else:
                 unavailable.append(skill)
@@ -220,6 +387,22 @@ class ProjectAnalyzer:
 # High-level helper used by analyze_project.py and init_project.py
 # ------------------------------------------------------------------
 
+# Shared analyzers by config_path. An analyzer holds only what load_config()
+# sets, so reusing one is safe; analyze_project() re-runs load_config(), which
+# is a stat plus cache hits, so config edits are still picked up.
+_ANALYZER_CACHE: Dict[Optional[str], ProjectAnalyzer] = {}
+
+
+def get_analyzer(config_path: Optional[str] = None) -> ProjectAnalyzer:
+    """Shared analyzer for config_path, with its config reloaded if it changed."""
+    analyzer = _ANALYZER_CACHE.get(config_path)
+    if analyzer is None:
+        analyzer = _ANALYZER_CACHE.setdefault(config_path, ProjectAnalyzer(config_path))
+    else:
+        analyzer.load_config()
+    return analyzer
+
+
 def analyze_project(
     project_name: str,
     description: str,
@@ -227,22 +410,23 @@ def analyze_project(
     config_path: Optional[str] = None,
 ) -> Dict:
     """Analyse a project and return a complete result dict."""
-    analyzer = ProjectAnalyzer(config_path)
+    analyzer = get_analyzer(config_path)
 
     result = analyzer.analyze_project_description(description, project_name)
 
-    if focus_areas:
+    # Blank focus areas can only score zero; skip the second scan entirely
+    if focus_areas and any(area.strip() for area in focus_areas):
         focus_text = " ".join(focus_areas)
         focus_result = analyzer.analyze_project_description(focus_text, "")
         if max(focus_result["category_scores"].values(), default=0) > 0:
             result.update(focus_result)
 
-    available, unavailable = analyzer.validate_skills(result["assigned_skills"])
+    # assigned_skills is the config-filtered chain, so resolving the chain
+    # directly gives the same split; available keeps chain order, so its
+    # head is the primary skill
+    available, unavailable = analyzer.resolve_chain_skills(result["priority_chain"])
     structure = analyzer.get_project_structure(result)
-
-    primary = result["primary_skill"]
-    if primary and primary not in available:
-        primary = available[0] if available else None
+    primary = available[0] if available else None
 
     return {
         "project_name": project_name,
@@ -10,11 +10,82 @@ Zero external dependencies -- Python 3.9+ stdlib only.
 
 from __future__ import annotations
 
+import bisect
+import functools
 import json
+import operator
 import re
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator, NamedTuple
+
+
+# ---------------------------------------------------------------------------
+# Precompiled patterns
+# ---------------------------------------------------------------------------
+
+# Section headers
+_TIER_HDR_RE = re.compile(r"^##\s+(HOT|COLD|WARM|FROZEN)\s+Tier\s+Calculation", re.IGNORECASE)
+_NODE_CONFIG_HDR_RE = re.compile(r"^###\s+Node Configuration", re.IGNORECASE)
+# "### Node Pools" but NOT "### Node Pools Configuration"
+_NODE_POOLS_HDR_RE = re.compile(r"^###\s+Node Pools\s*$", re.IGNORECASE)
+_INPUT_PARAMS_HDR_RE = re.compile(r"^###\s+Input Parameters", re.IGNORECASE)
+_AKS_HDR_RE = re.compile(r"^##\s+AKS", re.IGNORECASE)
+_OPENSHIFT_HDR_RE = re.compile(r"^##\s+OpenShift", re.IGNORECASE)
+_SUMMARY_HDR_RE = re.compile(r"^##\s+Summary", re.IGNORECASE)
+
+# Marker and possible initials of the first word for each header pattern.
+# Headers are bucketed by (marker, initial) so a lookup only regex-matches
+# lines that can match. Non-ASCII initials go to the "" bucket, which is
+# always checked, because IGNORECASE folds a few of them onto ASCII letters.
+_HEADER_KEYS: dict[re.Pattern[str], tuple[str, str]] = {
+    _TIER_HDR_RE: ("##", "hcwf"),
+    _NODE_CONFIG_HDR_RE: ("###", "n"),
+    _NODE_POOLS_HDR_RE: ("###", "n"),
+    _INPUT_PARAMS_HDR_RE: ("###", "i"),
+    _OPENSHIFT_HDR_RE: ("##", "o"),
+    _SUMMARY_HDR_RE: ("##", "s"),
+}
+
+# Section presence anywhere in the report (run on the lowercased content)
+_AKS_SECTION_RE = re.compile(r"##\s+aks")
+_OPENSHIFT_SECTION_RE = re.compile(r"##\s+openshift")
+_RKE2_SECTION_RE = re.compile(
+    r"##\s+RKE2/Kubernetes Deployment(.*?)(?:\n##\s+|\Z)", re.IGNORECASE | re.DOTALL
+)
+
+# A table cell number: "1,234", "-2.5", ".5", "1e3"; units like "GB" are ignored
+_NUMBER_RE = re.compile(r"[-+]?(?:\d[\d,]*(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?")
+
+# Totals
+_AKS_SNAPSHOT_RE = re.compile(r"Snapshot Storage:\s*\*\*([0-9.,]+)\s*GB\*\*")
+_SNAPSHOT_TOTAL_RE = re.compile(r"Total snapshot storage GB:\s*\*\*([0-9.,]+)\*\*")
+_HEALTH_SCORE_RE = re.compile(r"Health Score:\s*([0-9]+)\s*/\s*100", re.IGNORECASE)
+_DIGITS_RE = re.compile(r"([0-9]+)")
+_WORKLOAD_TYPE_RE = re.compile(r"Workload type:\s*\*\*([^*]+)\*\*", re.IGNORECASE)
+_RKE2_POOL_TABLE_RE = re.compile(r"\|\s*Pool\s*\|.*?(?:\n\|.*)+", re.IGNORECASE)
+
+_INPUT_PATTERNS: dict[str, re.Pattern[str]] = {
+    key: re.compile(pat, re.IGNORECASE)
+    for key, pat in {
+        "ingest_gb_per_day": r"Ingest per day:\s*\*\*([0-9.,]+)",
+        "compression_factor": r"Compression factor:\s*\*\*([0-9.,]+)",
+        "indexed_gb_per_day": r"Indexed per day:\s*\*\*([0-9.,]+)",
+        "reserve_pct": r"Reserve:\s*\*\*([0-9.,]+)%",
+        "total_retention_days": r"Total retention:\s*\*\*([0-9.,]+)",
+    }.items()
+}
+
+_RKE2_CLUSTER_PATTERNS: dict[str, re.Pattern[str]] = {
+    key: re.compile(pat, re.IGNORECASE)
+    for key, pat in {
+        "worker_nodes_total": r"Worker nodes:\s*\*\*([0-9.,]+)",
+        "control_plane_nodes_total": r"Control plane nodes:\s*\*\*([0-9.,]+)",
+        "cluster_total_nodes": r"Total nodes:\s*\*\*([0-9.,]+)",
+        "cluster_total_vcpu": r"Total vCPU:\s*\*\*([0-9.,]+)",
+        "cluster_total_ram_gb": r"Total RAM:\s*\*\*([0-9.,]+)",
+    }.items()
+}
 
 
 # ---------------------------------------------------------------------------
@@ -26,41 +97,135 @@ def _parse_md_table(lines: list[str]) -> list[dict[str, str]]:
 
     Expects the first line to be a header row separated by ``|`` and the
     second line to be a separator row (``|---|---|``).  Remaining lines
-    are data rows.
+    are data rows.  Lines must already be stripped, as every caller
+    collects them that way.
     """
     if len(lines) < 3:
         return []
 
     # Extract header names
-    headers = [h.strip() for h in lines[0].strip().strip("|").split("|")]
+    # Cells come back stripped, so callers use row values as they are
+    headers = [h.strip() for h in lines[0].strip("|").split("|")]
+    width = len(headers)
 
     # Skip separator line (line[1])
     rows: list[dict[str, str]] = []
     for line in lines[2:]:
-        line = line.strip()
-        if not line or not line.startswith("|"):
+        if not line.startswith("|"):
+            break
+        cells = [c.strip() for c in line.strip("|").split("|")]
+        if len(cells) < width:
+            cells += [""] * (width - len(cells))
+        rows.append(dict(zip(headers, cells)))
+    return rows
+
+
+def _parse_md_columns(lines: list[str], columns: tuple[str, ...]) -> list[tuple[str, ...]]:
+    """Parse a markdown table straight into tuples of the named columns.
+
+    Same table rules as ``_parse_md_table``, but each row comes back as
+    the cells for *columns* in order, "" where the column is missing or
+    the row is short, without building a dict per row.  Takes at least
+    two columns.
+    """
+    if len(lines) < 3:
+        return []
+
+    headers = [h.strip() for h in lines[0].strip("|").split("|")]
+    width = len(headers)
+    # Last occurrence wins for duplicate headers, as in the dict rows;
+    # missing columns point at the "" appended past the last real cell
+    index = {h: i for i, h in enumerate(headers)}
+    pick = operator.itemgetter(*(index.get(col, width) for col in columns))
+
+    rows: list[tuple[str, ...]] = []
+    for line in lines[2:]:
+        if not line.startswith("|"):
             break
         cells = [c.strip() for c in line.strip("|").split("|")]
-        row = {}
-        for idx, header in enumerate(headers):
-            row[header] = cells[idx] if idx < len(cells) else ""
-        rows.append(row)
+        if len(cells) < width:
+            cells += [""] * (width - len(cells))
+        elif len(cells) > width:
+            del cells[width:]
+        cells.append("")
+        rows.append(pick(cells))
     return rows
 
 
 def _safe_float(val: str) -> float:
-    """Extract a float from a string, stripping markdown bold and commas."""
-    val = val.replace("**", "").replace(",", "").strip()
-    try:
-        return float(val)
-    except (ValueError, TypeError):
-        return 0.0
+    """Extract the first number in a string, ignoring markdown bold, commas and units."""
+    m = _NUMBER_RE.search(val)
+    return float(m.group().replace(",", "")) if m else 0.0
 
 
 def _safe_int(val: str) -> int:
     return int(_safe_float(val))
 
 
+def _read_report(path: Path) -> str:
+    """Read a whole report in one call, normalising newlines like read_text()."""
+    text = path.read_bytes().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+# ---------------------------------------------------------------------------
+# Line-item splitting (string-method equivalents of the line patterns)
+# ---------------------------------------------------------------------------
+
+def _split_meta_line(line: str) -> tuple[str, str] | None:
+    """Split a stripped ``**Key:** Value`` line.
+
+    Same groups as ``re.match(r"^\\*\\*(.+?):\\*\\*\\s*(.+)$", line)``.
+    """
+    if not line.startswith("**"):
+        return None
+    # The key is non-empty and ends at the first ":**"; a value must follow
+    idx = line.find(":**", 3)
+    if idx == -1 or idx + 3 == len(line):
+        return None
+    return line[2:idx], line[idx + 3:].lstrip()
+
+
+def _bold_after(text: str, pos: int) -> str | None:
+    """Return X for ``\\s*\\*\\*X\\*\\*`` starting at *pos* (X non-empty), else None."""
+    rest = text[pos:]
+    start = pos + len(rest) - len(rest.lstrip())
+    if not text.startswith("**", start):
+        return None
+    end = text.find("**", start + 3)
+    if end == -1:
+        return None
+    return text[start + 2:end]
+
+
+def _split_summary_item(line: str) -> tuple[str, str] | None:
+    """Split a stripped ``- Key: **Value**`` line.
+
+    Same groups as ``re.match(r"^-\\s+(.+?):\\s*\\*\\*(.+?)\\*\\*", line)``.
+    """
+    if not line.startswith("-"):
+        return None
+    body = line[1:]
+    ws = len(body) - len(body.lstrip())
+    if not ws:
+        return None
+    # Lazy key: the first ':' after a non-empty key that is followed by bold
+    colon = body.find(":", ws + 1)
+    while colon != -1:
+        value = _bold_after(body, colon + 1)
+        if value is not None:
+            return body[ws:colon], value
+        colon = body.find(":", colon + 1)
+    # The regex can also give one whitespace character back to the key
+    if ws > 1 and body[ws:ws + 1] == ":":
+        value = _bold_after(body, ws + 1)
+        if value is not None:
+            return body[ws - 1:ws], value
+    return None
+
+
 # ---------------------------------------------------------------------------
 # Pool name normalisation
 # ---------------------------------------------------------------------------
@@ -81,8 +246,10 @@ def _normalize_pool_name(raw: str) -> str:
     key = raw.lower().strip()
     if key in _POOL_NAME_MAP:
         return _POOL_NAME_MAP[key]
-    # Strip trailing " pool" and spaces, lowercase
-    return re.sub(r"\s+pool$", "", key).replace(" ", "")
+    # Strip a whitespace-separated trailing "pool", then the spaces
+    if key.endswith("pool") and key[-5:-4].isspace():
+        key = key[:-4].rstrip()
+    return key.replace(" ", "")
 
 
 # ---------------------------------------------------------------------------
@@ -99,36 +266,152 @@ _PLATFORM_PATTERNS: list[tuple[str, str]] = [
     (r"##\s+Rancher\b", "rke2"),
 ]
 
+# Platforms in priority order, and one alternation with a named group each
+_PLATFORM_RANK: dict[str, int] = {
+    platform: rank
+    for rank, platform in enumerate(dict.fromkeys(p for _, p in _PLATFORM_PATTERNS))
+}
+_PLATFORM_RE = re.compile(
+    "|".join(
+        f"(?P<{platform}>"
+        + "|".join(pat for pat, p in _PLATFORM_PATTERNS if p == platform)
+        + ")"
+        for platform in _PLATFORM_RANK
+    ),
+    re.IGNORECASE,
+)
+
 
 def _detect_platform(content: str) -> str | None:
-    for pattern, platform in _PLATFORM_PATTERNS:
-        if re.search(pattern, content, re.IGNORECASE):
-            return platform
-    return None
+    """Return the highest-priority platform with a matching header.
+
+    One scan replaces a search per pattern. The leftmost match is not
+    necessarily the winner, so matches are ranked. Only AKS patterns can
+    span another ``##``, and AKS already ranks first, so no better match is
+    ever skipped.
+    """
+    best: str | None = None
+    for m in _PLATFORM_RE.finditer(content):
+        platform = m.lastgroup
+        if best is None or _PLATFORM_RANK[platform] < _PLATFORM_RANK[best]:
+            best = platform
+            if _PLATFORM_RANK[best] == 0:
+                break
+    return best
 
 
 # ---------------------------------------------------------------------------
 # SizingReportParser
 # ---------------------------------------------------------------------------
 
+class _PoolCount(NamedTuple):
+    """One row of the ### Node Pools table (only used to merge node counts)."""
+
+    pool: str
+    nodes: int
+    pods: int
+    vcpu_per_node: int
+    ram_per_node_gb: int
+    disk_per_node_gb: int
+
+
 class SizingReportParser:
     """Parser for elastic-sizing-format v1.0 markdown reports."""
 
     def __init__(self, content: str, filepath: str | None = None):
         self.content = content
         self.filepath = filepath
+        self._parsed: dict[str, Any] | None = None
+        self._scan()
+
+    def _scan(self) -> None:
+        """Split the report once, indexing header lines and metadata.
+
+        Every extractor works on the stripped lines and only needs to look
+        at ``#`` headers to find its section, so one pass here replaces a
+        full splitlines() and line scan per extractor.
+        """
+        self._lines = [line.strip() for line in self.content.splitlines()]
+        # For case-insensitive presence checks without IGNORECASE folding
+        self._content_lower = self.content.lower()
+        self._headers: list[int] = []
+        self._header_buckets: dict[tuple[str, str], list[int]] = {}
+        self._metadata: dict[str, str] = {}
+        # Dispatch on the first character so the regex only sees candidates
+        for i, line in enumerate(self._lines):
+            c0 = line[:1]
+            if c0 == "#":
+                self._headers.append(i)
+                tokens = line.split(None, 2)
+                if len(tokens) > 1:
+                    initial = tokens[1][0]
+                    key = (tokens[0], initial.lower() if initial.isascii() else "")
+                    self._header_buckets.setdefault(key, []).append(i)
+            elif c0 == "*":
+                item = _split_meta_line(line)
+                if item:
+                    self._metadata[item[0].strip()] = item[1]
+
+    def _matching_headers(self, pattern: re.Pattern[str]) -> Iterator[tuple[int, re.Match[str]]]:
+        """Yield (index, match) for header lines matching *pattern*, in order."""
+        marker, initials = _HEADER_KEYS[pattern]
+        buckets = self._header_buckets
+        candidates = sorted(
+            i for c in (*initials, "") for i in buckets.get((marker, c), ())
+        )
+        for i in candidates:
+            m = pattern.match(self._lines[i])
+            if m:
+                yield i, m
+
+    def _first_header(self, pattern: re.Pattern[str]) -> int | None:
+        """Index of the first header line matching *pattern*, if any."""
+        for i, _ in self._matching_headers(pattern):
+            return i
+        return None
+
+    def _collect_table(self, start: int, stop: str = "#") -> tuple[list[str], int]:
+        """Collect the first table at or after line *start*.
+
+        Returns the table lines and the index where collection stopped: the
+        first line after the table (a blank line ends it), or a line
+        starting with *stop* seen before any table line.
+        """
+        lines = self._lines
+        n = len(lines)
+        j = start
+        table_lines: list[str] = []
+        while j < n:
+            l = lines[j]
+            if l[:1] == "|":
+                table_lines.append(l)
+            elif table_lines:
+                break  # end of table
+            elif l[:1] == "#" and l.startswith(stop):
+                break  # next section
+            j += 1
+        return table_lines, j
 
     @classmethod
     def from_file(cls, filepath: str) -> SizingReportParser:
         path = Path(filepath)
-        return cls(path.read_text(), str(path))
+        return cls(_read_report(path), str(path))
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
     def parse(self) -> dict[str, Any]:
-        """Parse the full sizing report and return structured data."""
+        """Parse the full sizing report and return structured data.
+
+        The result is computed once per parser and shared by later calls,
+        including to_sizing_context(); treat it as read-only.
+        """
+        if self._parsed is None:
+            self._parsed = self._parse()
+        return self._parsed
+
+    def _parse(self) -> dict[str, Any]:
         result: dict[str, Any] = {}
 
         result["metadata"] = self._extract_metadata()
@@ -148,7 +431,7 @@ class SizingReportParser:
             result["openshift"] = ocp_data
 
         # Frozen tier snapshot storage (cross-platform)
-        result["frozen_nodes"] = self._extract_frozen_snapshot_storage()
+        result["frozen_nodes"] = self._extract_frozen_snapshot_storage(result["tiers"])
 
         # Summary data
         result["summary"] = self._extract_summary()
@@ -179,15 +462,8 @@ class SizingReportParser:
     # ------------------------------------------------------------------
 
     def _extract_metadata(self) -> dict[str, str]:
-        meta: dict[str, str] = {}
-        pattern = re.compile(r"^\*\*(.+?):\*\*\s*(.+)$")
-        for line in self.content.splitlines():
-            m = pattern.match(line.strip())
-            if m:
-                key = m.group(1).strip()
-                val = m.group(2).strip()
-                meta[key] = val
-        return meta
+        # Collected by _scan(); header lines can never match the pattern
+        return dict(self._metadata)
 
     # ------------------------------------------------------------------
     # Tier calculations (HOT / COLD / FROZEN / WARM sections)
@@ -195,36 +471,15 @@ class SizingReportParser:
 
     def _extract_tier_calculations(self) -> dict[str, dict[str, Any]]:
         tiers: dict[str, dict[str, Any]] = {}
-        lines = self.content.splitlines()
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            m = re.match(r"^##\s+(HOT|COLD|WARM|FROZEN)\s+Tier\s+Calculation", line, re.IGNORECASE)
-            if m:
-                tier_name = m.group(1).lower()
-                # Find the table that follows
-                j = i + 1
-                table_lines: list[str] = []
-                while j < len(lines):
-                    l = lines[j].strip()
-                    if l.startswith("|"):
-                        table_lines.append(l)
-                    elif table_lines:
-                        break  # end of table
-                    elif l.startswith("##"):
-                        break  # next section
-                    j += 1
-                rows = _parse_md_table(table_lines)
-                tier_data: dict[str, Any] = {}
-                for row in rows:
-                    param = row.get("Parameter", "").strip()
-                    val = row.get("Value", "").strip().replace("**", "")
-                    if param:
-                        tier_data[param] = val
-                tiers[tier_name] = tier_data
-                i = j
-                continue
-            i += 1
+        for i, m in self._matching_headers(_TIER_HDR_RE):
+            tier_name = m.group(1).lower()
+            # Find the table that follows
+            table_lines, _ = self._collect_table(i + 1, stop="##")
+            tier_data: dict[str, Any] = {}
+            for param, val in _parse_md_columns(table_lines, ("Parameter", "Value")):
+                if param:
+                    tier_data[param] = val.replace("**", "")
+            tiers[tier_name] = tier_data
         return tiers
 
     # ------------------------------------------------------------------
@@ -233,7 +488,7 @@ class SizingReportParser:
 
     def _extract_aks_data(self) -> dict[str, Any] | None:
         """Extract AKS/ECK Deployment section data."""
-        if not re.search(r"##\s+AKS", self.content, re.IGNORECASE):
+        if not _AKS_SECTION_RE.search(self._content_lower):
             return None
 
         aks: dict[str, Any] = {}
@@ -247,11 +502,10 @@ class SizingReportParser:
         pool_counts = self._extract_node_pools_table()
         if pool_counts and node_pools:
             # Merge node counts from the Node Pools table
-            count_map = {_normalize_pool_name(p["pool"]): p for p in pool_counts}
+            count_map = {_normalize_pool_name(p.pool): p.nodes for p in pool_counts}
             for pool in aks["node_pools"]:
-                extra = count_map.get(pool["name"], {})
                 if "node_count" not in pool or pool["node_count"] == 0:
-                    pool["node_count"] = extra.get("nodes", pool.get("node_count", 0))
+                    pool["node_count"] = count_map.get(pool["name"], pool.get("node_count", 0))
 
         # Snapshot storage from Total AKS Resources
         snapshot_gb = self._extract_aks_snapshot_storage()
@@ -265,124 +519,71 @@ class SizingReportParser:
 
     def _extract_node_config_table(self) -> list[dict[str, Any]]:
         """Parse the ### Node Configuration table."""
-        lines = self.content.splitlines()
         pools: list[dict[str, Any]] = []
-        i = 0
-        while i < len(lines):
-            if re.match(r"^###\s+Node Configuration", lines[i].strip(), re.IGNORECASE):
-                # Collect table lines
-                j = i + 1
-                table_lines: list[str] = []
-                while j < len(lines):
-                    l = lines[j].strip()
-                    if l.startswith("|"):
-                        table_lines.append(l)
-                    elif table_lines:
-                        break
-                    elif l.startswith("#"):
-                        break
-                    j += 1
-                rows = _parse_md_table(table_lines)
-                for row in rows:
-                    pool_name_raw = row.get("Pool", "").strip()
-                    if not pool_name_raw or pool_name_raw.startswith("**"):
-                        continue  # skip total rows
-                    name = _normalize_pool_name(pool_name_raw)
-                    vm_size = row.get("VM SKU", "").strip()
-                    vcpu = _safe_int(row.get("vCPU", "0"))
-                    ram_gb = _safe_int(row.get("RAM (GB)", "0"))
-                    disk_gb = _safe_int(row.get("Disk (GB)", "0"))
-                    pools.append({
-                        "name": name,
-                        "vm_size": vm_size,
-                        "vcpu": vcpu,
-                        "ram_gb": ram_gb,
-                        "disk_size_gb": disk_gb,
-                        "node_count": 0,  # will be filled from Node Pools table
-                    })
-                break
-            i += 1
+        i = self._first_header(_NODE_CONFIG_HDR_RE)
+        if i is None:
+            return pools
+        table_lines, _ = self._collect_table(i + 1)
+        columns = ("Pool", "VM SKU", "vCPU", "RAM (GB)", "Disk (GB)")
+        for pool_name_raw, vm_size, vcpu, ram_gb, disk_gb in _parse_md_columns(table_lines, columns):
+            if not pool_name_raw or pool_name_raw.startswith("**"):
+                continue  # skip total rows
+            pools.append({
+                "name": _normalize_pool_name(pool_name_raw),
+                "vm_size": vm_size,
+                "vcpu": _safe_int(vcpu),
+                "ram_gb": _safe_int(ram_gb),
+                "disk_size_gb": _safe_int(disk_gb),
+                "node_count": 0,  # will be filled from Node Pools table
+            })
         return pools
 
-    def _extract_node_pools_table(self) -> list[dict[str, Any]]:
+    def _extract_node_pools_table(self) -> list[_PoolCount]:
         """Parse the ### Node Pools table (has node counts)."""
-        lines = self.content.splitlines()
-        pools: list[dict[str, Any]] = []
-        i = 0
-        while i < len(lines):
-            # Match "### Node Pools" but NOT "### Node Pools Configuration"
-            if re.match(r"^###\s+Node Pools\s*$", lines[i].strip(), re.IGNORECASE):
-                j = i + 1
-                table_lines: list[str] = []
-                while j < len(lines):
-                    l = lines[j].strip()
-                    if l.startswith("|"):
-                        table_lines.append(l)
-                    elif table_lines:
-                        break
-                    elif l.startswith("#"):
-                        break
-                    j += 1
-                rows = _parse_md_table(table_lines)
-                for row in rows:
-                    pool_name_raw = row.get("Pool", "").strip()
-                    if not pool_name_raw or pool_name_raw.startswith("**"):
-                        continue
-                    pools.append({
-                        "pool": pool_name_raw,
-                        "nodes": _safe_int(row.get("Nodes", "0")),
-                        "pods": _safe_int(row.get("Pods", "0")),
-                        "vcpu_per_node": _safe_int(row.get("vCPU/node", "0")),
-                        "ram_per_node_gb": _safe_int(row.get("RAM/node (GB)", "0")),
-                        "disk_per_node_gb": _safe_int(row.get("Disk/node (GB)", "0")),
-                    })
-                break
-            i += 1
+        pools: list[_PoolCount] = []
+        i = self._first_header(_NODE_POOLS_HDR_RE)
+        if i is None:
+            return pools
+        table_lines, _ = self._collect_table(i + 1)
+        columns = ("Pool", "Nodes", "Pods", "vCPU/node", "RAM/node (GB)", "Disk/node (GB)")
+        for pool_name_raw, *counts in _parse_md_columns(table_lines, columns):
+            if not pool_name_raw or pool_name_raw.startswith("**"):
+                continue
+            pools.append(_PoolCount(pool_name_raw, *map(_safe_int, counts)))
         return pools
 
     def _extract_aks_snapshot_storage(self) -> float:
         """Extract snapshot storage from Total AKS Resources section."""
-        m = re.search(r"Snapshot Storage:\s*\*\*([0-9.,]+)\s*GB\*\*", self.content)
+        m = _AKS_SNAPSHOT_RE.search(self.content)
         if m:
             return _safe_float(m.group(1))
         # Fallback: from Summary section
-        m = re.search(r"Total snapshot storage GB:\s*\*\*([0-9.,]+)\*\*", self.content)
-        if m:
-            return _safe_float(m.group(1))
-        return 0.0
+        summary_total = self._summary_snapshot_gb
+        return summary_total if summary_total is not None else 0.0
+
+    @functools.cached_property
+    def _summary_snapshot_gb(self) -> float | None:
+        """The 'Total snapshot storage GB' summary figure, searched for once."""
+        m = _SNAPSHOT_TOTAL_RE.search(self.content)
+        return _safe_float(m.group(1)) if m else None
 
     def _extract_aks_input_params(self) -> dict[str, str]:
         """Extract ### Input Parameters table under AKS section."""
-        lines = self.content.splitlines()
         params: dict[str, str] = {}
-        i = 0
         in_aks = False
-        while i < len(lines):
-            line = lines[i].strip()
-            if re.match(r"^##\s+AKS", line, re.IGNORECASE):
+        # Every line this walks through that matters is a header
+        for i in self._headers:
+            line = self._lines[i]
+            if _AKS_HDR_RE.match(line):
                 in_aks = True
             elif line.startswith("## ") and in_aks:
                 break  # left AKS section
-            elif in_aks and re.match(r"^###\s+Input Parameters", line, re.IGNORECASE):
-                j = i + 1
-                table_lines: list[str] = []
-                while j < len(lines):
-                    l = lines[j].strip()
-                    if l.startswith("|"):
-                        table_lines.append(l)
-                    elif table_lines:
-                        break
-                    elif l.startswith("#"):
-                        break
-                    j += 1
-                rows = _parse_md_table(table_lines)
-                for row in rows:
-                    param = row.get("Parameter", "").strip()
-                    val = row.get("Value", "").strip()
+            elif in_aks and _INPUT_PARAMS_HDR_RE.match(line):
+                table_lines, _ = self._collect_table(i + 1)
+                for param, val in _parse_md_columns(table_lines, ("Parameter", "Value")):
                     if param:
                         params[param] = val
                 break
-            i += 1
         return params
 
     # ------------------------------------------------------------------
@@ -391,28 +592,27 @@ class SizingReportParser:
 
     def _extract_openshift_data(self) -> dict[str, Any] | None:
         """Extract OpenShift Worker Pools section data."""
-        if not re.search(r"##\s+OpenShift", self.content, re.IGNORECASE):
+        if not _OPENSHIFT_SECTION_RE.search(self._content_lower):
             return None
 
         ocp: dict[str, Any] = {"worker_pools": [], "worker_config": []}
-        lines = self.content.splitlines()
-        i = 0
+        lines = self._lines
+        # Nothing before the first OpenShift header is used
+        start = self._first_header(_OPENSHIFT_HDR_RE)
+        i = len(lines) if start is None else start
         in_ocp = False
         while i < len(lines):
-            line = lines[i].strip()
-            if re.match(r"^##\s+OpenShift", line, re.IGNORECASE):
+            line = lines[i]
+            if line[:1] == "#" and _OPENSHIFT_HDR_RE.match(line):
                 in_ocp = True
             elif line.startswith("## ") and in_ocp:
                 break
             elif in_ocp and line.startswith("|"):
-                # Collect table
-                table_lines: list[str] = []
-                while i < len(lines) and lines[i].strip().startswith("|"):
-                    table_lines.append(lines[i].strip())
-                    i += 1
+                # Collect table; line i is its first row
+                table_lines, i = self._collect_table(i)
                 rows = _parse_md_table(table_lines)
                 for row in rows:
-                    pool_name = row.get("Pool", row.get("Name", "")).strip()
+                    pool_name = row.get("Pool", row.get("Name", ""))
                     if not pool_name or pool_name.startswith("**"):
                         continue
                     workers = _safe_int(row.get("Workers", row.get("Nodes", "0")))
@@ -433,22 +633,23 @@ class SizingReportParser:
     # Frozen snapshot storage (cross-platform)
     # ------------------------------------------------------------------
 
-    def _extract_frozen_snapshot_storage(self) -> dict[str, float]:
+    def _extract_frozen_snapshot_storage(
+        self, tiers: dict[str, dict[str, Any]] | None = None
+    ) -> dict[str, float]:
         """Extract total snapshot storage for frozen tier."""
         total = 0.0
-        # Sum from tier calculations
-        tiers = self._extract_tier_calculations()
+        # Sum from tier calculations (parse() passes the ones it already has)
+        if tiers is None:
+            tiers = self._extract_tier_calculations()
         for tier_name in ("frozen", "cold", "hot"):
             tier = tiers.get(tier_name, {})
             val = tier.get("Snapshot repo storage (GB)", "0")
             total += _safe_float(val)
 
-        # Also check summary line
-        m = re.search(r"Total snapshot storage GB:\s*\*\*([0-9.,]+)\*\*", self.content)
-        if m:
-            summary_total = _safe_float(m.group(1))
-            if summary_total > total:
-                total = summary_total
+        # Also check summary line (shared with the AKS fallback)
+        summary_total = self._summary_snapshot_gb
+        if summary_total is not None and summary_total > total:
+            total = summary_total
 
         return {"snapshot_storage_gb": total}
 
@@ -458,21 +659,23 @@ class SizingReportParser:
 
     def _extract_summary(self) -> dict[str, Any]:
         summary: dict[str, Any] = {}
-        lines = self.content.splitlines()
-        in_summary = False
-        for line in lines:
-            stripped = line.strip()
-            if re.match(r"^##\s+Summary", stripped, re.IGNORECASE):
-                in_summary = True
-                continue
-            if in_summary and stripped.startswith("## "):
+        # Nothing before the first Summary header is used
+        start = self._first_header(_SUMMARY_HDR_RE)
+        if start is None:
+            return summary
+        # The section runs to the next "## " header other than a Summary one,
+        # found from the header index rather than by walking every line
+        end = len(self._lines)
+        for i in self._headers[bisect.bisect_right(self._headers, start):]:
+            line = self._lines[i]
+            if line.startswith("## ") and not _SUMMARY_HDR_RE.match(line):
+                end = i
                 break
-            if in_summary and stripped.startswith("- "):
-                m = re.match(r"^-\s+(.+?):\s*\*\*(.+?)\*\*", stripped)
-                if m:
-                    key = m.group(1).strip()
-                    val = m.group(2).strip()
-                    summary[key] = val
+        for stripped in self._lines[start + 1:end]:
+            if stripped.startswith("- "):
+                item = _split_summary_item(stripped)
+                if item:
+                    summary[item[0].strip()] = item[1].strip()
         return summary
 
 
@@ -492,12 +695,12 @@ def _fmt_cpu(value: float) -> str:
 
 
 def _extract_health_score_markdown(content: str, summary: dict[str, Any]) -> int:
-    m = re.search(r"Health Score:\s*([0-9]+)\s*/\s*100", content, re.IGNORECASE)
+    m = _HEALTH_SCORE_RE.search(content)
     if m:
         return int(m.group(1))
     for k, v in summary.items():
         if "health" in k.lower():
-            m2 = re.search(r"([0-9]+)", str(v))
+            m2 = _DIGITS_RE.search(str(v))
             if m2:
                 return int(m2.group(1))
     return 0
@@ -505,15 +708,8 @@ def _extract_health_score_markdown(content: str, summary: dict[str, Any]) -> int
 
 def _extract_inputs_markdown(content: str) -> dict[str, Any]:
     inputs: dict[str, Any] = {}
-    patterns = {
-        "ingest_gb_per_day": r"Ingest per day:\s*\*\*([0-9.,]+)",
-        "compression_factor": r"Compression factor:\s*\*\*([0-9.,]+)",
-        "indexed_gb_per_day": r"Indexed per day:\s*\*\*([0-9.,]+)",
-        "reserve_pct": r"Reserve:\s*\*\*([0-9.,]+)%",
-        "total_retention_days": r"Total retention:\s*\*\*([0-9.,]+)",
-    }
-    for key, pat in patterns.items():
-        m = re.search(pat, content, re.IGNORECASE)
+    for key, pattern in _INPUT_PATTERNS.items():
+        m = pattern.search(content)
         if not m:
             continue
         val = _safe_float(m.group(1))
@@ -521,7 +717,7 @@ def _extract_inputs_markdown(content: str) -> dict[str, Any]:
             val = val / 100.0
         inputs[key] = val
 
-    m = re.search(r"Workload type:\s*\*\*([^*]+)\*\*", content, re.IGNORECASE)
+    m = _WORKLOAD_TYPE_RE.search(content)
     if m:
         inputs["workload_type"] = m.group(1).strip().lower()
     return inputs
@@ -544,37 +740,31 @@ def _node_profile_from_tier_table(tier: dict[str, Any], snapshot_fallback: float
 
 
 def _extract_rke2_markdown(content: str) -> dict[str, Any] | None:
-    sec = re.search(r"##\s+RKE2/Kubernetes Deployment(.*?)(?:\n##\s+|\Z)", content, re.IGNORECASE | re.DOTALL)
+    sec = _RKE2_SECTION_RE.search(content)
     if not sec:
         return None
     chunk = sec.group(1)
 
     cluster: dict[str, Any] = {}
-    for key, pat in {
-        "worker_nodes_total": r"Worker nodes:\s*\*\*([0-9.,]+)",
-        "control_plane_nodes_total": r"Control plane nodes:\s*\*\*([0-9.,]+)",
-        "cluster_total_nodes": r"Total nodes:\s*\*\*([0-9.,]+)",
-        "cluster_total_vcpu": r"Total vCPU:\s*\*\*([0-9.,]+)",
-        "cluster_total_ram_gb": r"Total RAM:\s*\*\*([0-9.,]+)",
-    }.items():
-        m = re.search(pat, chunk, re.IGNORECASE)
+    for key, pattern in _RKE2_CLUSTER_PATTERNS.items():
+        m = pattern.search(chunk)
         if m:
             cluster[key] = _safe_float(m.group(1))
 
     pools: list[dict[str, Any]] = []
-    table_match = re.search(r"\|\s*Pool\s*\|.*?(?:\n\|.*)+", chunk, re.IGNORECASE)
+    table_match = _RKE2_POOL_TABLE_RE.search(chunk)
     if table_match:
-        table_lines = [ln.strip() for ln in table_match.group(0).splitlines() if ln.strip().startswith("|")]
-        rows = _parse_md_table(table_lines)
-        for row in rows:
-            name = row.get("Pool", "").strip().lower().replace(" ", "_")
+        stripped = (ln.strip() for ln in table_match.group(0).splitlines())
+        table_lines = [ln for ln in stripped if ln.startswith("|")]
+        columns = ("Pool", "Nodes", "Per Zone", "vCPU/Node", "RAM/Node (GB)", "Unschedulable Pods")
+        for pool, nodes, per_zone, vcpu, ram_gb, unschedulable in _parse_md_columns(table_lines, columns):
             pools.append({
-                "name": name,
-                "nodes": _safe_int(row.get("Nodes", "0")),
-                "per_zone": [x for x in row.get("Per Zone", "").split("/") if x.strip()],
-                "vcpu_per_node": _safe_float(row.get("vCPU/Node", "0")),
-                "ram_gb_per_node": _safe_float(row.get("RAM/Node (GB)", "0")),
-                "unschedulable_pods": _safe_int(row.get("Unschedulable Pods", "0")),
+                "name": pool.lower().replace(" ", "_"),
+                "nodes": _safe_int(nodes),
+                "per_zone": [x for x in per_zone.split("/") if x.strip()],
+                "vcpu_per_node": _safe_float(vcpu),
+                "ram_gb_per_node": _safe_float(ram_gb),
+                "unschedulable_pods": _safe_int(unschedulable),
             })
 
     return {
@@ -684,7 +874,7 @@ def _parse_json_contract(content: str) -> dict[str, Any]:
 def parse_sizing_file(filepath: str) -> dict[str, Any]:
     """Parse a sizing file and return normalized sizing context for addons."""
     path = Path(filepath)
-    content = path.read_text()
+    content = _read_report(path)
 
     # JSON contract path (preferred)
     try:
@@ -707,10 +897,13 @@ if __name__ == "__main__":
     filepath = sys.argv[1]
     parser = SizingReportParser.from_file(filepath)
 
+    # json.dump streams to stdout instead of building each dump as a string
     print("=== Parsed Data ===")
     data = parser.parse()
-    print(json.dumps(data, indent=2, default=str))
+    json.dump(data, sys.stdout, indent=2, default=str)
+    sys.stdout.write("\n")
 
     print("\n=== Sizing Context ===")
     context = parser.to_sizing_context()
-    print(json.dumps(context, indent=2, default=str))
+    json.dump(context, sys.stdout, indent=2, default=str)
+    sys.stdout.write("\n")
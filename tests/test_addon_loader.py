@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+import itertools
+import json
+import os
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.addon_loader import _MODULE_CACHE, AddonLoader
+
+CATEGORIES = ["elasticsearch", "kubernetes", "terraform", "azure", "gitops", "generic", ""]
+GITOPS_TOOLS = ["flux", "argo", "none", ""]
+IAC_TOOLS = ["terraform", "pulumi", ""]
+PLATFORMS = ["aks", "rke2", "openshift", "proxmox", ""]
+DESCRIPTIONS = ["", "azure landing zone", "Elastic on AKS", "nothing to see"]
+
+
+def reference_match(loader, analysis, context, interactive_mode):
+    """Trigger rules applied to every discovered addon in turn, without the indexes."""
+    primary_category = analysis.get("primary_category", "")
+    gitops_tool = context.get("gitops_tool", "")
+    iac_tool = context.get("iac_tool", "")
+    platform = context.get("platform", "")
+    sizing_context = context.get("sizing_context") or {}
+    full_text = f"{analysis.get('project_name', '')} {analysis.get('description', '')}".lower()
+
+    matched = []
+    for spec in loader.discover_addons():
+        if spec.name == "eck_deployment" and sizing_context.get("source") == "sizing_report":
+            matched.append(spec)
+            continue
+        if spec.interactive_only and not interactive_mode:
+            continue
+
+        triggers = spec.triggers
+        trigger_gitops = triggers.get("gitops_tool", "")
+        trigger_iac_tools = triggers.get("iac_tools", [])
+        trigger_platforms = triggers.get("platforms", [])
+        trigger_categories = triggers.get("categories", [])
+        trigger_keywords = triggers.get("keywords", [])
+        iac_mismatch = bool(trigger_iac_tools) and iac_tool not in trigger_iac_tools
+
+        if triggers.get("default", False):
+            if gitops_tool == "none" and trigger_gitops:
+                continue
+            if gitops_tool and trigger_gitops and trigger_gitops != gitops_tool:
+                continue
+            if not iac_mismatch:
+                matched.append(spec)
+            continue
+        if trigger_iac_tools and iac_tool in trigger_iac_tools and not (
+            trigger_platforms or trigger_categories or trigger_keywords or trigger_gitops
+        ):
+            matched.append(spec)
+            continue
+        if gitops_tool:
+            if trigger_gitops and trigger_gitops != gitops_tool:
+                continue
+            if trigger_gitops == gitops_tool:
+                matched.append(spec)
+                continue
+        if trigger_platforms and platform in trigger_platforms:
+            if not iac_mismatch:
+                matched.append(spec)
+            continue
+        if trigger_categories:
+            if trigger_gitops and gitops_tool:
+                continue
+            if primary_category in trigger_categories:
+                if not iac_mismatch:
+                    matched.append(spec)
+                continue
+        if any(keyword.lower() in full_text for keyword in trigger_keywords) and not iac_mismatch:
+            matched.append(spec)
+
+    # discover_addons() is already in priority order
+    return list(dict.fromkeys(spec.name for spec in matched))
+
+
+def random_triggers(rng):
+    triggers = {}
+    if rng.random() < 0.2:
+        triggers["default"] = True
+    if rng.random() < 0.3:
+        triggers["gitops_tool"] = rng.choice(["flux", "argo"])
+    if rng.random() < 0.3:
+        triggers["iac_tools"] = rng.sample(["terraform", "pulumi"], rng.randint(1, 2))
+    if rng.random() < 0.3:
+        triggers["platforms"] = rng.sample(PLATFORMS[:-1], 2)
+    if rng.random() < 0.3:
+        triggers["categories"] = rng.sample(CATEGORIES[:-1], 2)
+    if rng.random() < 0.3:
+        triggers["keywords"] = rng.sample(["azure", "aks", "elastic", "AKS", "Elastic"], 2)
+    if rng.random() < 0.1:
+        triggers["interactive_only"] = True
+    return triggers
+
+
+class TestMatchAddons(unittest.TestCase):
+    def assertMatchesReference(self, loader, cases) -> None:
+        for analysis, context, interactive_mode in cases:
+            got = [spec.name for spec in loader.match_addons(analysis, context, interactive_mode)]
+            want = reference_match(loader, analysis, context, interactive_mode)
+            self.assertEqual(got, want, (analysis, context, interactive_mode))
+
+    def test_shipped_config_matches_reference_rules(self) -> None:
+        loader = AddonLoader()
+        cases = []
+        for category, gitops, iac, platform, desc, interactive, sized in itertools.product(
+            CATEGORIES, GITOPS_TOOLS, IAC_TOOLS, PLATFORMS, DESCRIPTIONS, (False, True), (False, True)
+        ):
+            context = {"gitops_tool": gitops, "iac_tool": iac, "platform": platform}
+            if sized:
+                context["sizing_context"] = {"source": "sizing_report"}
+            analysis = {"primary_category": category, "project_name": "demo", "description": desc}
+            cases.append((analysis, context, interactive))
+        self.assertMatchesReference(loader, cases)
+
+    def test_random_configs_match_reference_rules(self) -> None:
+        rng = random.Random(0)
+        for _ in range(20):
+            with tempfile.TemporaryDirectory(prefix="pi-addon-match-") as td:
+                root = Path(td)
+                (root / "addons").mkdir()
+                addons = {
+                    f"addon_{i}": {"priority": rng.randint(1, 5), "triggers": random_triggers(rng)}
+                    for i in range(8)
+                }
+                addons["eck_deployment"] = {"priority": rng.randint(1, 5), "triggers": random_triggers(rng)}
+                for name in addons:
+                    (root / "addons" / f"{name}.py").write_text("ADDON_META = {}\n")
+                (root / "priority_chains.json").write_text(json.dumps({"addons": addons}))
+
+                loader = AddonLoader(str(root))
+                cases = []
+                for _ in range(200):
+                    context = {
+                        "gitops_tool": rng.choice(GITOPS_TOOLS),
+                        "iac_tool": rng.choice(IAC_TOOLS),
+                        "platform": rng.choice(PLATFORMS),
+                    }
+                    if rng.random() < 0.3:
+                        context["sizing_context"] = {"source": "sizing_report"}
+                    analysis = {
+                        "primary_category": rng.choice(CATEGORIES),
+                        "project_name": rng.choice(["", "demo", "aksproj"]),
+                        "description": rng.choice(DESCRIPTIONS),
+                    }
+                    cases.append((analysis, context, rng.random() < 0.5))
+                self.assertMatchesReference(loader, cases)
+
+
+class TestAddonCaches(unittest.TestCase):
+    def setUp(self) -> None:
+        td = tempfile.TemporaryDirectory(prefix="pi-addon-cache-")
+        self.addCleanup(td.cleanup)
+        self.root = Path(td.name)
+        (self.root / "addons").mkdir()
+        (self.root / "priority_chains.json").write_text('{"addons": {}}')
+
+    def write_addon(self, name: str, source: str, mtime: float) -> Path:
+        path = self.root / "addons" / f"{name}.py"
+        path.write_text(source)
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def test_loaded_module_is_reused_until_its_file_changes(self) -> None:
+        path = self.write_addon("sample", "VALUE = 1\n", 1_000_000)
+        self.addCleanup(_MODULE_CACHE.pop, path, None)
+        loader = AddonLoader(str(self.root))
+        spec = loader.discover_addons()[0]
+
+        first = loader.load_addon(spec)
+        self.assertEqual(first.VALUE, 1)
+        # A fresh loader in the same process shares the module cache
+        self.assertIs(AddonLoader(str(self.root)).load_addon(spec), first)
+
+        self.write_addon("sample", "VALUE = 22\n", 1_000_100)
+        second = loader.load_addon(spec)
+        self.assertIsNot(second, first)
+        self.assertEqual(second.VALUE, 22)
+
+
+    def test_discovery_is_rescanned_when_the_addons_dir_changes(self) -> None:
+        addons_dir = self.root / "addons"
+        self.write_addon("first", "", 1_000_000)
+        os.utime(addons_dir, (1_000_000, 1_000_000))
+        loader = AddonLoader(str(self.root))
+        self.assertEqual([spec.name for spec in loader.discover_addons()], ["first"])
+
+        self.write_addon("second", "", 1_000_000)
+        # Same directory mtime: the cached listing is still used
+        os.utime(addons_dir, (1_000_000, 1_000_000))
+        self.assertEqual([spec.name for spec in loader.discover_addons()], ["first"])
+
+        os.utime(addons_dir, (1_000_100, 1_000_100))
+        self.assertEqual(sorted(spec.name for spec in loader.discover_addons()), ["first", "second"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+import gzip
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+try:
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from starlette.middleware.cors import CORSMiddleware
+except ImportError:  # the UI backend's dependencies are optional
+    FastAPI = None
+
+if FastAPI is not None:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "ui-draft" / "backend"))
+    import backend_api
+
+
+def _cors_app(middleware, **options) -> "FastAPI":
+    app = FastAPI()
+
+    @app.get("/plain")
+    def plain():
+        return {"ok": True}
+
+    @app.get("/preset")
+    def preset():
+        return backend_api.Response(
+            "x",
+            headers={
+                "vary": "Accept-Encoding",
+                "access-control-allow-origin": "http://other",
+                "access-control-allow-credentials": "false",
+            },
+        )
+
+    app.add_middleware(middleware, **options)
+    return app
+
+
+def _snapshot(response):
+    headers = sorted((k, v) for k, v in response.headers.items() if k not in ("date", "content-length"))
+    return response.status_code, headers, response.text
+
+
+@unittest.skipIf(FastAPI is None, "fastapi is not installed")
+class TestLocalCORSMiddleware(unittest.TestCase):
+    def test_responses_match_starlette_cors(self) -> None:
+        ours = TestClient(_cors_app(backend_api.LocalCORSMiddleware))
+        # The method list is spelled out: what "*" expands to varies
+        # between Starlette releases
+        reference = TestClient(
+            _cors_app(
+                CORSMiddleware,
+                allow_origins=list(backend_api.CORS_ORIGINS),
+                allow_credentials=True,
+                allow_methods=list(backend_api._CORS_METHODS),
+                allow_headers=["*"],
+            )
+        )
+        origins = [None, "http://localhost", "tauri://localhost", "http://evil.example"]
+        cases = []
+        for origin in origins:
+            base = {} if origin is None else {"Origin": origin}
+            cases += [
+                ("GET", "/plain", base),
+                ("GET", "/preset", base),
+                ("GET", "/missing", base),
+                ("OPTIONS", "/plain", base),
+                ("OPTIONS", "/plain", {**base, "Access-Control-Request-Method": "POST"}),
+                ("OPTIONS", "/plain", {**base, "Access-Control-Request-Method": "PROPFIND"}),
+                (
+                    "OPTIONS",
+                    "/plain",
+                    {
+                        **base,
+                        "Access-Control-Request-Method": "GET",
+                        "Access-Control-Request-Headers": "content-type, x-custom",
+                    },
+                ),
+            ]
+        for method, url, headers in cases:
+            with self.subTest(method=method, url=url, headers=headers):
+                self.assertEqual(
+                    _snapshot(ours.request(method, url, headers=headers)),
+                    _snapshot(reference.request(method, url, headers=headers)),
+                )
+
+
+@unittest.skipIf(FastAPI is None, "fastapi is not installed")
+class TestPrecompressedStaticFiles(unittest.TestCase):
+    def setUp(self) -> None:
+        td = tempfile.TemporaryDirectory(prefix="pi-static-")
+        self.addCleanup(td.cleanup)
+        root = Path(td.name)
+        self.source = b"console.log('app');\n" * 50
+        (root / "app.js").write_bytes(self.source)
+        (root / "app.js.gz").write_bytes(gzip.compress(self.source))
+        (root / "plain.css").write_text("body {}\n")
+        app = FastAPI()
+        app.mount("/static", backend_api.PrecompressedStaticFiles(directory=td.name), name="static")
+        self.client = TestClient(app)
+
+    def get(self, path: str, accept_encoding: str):
+        return self.client.get(path, headers={"Accept-Encoding": accept_encoding})
+
+    def test_gzip_sibling_is_served_when_accepted(self) -> None:
+        response = self.get("/static/app.js", "gzip, deflate")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertEqual(response.headers["vary"], "Accept-Encoding")
+        # Same media type as the uncompressed file, not application/gzip
+        plain = self.get("/static/app.js", "identity")
+        self.assertEqual(response.headers["content-type"], plain.headers["content-type"])
+        # The client decodes the gzip body transparently
+        self.assertEqual(response.content, self.source)
+
+    def test_original_file_is_served_otherwise(self) -> None:
+        for accept_encoding in ("identity", "gzip;q=0", "br"):
+            with self.subTest(accept_encoding=accept_encoding):
+                response = self.get("/static/app.js", accept_encoding)
+                self.assertEqual(response.status_code, 200)
+                self.assertNotIn("content-encoding", response.headers)
+                self.assertEqual(response.content, self.source)
+
+        response = self.get("/static/plain.css", "gzip")
+        self.assertNotIn("content-encoding", response.headers)
+        self.assertEqual(response.text, "body {}\n")
+        self.assertEqual(self.get("/static/missing.js", "gzip").status_code, 404)
+
+
+@unittest.skipIf(FastAPI is None, "fastapi is not installed")
+class TestSuggestChildren(unittest.TestCase):
+    def setUp(self) -> None:
+        td = tempfile.TemporaryDirectory(prefix="pi-suggest-")
+        self.addCleanup(td.cleanup)
+        self.home = os.path.realpath(td.name)
+        # Treat the temp dir as the user's home for the accessibility check
+        for name, value in (("_HOME_STR", self.home), ("_HOME_PREFIX", os.path.join(self.home, ""))):
+            patcher = mock.patch.object(backend_api, name, os.path.normcase(value))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.parent = Path(self.home) / "work"
+        self.parent.mkdir()
+
+    def suggest(self, prefix: str = "") -> list:
+        mtime_ns = os.stat(self.parent).st_mtime_ns
+        return list(backend_api._suggest_children(str(self.parent), mtime_ns, prefix, 12))
+
+    def set_parent_mtime(self, seconds: int) -> None:
+        os.utime(self.parent, (seconds, seconds))
+
+    def test_listing_filters_and_sorts_directories(self) -> None:
+        for name in ("beta", "Alpha", "alpine"):
+            (self.parent / name).mkdir()
+        (self.parent / "also-a-file").write_text("")
+        outside = tempfile.TemporaryDirectory(prefix="pi-outside-")
+        self.addCleanup(outside.cleanup)
+        os.symlink(outside.name, self.parent / "al-link")
+        self.set_parent_mtime(1_000_000)
+        self.assertEqual(self.suggest("al"), [str(self.parent / "Alpha"), str(self.parent / "alpine")])
+        self.assertEqual(len(self.suggest()), 3)
+
+    def test_listing_is_refreshed_when_the_directory_changes(self) -> None:
+        (self.parent / "first").mkdir()
+        self.set_parent_mtime(1_000_000)
+        self.assertEqual(self.suggest(), [str(self.parent / "first")])
+
+        (self.parent / "second").mkdir()
+        self.set_parent_mtime(1_000_000)
+        # Unchanged mtime: the cached listing is returned
+        self.assertEqual(self.suggest(), [str(self.parent / "first")])
+
+        self.set_parent_mtime(1_000_100)
+        self.assertEqual(self.suggest(), [str(self.parent / "first"), str(self.parent / "second")])
+
+
+@unittest.skipIf(FastAPI is None, "fastapi is not installed")
+class TestWhich(unittest.TestCase):
+    def test_only_found_tools_are_cached(self) -> None:
+        self.addCleanup(backend_api._WHICH_CACHE.pop, "pi-test-tool", None)
+        with mock.patch.object(backend_api.shutil, "which", return_value=None) as which:
+            self.assertIsNone(backend_api._which("pi-test-tool"))
+            self.assertIsNone(backend_api._which("pi-test-tool"))
+            self.assertEqual(which.call_count, 2)
+        # Installed later: found on the next lookup, then served from the cache
+        with mock.patch.object(backend_api.shutil, "which", return_value="/usr/bin/pi-test-tool") as which:
+            self.assertEqual(backend_api._which("pi-test-tool"), "/usr/bin/pi-test-tool")
+            self.assertEqual(backend_api._which("pi-test-tool"), "/usr/bin/pi-test-tool")
+            self.assertEqual(which.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
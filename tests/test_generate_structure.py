@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.generate_structure import render_readme, render_template
+
+
+def reference_render(template: str, context: dict) -> str:
+    """Plain str.replace per context key."""
+    for key, value in context.items():
+        if isinstance(value, list):
+            value = ", ".join(str(v) for v in value)
+        template = template.replace("{{" + key + "}}", str(value))
+    return template
+
+
+class TestRenderTemplate(unittest.TestCase):
+    TEMPLATE = (
+        "# {{project_name}}\n\n{{project_description}}\n"
+        "Skills: {{skills}} | Count: {{count}} | {{unknown}} | {{ spaced }} | {single}\n"
+        "{{project_name}}{{project_name}}\n"
+    )
+
+    def test_matches_plain_replacement(self) -> None:
+        contexts = [
+            {"project_name": "demo", "project_description": "ES on AKS", "skills": ["a", "b"], "count": 3},
+            {"project_name": "", "project_description": "", "skills": [], "count": 0},
+            {"project_name": "x$1\\n", "project_description": "{single}", "skills": ["c"], "count": None},
+        ]
+        for context in contexts:
+            self.assertEqual(render_template(self.TEMPLATE, context), reference_render(self.TEMPLATE, context))
+
+    def test_cached_render_follows_context_changes(self) -> None:
+        context = {"project_name": "first", "skills": ["a"]}
+        self.assertIn("# first", render_template(self.TEMPLATE, context))
+        # The cache is keyed on values, so mutating the same dict re-renders
+        context["project_name"] = "second"
+        context["skills"].append("b")
+        rendered = render_template(self.TEMPLATE, context)
+        self.assertIn("# second", rendered)
+        self.assertIn("Skills: a, b", rendered)
+
+    def test_template_without_placeholders_is_returned_as_is(self) -> None:
+        self.assertEqual(render_template("plain {text}", {"text": "x"}), "plain {text}")
+
+
+class TestTemplateFiles(unittest.TestCase):
+    def test_edited_template_is_read_again(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="pi-templates-") as td:
+            path = Path(td) / "README_template.md"
+            path.write_text("v1 {{project_name}}\n")
+            os.utime(path, (1_000_000, 1_000_000))
+            self.assertEqual(render_readme({"project_name": "demo"}, str(path)), "v1 demo\n")
+
+            path.write_text("v2 {{project_name}}\n")
+            os.utime(path, (1_000_100, 1_000_100))
+            self.assertEqual(render_readme({"project_name": "demo"}, str(path)), "v2 demo\n")
+
+    def test_missing_template_uses_the_builtin_one(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="pi-templates-") as td:
+            rendered = render_readme(
+                {"project_name": "demo", "project_description": "desc"},
+                os.path.join(td, "absent.md"),
+            )
+        self.assertEqual(rendered, "# demo\n\ndesc\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
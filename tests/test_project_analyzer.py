@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+import json
+import os
+import random
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from scripts import project_analyzer
+from scripts.project_analyzer import (
+    ProjectAnalyzer,
+    _build_config_state,
+    _compile_keyword_index,
+    _list_installed_skills,
+    get_analyzer,
+)
+
+WORDS = (
+    "elasticsearch es eck elastic kibana logstash kubernetes k8s openshift container "
+    "helm terraform iac cloud azure aks microsoft fluxcd flux gitops argocd kustomize "
+    "foo the ES K8S es-cluster es. e-s eck_operator"
+).split()
+
+
+class TestKeywordScoring(unittest.TestCase):
+    def test_single_scan_matches_per_keyword_patterns(self) -> None:
+        analyzer = ProjectAnalyzer()
+        self.assertIsNotNone(analyzer._state.keyword_index)
+        fallback = ProjectAnalyzer()
+        fallback._state = fallback._state._replace(keyword_index=None)
+
+        rng = random.Random(0)
+        for _ in range(2000):
+            desc = " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 8)))
+            name = rng.choice(["", "demo", "es-demo", "aks"])
+            self.assertEqual(
+                analyzer.analyze_project_description(desc, name),
+                fallback.analyze_project_description(desc, name),
+                (name, desc),
+            )
+
+    def test_keywords_that_are_not_plain_words_use_the_fallback(self) -> None:
+        items = (("ci", ("ci/cd", "pipeline")),)
+        self.assertIsNone(_compile_keyword_index(items))
+        # A keyword listed under two categories also needs the fallback
+        self.assertIsNone(_compile_keyword_index((("a", ("x",)), ("b", ("x",)))))
+
+        analyzer = ProjectAnalyzer()
+        analyzer._state = _build_config_state({"keyword_mapping": {"ci": ["ci/cd", "pipeline"]}})
+        self.assertIsNone(analyzer._state.keyword_index)
+        result = analyzer.analyze_project_description("ci/cd pipeline, pipelines")
+        self.assertEqual(result["category_scores"], {"ci": 2})
+        self.assertEqual(result["primary_category"], "ci")
+
+
+class TestSharedAnalyzer(unittest.TestCase):
+    def test_config_edits_are_picked_up_and_unchanged_config_is_reused(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="pi-analyzer-") as td:
+            self.addCleanup(project_analyzer._ANALYZER_CACHE.pop, td, None)
+            config_file = Path(td) / "priority_chains.json"
+            config = {"priority_chains": {"default": []}, "keyword_mapping": {"alpha": ["one"]}}
+            config_file.write_text(json.dumps(config))
+            os.utime(config_file, (1_000_000, 1_000_000))
+
+            analyzer = get_analyzer(td)
+            state = analyzer._state
+            self.assertEqual(analyzer.analyze_project_description("one")["primary_category"], "alpha")
+            # An unchanged file keeps the analyzer and its derived state
+            self.assertIs(get_analyzer(td), analyzer)
+            self.assertIs(analyzer._state, state)
+
+            config["keyword_mapping"] = {"beta": ["one", "two"]}
+            config_file.write_text(json.dumps(config))
+            os.utime(config_file, (1_000_100, 1_000_100))
+            self.assertIs(get_analyzer(td), analyzer)
+            self.assertIsNot(analyzer._state, state)
+            self.assertEqual(analyzer.keyword_mapping, {"beta": ("one", "two")})
+            self.assertEqual(analyzer.analyze_project_description("one")["primary_category"], "beta")
+
+
+class TestInstalledSkills(unittest.TestCase):
+    def test_listing_is_reused_within_the_ttl(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="pi-skills-") as td:
+            root = Path(td)
+            self.addCleanup(project_analyzer._skills_index_cache.pop, td, None)
+            (root / "first").mkdir()
+            os.symlink(root / "missing", root / "dangling")
+            now = 1000.0
+            with mock.patch.object(project_analyzer.time, "monotonic", lambda: now):
+                self.assertEqual(_list_installed_skills(td), {"first"})
+                (root / "second").mkdir()
+                now += project_analyzer._SKILLS_INDEX_TTL / 2
+                self.assertEqual(_list_installed_skills(td), {"first"})
+                now += project_analyzer._SKILLS_INDEX_TTL
+                self.assertEqual(_list_installed_skills(td), {"first", "second"})
+
+    def test_missing_skills_dir_lists_nothing(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="pi-skills-") as td:
+            missing = os.path.join(td, "absent")
+            self.addCleanup(project_analyzer._skills_index_cache.pop, missing, None)
+            self.assertEqual(_list_installed_skills(missing), frozenset())
+
+
+if __name__ == "__main__":
+    unittest.main()
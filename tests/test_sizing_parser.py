@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+import json
+import unittest
+from pathlib import Path
+
+from scripts.sizing_parser import SizingReportParser, parse_sizing_file
+
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+SAMPLES = ("sample-sizing-aks-v064", "sample-sizing-openshift-v064")
+
+
+def as_json(value):
+    """Compare the way callers see the result once serialized (tuples become lists)."""
+    return json.loads(json.dumps(value))
+
+
+class TestSampleReports(unittest.TestCase):
+    def test_sample_reports_match_recorded_output(self) -> None:
+        for sample in SAMPLES:
+            with self.subTest(sample=sample):
+                report = str(ROOT / "docs" / f"{sample}.md")
+                expected = json.loads((FIXTURES / f"{sample}.json").read_text(encoding="utf-8"))
+                self.assertEqual(as_json(SizingReportParser.from_file(report).parse()), expected["parse"])
+                self.assertEqual(as_json(parse_sizing_file(report)), expected["context"])
+
+    def test_parse_runs_once_per_parser(self) -> None:
+        parser = SizingReportParser.from_file(str(ROOT / "docs" / f"{SAMPLES[0]}.md"))
+        first = parser.parse()
+        self.assertIs(parser.parse(), first)
+        self.assertIs(parser.to_sizing_context()["raw"], first)
+        # A new parser over the same text parses it again, to an equal result
+        other = SizingReportParser(parser.content, parser.filepath)
+        self.assertIsNot(other.parse(), first)
+        self.assertEqual(other.parse(), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+import ast
+import tempfile
+import unittest
+from pathlib import Path
+
+from addons.terraform_aks import TerraformAKSGenerator
+
+ADDON_PATH = Path(__file__).resolve().parent.parent / "addons" / "terraform_aks.py"
+
+
+class TestTerraformAKS(unittest.TestCase):
+    def test_templates_are_not_dedented_at_render_time(self) -> None:
+        tree = ast.parse(ADDON_PATH.read_text(encoding="utf-8"))
+        offenders = []
+        for func in ast.walk(tree):
+            if not isinstance(func, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            for node in ast.walk(func):
+                if not isinstance(node, ast.Call):
+                    continue
+                target = node.func
+                name = target.attr if isinstance(target, ast.Attribute) else getattr(target, "id", "")
+                if name == "dedent":
+                    offenders.append(f"{func.name}:{node.lineno}")
+        self.assertEqual(offenders, [], "dedent templates at module scope, not per call")
+
+    def test_disabled_frozen_tier_is_left_out_of_root_module(self) -> None:
+        files = TerraformAKSGenerator("demo", "aks cluster").generate()
+        for path in ("terraform/main.tf", "terraform/variables.tf", "terraform/terraform.tfvars.example"):
+            self.assertNotIn("es_frozen", files[path])
+        self.assertIn("es_frozen_enabled", files["terraform/modules/aks/variables.tf"])
+
+    def test_generate_bytes_matches_generate(self) -> None:
+        generator = TerraformAKSGenerator("demo", "aks cluster")
+        files = generator.generate()
+        encoded = generator.generate_bytes()
+        self.assertEqual(list(encoded), list(files))
+        for path, content in files.items():
+            self.assertEqual(encoded[path].decode("utf-8"), content)
+
+    def test_generate_as_stream_index_slices_each_file(self) -> None:
+        generator = TerraformAKSGenerator("demo", "aks cluster")
+        files = generator.generate()
+        buffer, index = generator.generate_as_stream()
+        self.assertEqual([path for path, _, _ in index], list(files))
+        offset = 0
+        for path, start, length in index:
+            # Files are packed back to back in index order
+            self.assertEqual(start, offset)
+            self.assertEqual(buffer[start:start + length].decode("utf-8"), files[path])
+            offset = start + length
+        self.assertEqual(offset, len(buffer))
+
+    def test_generate_to_dir_writes_every_file(self) -> None:
+        generator = TerraformAKSGenerator("demo", "aks cluster")
+        files = generator.generate()
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            written = generator.generate_to_dir(root)
+            self.assertEqual(written, [root / path for path in files])
+            on_disk = sorted(p.relative_to(root).as_posix() for p in root.rglob("*") if p.is_file())
+            self.assertEqual(on_disk, sorted(files))
+            for path, content in files.items():
+                self.assertEqual((root / path).read_bytes().decode("utf-8"), content)
+
+
+if __name__ == "__main__":
+    unittest.main()
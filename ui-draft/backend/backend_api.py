@@ -4,19 +4,24 @@
 Draft API for a professional internal UI around project-initializer.
 """
 
+import asyncio
+import functools
 import json
 import os
+import re
 import shutil
+import stat
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path, PurePosixPath
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import FastAPI, File, Form, HTTPException, UploadFile
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, File, Form, HTTPException, Request, UploadFile
+from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
 
 
 if getattr(sys, "frozen", False):
@@ -26,16 +31,22 @@ else:
 
 FRONTEND_DIR = ROOT_DIR / "ui-draft" / "frontend"
 SCRIPTS_DIR = ROOT_DIR / "scripts"
+# String forms used per request, computed once
+_ROOT_STR = str(ROOT_DIR)
+_SCRIPTS_STR = str(SCRIPTS_DIR)
+_FRONTEND_STR = str(FRONTEND_DIR)
+_INDEX_HTML = str(FRONTEND_DIR / "index.html")
 
-sys.path.insert(0, str(SCRIPTS_DIR))
+if _SCRIPTS_STR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_STR)
 
-from project_analyzer import ProjectAnalyzer, analyze_project  # type: ignore  # noqa: E402
+from project_analyzer import analyze_project, get_analyzer  # type: ignore  # noqa: E402
 from generate_structure import initialize_project  # type: ignore  # noqa: E402
 from sizing_parser import parse_sizing_file  # type: ignore  # noqa: E402
 
 
 USER_HOME = Path.home()
-SYSTEM_DIRECTORIES = {
+SYSTEM_DIRECTORIES = frozenset({
     "/",
     "/root",
     "/bin",
@@ -51,32 +62,61 @@ SYSTEM_DIRECTORIES = {
     "/opt",
     "/sbin",
     "/srv",
-}
+})
+# String forms for prefix checks in _is_user_accessible()
+_HOME_STR = os.path.normcase(str(USER_HOME))
+_HOME_PREFIX = os.path.join(_HOME_STR, "")
+_FS_ROOT = Path("/")
+_IS_LINUX = sys.platform.startswith("linux")
+# Read size when copying an upload into its temp file
+_UPLOAD_CHUNK = 64 * 1024
+# Scaffold generation and sizing parsing block; they run here so the event
+# loop keeps answering other requests meanwhile
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pi-backend")
+
+
+def _spool_upload(src: Any, suffix: str) -> Path:
+    """Copy an upload's file object into a named temp file and return its path."""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        shutil.copyfileobj(src, tmp, _UPLOAD_CHUNK)
+    return Path(tmp.name)
+
+
+async def _in_executor(func: Any, *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking call on the shared worker pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_EXECUTOR, functools.partial(func, *args, **kwargs))
 
 
 def _is_user_home(path: Path) -> bool:
     """Check if path is the current user's home directory."""
-    try:
-        resolved = path.resolve()
-        return resolved == USER_HOME
-    except (OSError, RuntimeError):
-        return False
+    return os.path.normcase(os.path.realpath(path)) == _HOME_STR
 
 
 def _is_user_accessible(path: Path) -> bool:
     """Check if path is under current user's home (not other users)."""
-    try:
-        resolved = path.resolve()
-        if resolved == USER_HOME:
-            return True
-        try:
-            resolved.relative_to(USER_HOME)
-            return True
-        except ValueError:
-            pass
-        return False
-    except (OSError, RuntimeError):
-        return False
+    return _is_under_home(os.path.realpath(path))
+
+
+def _is_under_home(resolved: str) -> bool:
+    """_is_user_accessible() for an already resolved path string."""
+    resolved = os.path.normcase(resolved)
+    return resolved == _HOME_STR or resolved.startswith(_HOME_PREFIX)
+
+
+# Resolved tool paths. Misses are not stored, so a tool installed while the
+# backend runs is found on the next request.
+_WHICH_CACHE: Dict[str, str] = {}
+
+
+def _which(tool: str) -> Optional[str]:
+    """shutil.which(), remembering only the tools that were found."""
+    path = _WHICH_CACHE.get(tool)
+    if path is None:
+        path = shutil.which(tool)
+        if path is not None:
+            _WHICH_CACHE[tool] = path
+    return path
 
 
 def _get_default_suggestions() -> List[str]:
@@ -96,40 +136,196 @@ def _get_default_suggestions() -> List[str]:
     return suggestions[:5]
 
 
-app = FastAPI(title="Project Initializer UI API", version="0.1.0")
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost", "http://127.0.0.1", "tauri://localhost"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+def _accepts_gzip(accept_encoding: str) -> bool:
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        if coding.strip().lower() == "gzip":
+            q = params.replace(" ", "").lower()
+            if not q.startswith("q="):
+                return True
+            try:
+                return float(q[2:]) > 0
+            except ValueError:
+                return False
+    return False
+
+
+def _frontend_file(path: str, media_type: Optional[str], accept_encoding: str) -> Optional[FileResponse]:
+    """Serve the bundled ``.gz`` variant of a frontend file, if any and accepted.
+
+    package_backend.py writes these next to the text assets it bundles.
+    """
+    gz_path = path + ".gz"
+    if not _accepts_gzip(accept_encoding) or not os.path.isfile(gz_path):
+        return None
+    return FileResponse(
+        gz_path,
+        media_type=media_type,
+        headers={"content-encoding": "gzip", "vary": "Accept-Encoding"},
+    )
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that prefers a file's pre-compressed ``.gz`` sibling."""
+
+    async def get_response(self, path: str, scope: Dict[str, Any]) -> Response:
+        response = await super().get_response(path, scope)
+        if isinstance(response, FileResponse) and response.status_code == 200:
+            accept = Headers(scope=scope).get("accept-encoding", "")
+            compressed = _frontend_file(str(response.path), response.media_type, accept)
+            if compressed is not None:
+                return compressed
+        return response
+
+
+CORS_ORIGINS = ("http://localhost", "http://127.0.0.1", "tauri://localhost")
+_CORS_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+_CORS_PREFLIGHT_HEADERS = [
+    (
+        b"vary",
+        b"Origin, Access-Control-Request-Method, Access-Control-Request-Headers, "
+        b"Access-Control-Request-Private-Network",
+    ),
+    (b"access-control-allow-methods", ", ".join(_CORS_METHODS).encode()),
+    (b"access-control-max-age", b"600"),
+    (b"access-control-allow-credentials", b"true"),
+]
+
+
+class LocalCORSMiddleware:
+    """Pure-ASGI CORS for a fixed origin list, with credentials and any method/header.
+
+    Answers like Starlette's CORSMiddleware configured that way, but works on
+    the raw ASGI header lists instead of building Headers/Response objects
+    for every request.
+    """
+
+    def __init__(self, app: Any, origins: tuple = CORS_ORIGINS) -> None:
+        self.app = app
+        self.allowed = frozenset(o.encode("latin-1") for o in origins)
+        self.methods = frozenset(m.encode("latin-1") for m in _CORS_METHODS)
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # First occurrence wins, as with Starlette's Headers.get()
+        request: Dict[bytes, bytes] = {}
+        for name, value in scope["headers"]:
+            request.setdefault(name, value)
+        origin = request.get(b"origin")
+
+        if origin is not None and scope["method"] == "OPTIONS" and b"access-control-request-method" in request:
+            await self._preflight(origin, request, send)
+            return
+
+        allowed = origin is not None and origin in self.allowed
+
+        async def send_with_cors(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                vary: List[bytes] = []
+                headers: List[Any] = []
+                for name, value in message.get("headers", ()):
+                    if name == b"vary":
+                        vary.append(value)
+                    elif origin is not None and name == b"access-control-allow-credentials":
+                        continue
+                    elif allowed and name == b"access-control-allow-origin":
+                        continue
+                    else:
+                        headers.append((name, value))
+                if origin is not None:
+                    headers.append((b"access-control-allow-credentials", b"true"))
+                if allowed:
+                    headers.append((b"access-control-allow-origin", origin))
+                vary.append(b"Origin")
+                headers.append((b"vary", b", ".join(vary)))
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight(self, origin: bytes, request: Dict[bytes, bytes], send: Any) -> None:
+        headers = list(_CORS_PREFLIGHT_HEADERS)
+        failures: List[str] = []
+        if origin in self.allowed:
+            headers.append((b"access-control-allow-origin", origin))
+        else:
+            failures.append("origin")
+        if request[b"access-control-request-method"] not in self.methods:
+            failures.append("method")
+        requested_headers = request.get(b"access-control-request-headers")
+        if requested_headers is not None:
+            headers.append((b"access-control-allow-headers", requested_headers))
+        if b"access-control-request-private-network" in request:
+            failures.append("private-network")
+
+        body = ("Disallowed CORS " + ", ".join(failures)).encode() if failures else b"OK"
+        headers.append((b"content-length", str(len(body)).encode()))
+        headers.append((b"content-type", b"text/plain; charset=utf-8"))
+        await send({"type": "http.response.start", "status": 400 if failures else 200, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+# The packaged desktop build serves no API docs; PI_UI_DEV=1 turns them back on
+_API_DOCS = not getattr(sys, "frozen", False) or os.environ.get("PI_UI_DEV") == "1"
+app = FastAPI(
+    title="Project Initializer UI API",
+    version="0.1.0",
+    docs_url="/docs" if _API_DOCS else None,
+    redoc_url="/redoc" if _API_DOCS else None,
+    openapi_url="/openapi.json" if _API_DOCS else None,
 )
+app.add_middleware(LocalCORSMiddleware, origins=CORS_ORIGINS)
 if FRONTEND_DIR.exists():
-    app.mount("/static", StaticFiles(directory=str(FRONTEND_DIR)), name="static")
+    app.mount("/static", PrecompressedStaticFiles(directory=_FRONTEND_STR, check_dir=False), name="static")
+
+
+# Git steps whose stdout is empty in practice; it goes to /dev/null unread
+_GIT_QUIET_STDOUT = frozenset({("add", "."), ("remote", "remove")})
+
+
+def _git_stdout_target(command: List[str], pipe: int) -> int:
+    return subprocess.DEVNULL if tuple(command[1:3]) in _GIT_QUIET_STDOUT else pipe
+
+
+def _git_result(command: List[str], returncode: int, out: Optional[bytes], err: bytes) -> Dict[str, Any]:
+    stderr = err.decode(errors="replace").strip()
+    if returncode and not stderr:
+        stderr = str(subprocess.CalledProcessError(returncode, command))
+    return {
+        "ok": returncode == 0,
+        "command": " ".join(command),
+        "stdout": out.decode(errors="replace").strip() if out else "",
+        "stderr": stderr,
+    }
 
 
 def _run_git_command(command: List[str], cwd: Path) -> Dict[str, Any]:
-    try:
-        proc = subprocess.run(
-            command,
-            cwd=str(cwd),
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return {
-            "ok": True,
-            "command": " ".join(command),
-            "stdout": proc.stdout.strip(),
-            "stderr": proc.stderr.strip(),
-        }
-    except subprocess.CalledProcessError as exc:
-        return {
-            "ok": False,
-            "command": " ".join(command),
-            "stdout": (exc.stdout or "").strip(),
-            "stderr": (exc.stderr or str(exc)).strip(),
-        }
+    proc = subprocess.run(
+        command,
+        cwd=str(cwd),
+        stdout=_git_stdout_target(command, subprocess.PIPE),
+        stderr=subprocess.PIPE,
+    )
+    return _git_result(command, proc.returncode, proc.stdout, proc.stderr)
+
+
+async def _run_git_async(command: List[str], cwd: Path) -> Dict[str, Any]:
+    """_run_git_command() on an asyncio subprocess, leaving the event loop free."""
+    proc = await asyncio.create_subprocess_exec(
+        *command,
+        cwd=str(cwd),
+        stdout=_git_stdout_target(command, asyncio.subprocess.PIPE),
+        stderr=asyncio.subprocess.PIPE,
+    )
+    out, err = await proc.communicate()
+    return _git_result(command, proc.returncode, out, err)
+
+
+async def _run_git_sequence(commands: List[List[str]], cwd: Path) -> List[Dict[str, Any]]:
+    return [await _run_git_async(command, cwd) for command in commands]
 
 
 def _run_shell_command(command: List[str], cwd: Path) -> Dict[str, Any]:
@@ -195,63 +391,71 @@ def _apply_forced_type(desc: str, forced_type: str) -> str:
 
 
 def _normalize_target_dir(target_dir: str) -> str:
-    path = Path(target_dir).expanduser()
-    if not path.is_absolute():
-        path = Path.home() / path
-    return str(path.resolve())
+    return os.path.realpath(_expand_input_str(target_dir))
+
+
+def _expand_input_str(raw_path: str) -> str:
+    """Expand ``~`` and anchor relative input at the home directory, as a string."""
+    expanded = os.path.expanduser(raw_path or "")
+    if not os.path.isabs(expanded):
+        expanded = os.path.join(_HOME_STR, expanded)
+    return expanded
 
 
 def _expand_input_path(raw_path: str) -> Path:
-    p = Path(raw_path or "").expanduser()
-    if not p.is_absolute():
-        p = Path.home() / p
-    return p
+    return Path(_expand_input_str(raw_path))
+
+
+# Description keywords per platform, in priority order
+_PLATFORM_KEYWORDS = (
+    ("openshift", ("openshift", "ocp", "redhat", "okd")),
+    ("rke2", ("rke2", "rancher")),
+    ("proxmox", ("proxmox", "pve")),
+    ("aks", ("aks", "azure kubernetes", "azure")),
+)
+_KEYWORD_PLATFORM = {kw: (rank, platform) for rank, (platform, kws) in enumerate(_PLATFORM_KEYWORDS) for kw in kws}
+# Lookahead so overlapping keywords are all seen ("rancheredhat" still
+# yields "redhat"); no two platforms share a keyword start position
+_PLATFORM_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(kw) for kw in sorted(_KEYWORD_PLATFORM, key=len, reverse=True)) + "))"
+)
+_INFRA_KEYWORD_RE = re.compile(
+    "|".join(re.escape(kw) for kw in (*_KEYWORD_PLATFORM, "terraform", "flux", "argo", "gitops"))
+)
 
 
 def _infer_platform_from_text(text: str) -> Optional[str]:
-    t = (text or "").lower()
-    if any(k in t for k in ["openshift", "ocp", "redhat", "okd"]):
-        return "openshift"
-    if any(k in t for k in ["rke2", "rancher"]):
-        return "rke2"
-    if any(k in t for k in ["proxmox", "pve"]):
-        return "proxmox"
-    if any(k in t for k in ["aks", "azure kubernetes", "azure"]):
-        return "aks"
-    return None
+    best = None
+    for m in _PLATFORM_KEYWORD_RE.finditer((text or "").lower()):
+        hit = _KEYWORD_PLATFORM[m.group(1)]
+        if best is None or hit < best:
+            best = hit
+            if hit[0] == 0:
+                break
+    return best[1] if best else None
 
 
 def _has_infra_keywords(text: str) -> bool:
     """Check if text contains any platform or gitops keywords."""
-    t = (text or "").lower()
-    keywords = [
-        "openshift", "ocp", "redhat", "okd",
-        "rke2", "rancher",
-        "proxmox", "pve",
-        "aks", "azure", "azure kubernetes",
-        "terraform",
-        "flux", "fluxcd", "argo", "argocd", "gitops",
-    ]
-    return any(k in t for k in keywords)
+    return _INFRA_KEYWORD_RE.search((text or "").lower()) is not None
 
 
 def _override_chain(result: Dict[str, Any], forced_chain: str) -> Dict[str, Any]:
     if not forced_chain:
         return result
-    analyzer = ProjectAnalyzer(config_path=str(ROOT_DIR))
-    return analyzer.override_chain(result, forced_chain)
+    return get_analyzer(_ROOT_STR).override_chain(result, forced_chain)
 
 
 def _build_open_command(tool: str, target_path: Path) -> List[str]:
     if tool == "zed":
-        if shutil.which("zed") is None:
+        if _which("zed") is None:
             raise HTTPException(
                 status_code=400, detail="zed is not installed or not in PATH"
             )
         return ["zed", str(target_path)]
 
     if tool == "vscode":
-        if shutil.which("code") is None:
+        if _which("code") is None:
             raise HTTPException(
                 status_code=400,
                 detail="vscode CLI 'code' is not installed or not in PATH",
@@ -261,8 +465,8 @@ def _build_open_command(tool: str, target_path: Path) -> List[str]:
     if tool == "filemanager":
         if sys.platform == "darwin":
             return ["open", str(target_path)]
-        if sys.platform.startswith("linux"):
-            if shutil.which("xdg-open") is None:
+        if _IS_LINUX:
+            if _which("xdg-open") is None:
                 raise HTTPException(status_code=400, detail="xdg-open is not installed")
             return ["xdg-open", str(target_path)]
         raise HTTPException(
@@ -276,12 +480,12 @@ def _build_open_command(tool: str, target_path: Path) -> List[str]:
 
 def _build_open_remote_command(tool: str, host: str, user: str, remote_path: str) -> List[str]:
     if tool == "zed":
-        if shutil.which("zed") is None:
+        if _which("zed") is None:
             raise HTTPException(status_code=400, detail="zed is not installed or not in PATH")
         return ["zed", f"ssh://{user}@{host}{remote_path}"]
 
     if tool == "vscode":
-        if shutil.which("code") is None:
+        if _which("code") is None:
             raise HTTPException(status_code=400, detail="vscode CLI 'code' is not installed or not in PATH")
         uri = f"vscode-remote://ssh-remote+{host}{remote_path}"
         return ["code", "--folder-uri", uri]
@@ -316,8 +520,8 @@ def _pick_directory_os_dialog(initial_path: Optional[str] = None) -> str:
             raise HTTPException(status_code=400, detail="No folder selected")
         return str(Path(selected).expanduser().resolve())
 
-    if sys.platform.startswith("linux"):
-        if shutil.which("zenity") is None:
+    if _IS_LINUX:
+        if _which("zenity") is None:
             raise HTTPException(
                 status_code=501, detail="Linux folder picker unavailable (install zenity)"
             )
@@ -343,20 +547,25 @@ def _pick_directory_os_dialog(initial_path: Optional[str] = None) -> str:
 
 
 @app.get("/")
-def index() -> FileResponse:
+def index(request: Request) -> FileResponse:
     if not FRONTEND_DIR.exists():
         raise HTTPException(status_code=404, detail="Frontend assets not bundled")
-    return FileResponse(str(FRONTEND_DIR / "index.html"))
+    compressed = _frontend_file(_INDEX_HTML, "text/html", request.headers.get("accept-encoding", ""))
+    return compressed or FileResponse(_INDEX_HTML)
+
+
+# Health is polled by the desktop shell; the body never changes, so it is
+# encoded once and the handler runs on the event loop, not the threadpool
+_HEALTH_BODY = b'{"status":"ok"}'
 
 
 @app.get("/api/health")
-def health() -> Dict[str, str]:
-    return {"status": "ok"}
+async def health() -> Response:
+    return Response(_HEALTH_BODY, media_type="application/json", headers={"cache-control": "no-cache"})
 
 
 @app.get("/api/meta")
 def meta() -> Dict[str, Any]:
-    analyzer = ProjectAnalyzer(config_path=str(ROOT_DIR))
     return {
         "types": [
             "auto",
@@ -368,10 +577,50 @@ def meta() -> Dict[str, Any]:
         ],
         "platforms": ["", "rke2", "openshift", "aks", "proxmox"],
         "gitops_tools": ["", "flux", "argo", "none"],
-        "chains": sorted(list(analyzer.priority_chains.keys())),
+        "chains": sorted(get_analyzer(_ROOT_STR).priority_chains),
     }
 
 
+@functools.lru_cache(maxsize=512)
+def _suggest_children(parent: str, mtime_ns: int, prefix_lower: str, limit: int) -> Tuple[str, ...]:
+    """Accessible subdirectories of `parent` whose names start with `prefix_lower`.
+
+    `mtime_ns` only keys the cache: adding, removing or renaming an entry
+    bumps the directory's mtime, so stale listings are never hit again.
+    """
+    at_root = Path(parent) == _FS_ROOT
+    # Name filters first, straight off the directory entries; only the
+    # sorted candidates are resolved, and only until `limit` are accepted
+    candidates: List[Tuple[str, str, bool]] = []
+    with os.scandir(parent) as entries:
+        for entry in entries:
+            name_lower = entry.name.lower()
+            if prefix_lower and not name_lower.startswith(prefix_lower):
+                continue
+            if at_root and entry.name in SYSTEM_DIRECTORIES:
+                continue
+            try:
+                if not entry.is_dir():
+                    continue
+            except OSError:
+                continue
+            candidates.append((name_lower, entry.name, entry.is_symlink()))
+
+    candidates.sort(key=lambda item: item[0])
+    # A plain subdirectory resolves to the resolved parent plus its name;
+    # only symlinked entries need their own realpath walk
+    parent_real = os.path.realpath(parent)
+    matches: List[str] = []
+    for _, name, is_link in candidates:
+        resolved = os.path.realpath(os.path.join(parent, name)) if is_link else os.path.join(parent_real, name)
+        if not _is_under_home(resolved):
+            continue
+        matches.append(resolved)
+        if len(matches) >= limit:
+            break
+    return tuple(matches)
+
+
 @app.get("/api/fs/suggest")
 def fs_suggest(query: str = "", limit: int = 12) -> Dict[str, Any]:
     q = (query or "").strip()
@@ -393,29 +642,19 @@ def fs_suggest(query: str = "", limit: int = 12) -> Dict[str, Any]:
         parent = raw.parent
         prefix = raw.name
 
-    if not parent.exists() or not parent.is_dir():
+    try:
+        parent_stat = parent.stat()
+    except OSError:
+        parent_stat = None
+    if parent_stat is None or not stat.S_ISDIR(parent_stat.st_mode):
         return {"suggestions": [], "resolved_query": str(raw), "parent": str(parent)}
 
-    matches: List[str] = []
     try:
-        for child in sorted(parent.iterdir(), key=lambda p: p.name.lower()):
-            if not child.is_dir():
-                continue
-            if prefix and not child.name.lower().startswith(prefix.lower()):
-                continue
-            resolved = str(child.resolve())
-            if parent == Path("/"):
-                if child.name in SYSTEM_DIRECTORIES:
-                    continue
-            if not _is_user_accessible(child):
-                continue
-            matches.append(resolved)
-            if len(matches) >= limit:
-                break
+        matches = _suggest_children(str(parent), parent_stat.st_mtime_ns, prefix.lower(), limit)
     except PermissionError:
         return {"suggestions": [], "resolved_query": str(raw), "parent": str(parent)}
 
-    return {"suggestions": matches, "resolved_query": str(raw), "parent": str(parent)}
+    return {"suggestions": list(matches), "resolved_query": str(raw), "parent": str(parent)}
 
 
 @app.get("/api/fs/stat")
@@ -469,7 +708,7 @@ def analyze(
     forced_chain: str = Form(""),
 ) -> Dict[str, Any]:
     effective_desc = _apply_forced_type(description, forced_type)
-    result = analyze_project(name, effective_desc, config_path=str(ROOT_DIR))
+    result = analyze_project(name, effective_desc, config_path=_ROOT_STR)
     result = _override_chain(result, forced_chain)
     return result
 
@@ -544,13 +783,11 @@ async def create_project(
             raise HTTPException(status_code=400, detail="sizing_file must be a .json or .md file")
 
         suffix = ".json" if lower_name.endswith(".json") else ".md"
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-            raw = await sizing_file.read()
-            tmp.write(raw)
-            tmp_path = Path(tmp.name)
+        await sizing_file.seek(0)
+        tmp_path = await _in_executor(_spool_upload, sizing_file.file, suffix)
 
         try:
-            sizing_context = parse_sizing_file(str(tmp_path))
+            sizing_context = await _in_executor(parse_sizing_file, str(tmp_path))
             detected_platform = (sizing_context.get("platform_detected") if sizing_context else None)
         finally:
             tmp_path.unlink(missing_ok=True)
@@ -593,7 +830,8 @@ async def create_project(
     else:
         local_build_dir = Path(normalized_target_dir)
 
-    result = initialize_project(
+    result = await _in_executor(
+        initialize_project,
         project_name=name,
         description=effective_desc,
         target_directory=str(local_build_dir),
@@ -610,17 +848,25 @@ async def create_project(
     project_path = Path(result["project_path"]).resolve()
 
     if git_init:
-        git_log.append(_run_git_command(["git", "init"], project_path))
-        git_log.append(_run_git_command(["git", "add", "."], project_path))
-        git_log.append(_run_git_command(["git", "commit", "-m", git_commit_message], project_path))
+        git_log.extend(await _run_git_sequence(
+            [["git", "init"], ["git", "add", "."], ["git", "commit", "-m", git_commit_message]],
+            project_path,
+        ))
 
         if git_remote_url.strip():
-            git_log.append(_run_git_command(["git", "remote", "remove", "origin"], project_path))
-            git_log.append(_run_git_command(["git", "remote", "add", "origin", git_remote_url.strip()], project_path))
+            git_log.extend(await _run_git_sequence(
+                [
+                    ["git", "remote", "remove", "origin"],
+                    ["git", "remote", "add", "origin", git_remote_url.strip()],
+                ],
+                project_path,
+            ))
 
         if git_push and git_remote_url.strip():
-            git_log.append(_run_git_command(["git", "branch", "-M", git_branch], project_path))
-            git_log.append(_run_git_command(["git", "push", "-u", "origin", git_branch], project_path))
+            git_log.extend(await _run_git_sequence(
+                [["git", "branch", "-M", git_branch], ["git", "push", "-u", "origin", git_branch]],
+                project_path,
+            ))
 
     remote_log: List[Dict[str, Any]] = []
     remote_result: Dict[str, Any] = {"enabled": effective_target_type == "remote", "ok": True, "log": []}
@@ -719,8 +965,8 @@ def sync_repo(
 def version() -> Dict[str, Any]:
     return {
         "ui": "draft-0.1.0",
-        "project_initializer_root": str(ROOT_DIR),
-        "scripts_dir": str(SCRIPTS_DIR),
+        "project_initializer_root": _ROOT_STR,
+        "scripts_dir": _SCRIPTS_STR,
         "python": sys.version,
     }
 
@@ -761,7 +1007,9 @@ def open_path(
 
     cmd = _build_open_command(tool, target)
     try:
-        subprocess.Popen(cmd)
+        # An absolute executable with close_fds=False lets subprocess use
+        # posix_spawn instead of fork+exec; our own fds are non-inheritable
+        subprocess.Popen(cmd, executable=_which(cmd[0]) or cmd[0], close_fds=False)
     except Exception as exc:  # pragma: no cover
         raise HTTPException(
             status_code=500, detail=f"Failed to open path: {exc}"
@@ -16,7 +16,17 @@ from backend_api import app
 def main() -> None:
     host = os.environ.get("PI_UI_HOST", "127.0.0.1")
     port = int(os.environ.get("PI_UI_PORT", "8787"))
-    uvicorn.run(app, host=host, port=port, log_level="info")
+    # loop/http "auto" pick uvloop and httptools when they are installed
+    # (optional, see requirements.txt) and fall back to asyncio/h11 otherwise
+    uvicorn.run(
+        app,
+        host=host,
+        port=port,
+        loop="auto",
+        http="auto",
+        log_level="info",
+        access_log=os.environ.get("PI_UI_ACCESS_LOG") == "1",
+    )
 
 
 if __name__ == "__main__":
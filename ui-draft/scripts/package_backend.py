@@ -2,10 +2,17 @@
 """Build backend executable for Tauri external bin.
 
 Requires pyinstaller in active environment.
+
+By default this builds the single-file sidecar that Tauri's externalBin
+expects. ``--onedir`` builds an unpacked directory instead (dist/pi-backend/),
+which starts faster because nothing is extracted at launch; it is meant for
+running the backend standalone and is not copied into the Tauri binaries.
 """
 
 from __future__ import annotations
 
+import argparse
+import gzip
 import os
 import platform
 import shutil
@@ -18,6 +25,9 @@ ROOT = Path(__file__).resolve().parents[1]
 PI_ROOT = ROOT.parent
 BACKEND = ROOT / "backend" / "run_backend.py"
 TAURI_BIN_DIR = ROOT / "desktop" / "src-tauri" / "binaries"
+FRONTEND_STAGE_DIR = ROOT / "build" / "frontend"
+# Text assets that get a .gz sibling for the backend to serve pre-compressed
+COMPRESSIBLE_SUFFIXES = {".html", ".js", ".css", ".svg", ".json", ".txt"}
 
 
 def _target_suffix() -> str:
@@ -33,7 +43,29 @@ def _target_suffix() -> str:
     raise RuntimeError(f"Unsupported platform for packaging: {sys.platform}")
 
 
+def _stage_frontend(source: Path) -> Path:
+    """Copy the frontend for bundling, adding a gzip variant of each text asset."""
+    shutil.rmtree(FRONTEND_STAGE_DIR, ignore_errors=True)
+    shutil.copytree(source, FRONTEND_STAGE_DIR)
+    for path in FRONTEND_STAGE_DIR.rglob("*"):
+        if path.suffix not in COMPRESSIBLE_SUFFIXES or not path.is_file():
+            continue
+        data = path.read_bytes()
+        packed = gzip.compress(data, compresslevel=9, mtime=0)
+        if len(packed) < len(data):
+            path.with_name(path.name + ".gz").write_bytes(packed)
+    return FRONTEND_STAGE_DIR
+
+
 def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--onedir",
+        action="store_true",
+        help="build an unpacked directory (no per-launch extraction) instead of the Tauri sidecar",
+    )
+    args = parser.parse_args()
+
     TAURI_BIN_DIR.mkdir(parents=True, exist_ok=True)
 
     data_sep = os.pathsep
@@ -43,8 +75,9 @@ def main() -> None:
         (PI_ROOT / "templates", "templates"),
         (PI_ROOT / "priority_chains.json", "."),
         (PI_ROOT / "priority_chains.yaml", "."),
-        (ROOT / "frontend", "ui-draft/frontend"),
     ]
+    frontend = ROOT / "frontend"
+    add_data_sources.append((_stage_frontend(frontend) if frontend.exists() else frontend, "ui-draft/frontend"))
     add_data = []
     for source, target in add_data_sources:
         if source.exists():
@@ -59,11 +92,29 @@ def main() -> None:
         "sizing_parser",
         "addon_loader",
         "interactive",
+        # Optional; chosen at runtime by uvicorn's loop/http "auto" setting
+        # and only bundled when installed in the build environment
+        "uvicorn.loops.uvloop",
+        "uvicorn.protocols.http.httptools_impl",
+        "uvloop",
+        "httptools",
+    ]
+
+    # Stdlib packages nothing in the backend reaches at runtime; the server
+    # still answers every endpoint with these made unimportable
+    excluded_modules = [
+        "tkinter",
+        "unittest",
+        "pydoc_data",
+        "test",
+        "xml.dom",
+        "lib2to3",
+        "idlelib",
     ]
 
     cmd = [
         "pyinstaller",
-        "--onefile",
+        *(["--onedir", "--noarchive"] if args.onedir else ["--onefile"]),
         "--name",
         "pi-backend",
         "--paths",
@@ -76,10 +127,20 @@ def main() -> None:
     for mod in hidden_imports:
         cmd.extend(["--hidden-import", mod])
 
+    for mod in excluded_modules:
+        cmd.extend(["--exclude-module", mod])
+
     cmd.append(str(BACKEND))
 
     subprocess.run(cmd, cwd=str(ROOT), check=True)
 
+    if args.onedir:
+        built_dir = ROOT / "dist" / "pi-backend"
+        if not (built_dir / "pi-backend").exists():
+            raise RuntimeError("Expected backend binary not found in dist/pi-backend/")
+        print(f"Backend directory prepared: {built_dir}")
+        return
+
     built = ROOT / "dist" / "pi-backend"
     if not built.exists():
         raise RuntimeError("Expected backend binary not found in dist/pi-backend")